@@ -0,0 +1,81 @@
+"""
+AST memory benchmark: plain __dict__ classes vs. __slots__ nodes vs. AstArena.
+
+The __dict__ variant rebuilds the node classes as they were before __slots__
+(same __init__, no slots) and feeds them to the Parser through its `nodes` hook.
+
+Usage:
+    python benchmarks/bench_ast_memory.py [statements]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import compiler.Parser.ast as ast_nodes
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.arena import ArenaBuilder
+from compiler.Parser.parser import Parser
+
+
+NODE_CLASSES = [
+    "Program", "FunctionDecl", "VarDecl", "Assign", "IfStmt", "WhileStmt",
+    "ExprStmt", "CallExpr", "BinaryExpr", "Literal", "Identifier",
+]
+
+
+def dict_node_classes():
+    classes = {}
+    for name in NODE_CLASSES:
+        cls = getattr(ast_nodes, name)
+        classes[name] = type(name, (), {"__init__": cls.__init__, "__repr__": cls.__repr__})
+    return SimpleNamespace(**classes)
+
+
+def make_source(statements):
+    lines = ["vibe main() {"]
+    for i in range(statements // 4):
+        lines.append(f"   lit v{i} = {i} * 60 + 24")
+        lines.append(f"   v{i} = v{i} + 1")
+        lines.append(f"   if v{i} > 10: say(\"big\", v{i})")
+        lines.append(f"   yap v{i} < 3 {{ v{i} = v{i} + 1 }}")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def measure(tokens, nodes_factory):
+    tracemalloc.start()
+    start = time.perf_counter()
+    tree = Parser(tokens, nodes=nodes_factory()).parse()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, tree
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    statements = int(argv[0]) if argv else 100_000
+    tokens = Tokenizer(make_source(statements)).tokenize()
+
+    dict_classes = dict_node_classes()
+    results = [
+        ("__dict__ classes", measure(tokens, lambda: dict_classes)),
+        ("__slots__ classes", measure(tokens, lambda: None)),
+        ("AstArena", measure(tokens, ArenaBuilder)),
+    ]
+
+    print(f"{statements} statements, {len(tokens)} tokens")
+    baseline = results[0][1][0]
+    for label, (size, elapsed, _) in results:
+        print(f"{label:18}: {size / 1e6:8.2f} MB  ({size / baseline:5.2f}x)  parse {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
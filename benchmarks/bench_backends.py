@@ -0,0 +1,74 @@
+"""
+Execution backend benchmark on a loop-heavy program (examples/counter.zl scaled up).
+
+Usage:
+    python benchmarks/bench_backends.py [iterations]
+"""
+
+import os
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.codegen.closures import ClosureInterpreter
+from compiler.codegen.generator import VirtualMachine
+from compiler.codegen.transpiler import PythonInterpreter
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.slot_interpreter import SlotInterpreter
+
+
+BACKENDS = [
+    ("tree", Interpreter),
+    ("slots", SlotInterpreter),
+    ("closure", ClosureInterpreter),
+    ("vm", VirtualMachine),
+    ("python", PythonInterpreter),
+]
+
+PROGRAM = """
+vibe main() {
+   lit counter = 0
+   lit total = 0
+   yap counter < LIMIT {
+      total = total + counter * 2 - 1
+      if total > 1000000:
+         total = total - 1000000
+      say("counter")
+      counter = counter + 1
+   }
+   if counter == LIMIT:
+      say("All done!", total)
+}
+"""
+
+
+def run(interpreter_cls, program):
+    lines = []
+    start = time.perf_counter()
+    interpreter_cls(output_fn=lambda *args: lines.append(args)).interpret(program)
+    return time.perf_counter() - start, lines[-1]
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    iterations = int(argv[0]) if argv else 200_000
+    source = PROGRAM.replace("LIMIT", str(iterations))
+
+    print(f"{iterations} loop iterations")
+    baseline = None
+    for label, interpreter_cls in BACKENDS:
+        program = optimize(Parser(Tokenizer(source).tokenize()).parse())
+        elapsed, last = run(interpreter_cls, program)
+        baseline = baseline or elapsed
+        print(f"{label:10}: {elapsed:8.3f}s  {iterations / elapsed:12,.0f} iterations/s  "
+              f"{baseline / elapsed:5.2f}x  last output {last}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Function call micro-benchmark: a loop whose body is a call to a tiny user
+function, so the cost of resolving and entering call targets dominates.
+
+Usage:
+    python benchmarks/bench_calls.py [calls]
+"""
+
+import os
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.slot_interpreter import SlotInterpreter
+
+
+BACKENDS = [
+    ("tree", Interpreter),
+    ("slots", SlotInterpreter),
+]
+
+PROGRAM = """
+lit hits = 0
+vibe bump() {
+   hits = hits + 1
+}
+vibe main() {
+   lit i = 0
+   yap i < CALLS {
+      bump()
+      i = i + 1
+   }
+   say(hits)
+}
+"""
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    calls = int(argv[0]) if argv else 100_000
+    source = PROGRAM.replace("CALLS", str(calls))
+
+    print(f"{calls} calls")
+    for label, interpreter_cls in BACKENDS:
+        program = optimize(Parser(Tokenizer(source).tokenize()).parse())
+        lines = []
+        start = time.perf_counter()
+        interpreter_cls(output_fn=lambda *args: lines.append(args)).interpret(program)
+        elapsed = time.perf_counter() - start
+        print(f"{label:10}: {elapsed:8.3f}s  {calls / elapsed:12,.0f} calls/s  last output {lines[-1]}")
+
+
+if __name__ == "__main__":
+    main()
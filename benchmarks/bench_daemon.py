@@ -0,0 +1,87 @@
+"""
+Per-script latency: `python main.py script.zl` against the same script sent to
+a warm daemon by `python zlclient.py`, and against the daemon's own turnaround
+for a request made from an already running process. The script is small, so
+what is measured is startup and compilation, not execution.
+
+Usage:
+    python benchmarks/bench_daemon.py [runs]
+"""
+
+import io
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import daemon
+import zlclient
+
+
+PROGRAM = """
+vibe main() {
+   lit i = 0
+   lit total = 0
+   yap i < 100 {
+      total = total + i
+      i = i + 1
+   }
+   say("total", total)
+}
+"""
+
+
+def median_ms(fn, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    runs = int(argv[0]) if argv else 20
+    directory = tempfile.mkdtemp(prefix="zlbench")
+    script = os.path.join(directory, "script.zl")
+    socket_path = os.path.join(directory, "zl.sock")
+    with open(script, "w", encoding="utf-8") as f:
+        f.write(PROGRAM)
+
+    ready = threading.Event()
+    threading.Thread(target=daemon.serve, args=(socket_path, 16, ready), daemon=True).start()
+    ready.wait()
+    try:
+        def command(*args):
+            subprocess.run([sys.executable, *args], check=True, stdout=subprocess.DEVNULL)
+
+        results = {
+            "python -c pass": median_ms(lambda: command("-c", "pass"), runs),
+            "main.py --no-cache": median_ms(lambda: command(os.path.join(root_path, "main.py"), script, "--no-cache"),
+                                            runs),
+            "main.py (cached)": median_ms(lambda: command(os.path.join(root_path, "main.py"), script), runs),
+            "zlclient.py": median_ms(lambda: command(os.path.join(root_path, "zlclient.py"), socket_path, script),
+                                     runs),
+            "in-process request": median_ms(
+                lambda: zlclient.run_remote(socket_path, PROGRAM, stdout=io.StringIO()), runs),
+        }
+    finally:
+        zlclient.request(socket_path, "stop")
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"median of {runs} runs")
+    for name, ms in results.items():
+        print(f"{name:<20} {ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Lexer throughput benchmark: character loop vs. regex Scanner.
+
+Usage:
+    python benchmarks/bench_lexer.py [size_in_kb]
+"""
+
+import os
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+
+
+CHUNK = """vibe helper_{n}() {{
+   // generated helper number {n}
+   lit counter_{n} = {n}
+   yap counter_{n} < {n} * 60 * 60 {{
+      say("value of counter is", counter_{n})
+      counter_{n} = counter_{n} + 1
+   }}
+   if counter_{n} >= 100:
+      say("big")
+}}
+"""
+
+
+def make_source(size_kb):
+    parts = []
+    total = 0
+    n = 0
+    while total < size_kb * 1024:
+        chunk = CHUNK.format(n=n)
+        parts.append(chunk)
+        total += len(chunk)
+        n += 1
+    return "".join(parts)
+
+
+def best_of(fn, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    size_kb = int(argv[0]) if argv else 2048
+    source = make_source(size_kb)
+
+    before, tokens = best_of(lambda: Tokenizer(source).tokenize_by_char())
+    after, _ = best_of(lambda: Tokenizer(source).tokenize())
+    count = len(tokens)
+
+    print(f"source: {len(source) / 1024:.0f} KB, {count} tokens")
+    print(f"character loop : {before:8.3f}s  {count / before:12,.0f} tokens/s")
+    print(f"regex scanner  : {after:8.3f}s  {count / after:12,.0f} tokens/s")
+    print(f"speedup        : {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Loop optimization benchmark: a nested counter loop with loop-invariant
+arithmetic, run by the tree-walk Interpreter with and without the loop pass.
+
+Usage:
+    python benchmarks/bench_loops.py [outer iterations]
+"""
+
+import os
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+
+
+PROGRAM = """
+vibe main() {
+   lit width = 40
+   lit scale = 3
+   lit row = 0
+   lit total = 0
+   yap row < LIMIT {
+      lit col = 0
+      yap col < width * 2 {
+         total = total + row * scale * width + col
+         col = col + 1
+      }
+      if total > 1000000:
+         total = total - 1000000
+      row = row + 1
+   }
+   say(total)
+}
+"""
+
+
+def run(program):
+    lines = []
+    start = time.perf_counter()
+    Interpreter(output_fn=lambda *args: lines.append(args)).interpret(program)
+    return time.perf_counter() - start, lines[-1]
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    iterations = int(argv[0]) if argv else 2_000
+    source = PROGRAM.replace("LIMIT", str(iterations))
+
+    print(f"{iterations} x 80 inner loop iterations")
+    baseline = None
+    for label, loops in (("plain", False), ("loops", True)):
+        program = optimize(Parser(Tokenizer(source).tokenize()).parse(), loops=loops)
+        elapsed, last = run(program)
+        baseline = baseline or elapsed
+        print(f"{label:6}: {elapsed:8.3f}s  {baseline / elapsed:5.2f}x  last output {last}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Output benchmark: say-style lines written with print() vs. through
+BufferedOutput, first as bare calls and then from a ZLang loop that says one
+line per iteration. Output goes to os.devnull opened line-buffered, as stdout
+is on a terminal.
+
+Usage:
+    python benchmarks/bench_output.py [lines]
+"""
+
+import os
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.output import BufferedOutput
+
+
+PROGRAM = """
+vibe main() {
+   lit i = 0
+   yap i < LINES {
+      say("line", i, "of", LINES)
+      i = i + 1
+   }
+}
+"""
+
+BUFFER_SIZES = [1024, 64 * 1024, 1024 * 1024]
+
+
+def run_calls(lines, output_fn):
+    start = time.perf_counter()
+    for i in range(lines):
+        output_fn("line", i, "of", lines)
+    if output_fn is not print:
+        output_fn.flush()
+    return time.perf_counter() - start
+
+
+def run(program, output_fn):
+    start = time.perf_counter()
+    Interpreter(output_fn=output_fn).interpret(program)
+    if output_fn is not print:
+        output_fn.flush()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    lines = int(argv[0]) if argv else 200_000
+    program = optimize(Parser(Tokenizer(PROGRAM.replace("LINES", str(lines))).tokenize()).parse())
+
+    stdout = sys.stdout
+    sections = []
+    with open(os.devnull, "w", buffering=1) as devnull:
+        sys.stdout = devnull
+        try:
+            for title, runner, workload in (("calls", run_calls, lines), ("interpreter", run, program)):
+                results = [("print", runner(workload, print))]
+                for size in BUFFER_SIZES:
+                    results.append((f"buffer {size // 1024} KB", runner(workload, BufferedOutput(devnull, size))))
+                sections.append((title, results))
+        finally:
+            sys.stdout = stdout
+
+    print(f"{lines} lines")
+    for title, results in sections:
+        print(title)
+        baseline = results[0][1]
+        for label, elapsed in results:
+            print(f"  {label:16}: {elapsed:8.3f}s  {lines / elapsed:12,.0f} lines/s  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Deep recursion and deep expression benchmark: explicit-stack vs recursive interpreter.
+
+Usage:
+    python benchmarks/bench_recursion.py [depth]
+"""
+
+import os
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.stack_interpreter import StackInterpreter
+
+
+BACKENDS = [
+    ("tree", Interpreter),
+    ("stack", StackInterpreter),
+]
+
+# non-tail recursion: work remains after the recursive call
+RECURSION = """
+lit n = DEPTH
+lit unwound = 0
+vibe down() {
+   if n > 0 {
+      n = n - 1
+      down()
+      unwound = unwound + 1
+   }
+}
+down()
+say(unwound)
+"""
+
+# tail recursion: the recursive call is the last thing the function does
+TAIL_RECURSION = """
+lit n = DEPTH
+vibe countdown() {
+   n = n - 1
+   if n > 0: countdown()
+}
+countdown()
+say(n)
+"""
+
+
+def deep_expression(depth):
+    # a left-deep chain `x + x + ... + x`; x is reassigned so it is not constant-folded
+    return "lit x = 0\nx = 1\nlit total = x" + " + x" * depth + "\nsay(total)\n"
+
+
+def run(interpreter_cls, source):
+    program = optimize(Parser(Tokenizer(source).tokenize()).parse())
+    lines = []
+    start = time.perf_counter()
+    try:
+        interpreter_cls(output_fn=lambda *args: lines.append(args)).interpret(program)
+    except RecursionError:
+        return time.perf_counter() - start, "RecursionError"
+    return time.perf_counter() - start, lines[-1]
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    depth = int(argv[0]) if argv else 50_000
+
+    workloads = [
+        ("recursion", RECURSION.replace("DEPTH", str(depth))),
+        ("tail recursion", TAIL_RECURSION.replace("DEPTH", str(depth))),
+        ("deep expression", deep_expression(depth)),
+        ("shallow recursion", RECURSION.replace("DEPTH", "150")),
+        ("shallow expression", deep_expression(300)),
+    ]
+    print(f"depth {depth}")
+    for workload, source in workloads:
+        for label, interpreter_cls in BACKENDS:
+            elapsed, last = run(interpreter_cls, source)
+            print(f"{workload:18} {label:6}: {elapsed:8.3f}s  result {last}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Concurrent session load test for AsyncInterpreter.
+
+Simulated clients each run an interactive ZLang session on one event loop:
+the program asks for input ROUNDS times and answers each with a short
+computation. Clients reply after a random think time. Reported are overall
+throughput and the latency from a client's reply to the session's answer.
+
+Usage:
+    python benchmarks/bench_sessions.py [sessions] [rounds]
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.async_interpreter import AsyncInterpreter
+from compiler.semantics.optimizer import optimize
+
+
+PROGRAM = """
+vibe main() {
+   lit round = 0
+   yap round < ROUNDS {
+      lit word = spill("next?")
+      lit i = 0
+      lit total = 0
+      yap i < 200 {
+         total = total + i * 3
+         i = i + 1
+      }
+      say(word, total)
+      round = round + 1
+   }
+}
+"""
+
+# seconds a simulated client waits before replying
+THINK_TIME = (0.0, 0.005)
+
+
+class Client:
+    def __init__(self, rng):
+        self.rng = rng
+        self.replies = asyncio.Queue()
+        self.sent_at = None
+        self.latencies = []
+        self.lines = 0
+
+    async def read(self, prompt):
+        await asyncio.sleep(self.rng.uniform(*THINK_TIME))
+        self.sent_at = time.perf_counter()
+        return "ping"
+
+    async def write(self, *args):
+        self.lines += 1
+        if self.sent_at is not None:
+            self.latencies.append(time.perf_counter() - self.sent_at)
+            self.sent_at = None
+
+
+async def run_sessions(program, sessions, seed=0):
+    rng = random.Random(seed)
+    clients = [Client(rng) for _ in range(sessions)]
+    await asyncio.gather(*(
+        AsyncInterpreter(client.read, client.write).run(program) for client in clients
+    ))
+    return clients
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    sessions = int(argv[0]) if argv else 1000
+    rounds = int(argv[1]) if len(argv) > 1 else 5
+    program = optimize(Parser(Tokenizer(PROGRAM.replace("ROUNDS", str(rounds))).tokenize()).parse())
+
+    start = time.perf_counter()
+    clients = asyncio.run(run_sessions(program, sessions))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for client in clients for latency in client.latencies)
+    lines = sum(client.lines for client in clients)
+    print(f"{sessions} sessions x {rounds} rounds in {elapsed:.3f}s")
+    print(f"throughput : {sessions / elapsed:10,.0f} sessions/s  {lines / elapsed:10,.0f} replies/s")
+    print(f"latency    : median {statistics.median(latencies) * 1000:7.2f} ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:7.2f} ms  "
+          f"max {latencies[-1] * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Squad benchmark: the sum of 3 * i + 1 over a million elements, computed with
+element-wise squad operators and sum(), with a scalar `yap` loop, and with a
+scalar loop reading the elements out of a squad, on the tree-walking and
+slot interpreters.
+
+Usage:
+    python benchmarks/bench_squad.py [elements]
+"""
+
+import os
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.slot_interpreter import SlotInterpreter
+
+
+PROGRAMS = {
+    "vectorized": """
+vibe main() {
+   lit xs = range(COUNT)
+   say(sum(xs * 3 + 1))
+}
+""",
+    "scalar loop": """
+vibe main() {
+   lit i = 0
+   lit total = 0
+   yap i < COUNT {
+      total = total + i * 3 + 1
+      i = i + 1
+   }
+   say(total)
+}
+""",
+    "loop over squad": """
+vibe main() {
+   lit xs = range(COUNT)
+   lit n = len(xs)
+   lit i = 0
+   lit total = 0
+   yap i < n {
+      total = total + at(xs, i) * 3 + 1
+      i = i + 1
+   }
+   say(total)
+}
+""",
+}
+
+
+def run(interpreter_cls, program):
+    lines = []
+    start = time.perf_counter()
+    interpreter_cls(output_fn=lambda *args: lines.append(args)).interpret(program)
+    return time.perf_counter() - start, lines[-1][0]
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    count = int(argv[0]) if argv else 1_000_000
+    print(f"{count:,} elements")
+    for interpreter_cls in (Interpreter, SlotInterpreter):
+        baseline = None
+        for name, source in PROGRAMS.items():
+            program = optimize(Parser(Tokenizer(source.replace("COUNT", str(count))).tokenize()).parse())
+            elapsed, total = run(interpreter_cls, program)
+            baseline = baseline or elapsed
+            print(f"{interpreter_cls.__name__:<16} {name:<16} {elapsed:9.4f}s  {elapsed / baseline:7.1f}x  {total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+String building benchmark: a report built with `s = s + piece` in a `yap`
+loop, on the tree-walking and slot interpreters, with long strings built as
+ropes (the default) and as plain strings copied on every append.
+
+Usage:
+    python benchmarks/bench_strings.py [appends]
+"""
+
+import os
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics import rope
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.slot_interpreter import SlotInterpreter
+
+
+PROGRAM = """
+vibe main() {
+   lit report = ""
+   lit i = 0
+   yap i < APPENDS {
+      report = report + "row\\n"
+      i = i + 1
+   }
+   say(len(report))
+}
+"""
+
+
+def run(interpreter_cls, program):
+    lines = []
+    start = time.perf_counter()
+    interpreter_cls(output_fn=lambda *args: lines.append(args)).interpret(program)
+    return time.perf_counter() - start, lines[-1][0]
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    appends = int(argv[0]) if argv else 100_000
+    program = optimize(Parser(Tokenizer(PROGRAM.replace("APPENDS", str(appends))).tokenize()).parse())
+    print(f"{appends:,} appends")
+    min_rope_length = rope.MIN_ROPE_LENGTH
+    for interpreter_cls in (Interpreter, SlotInterpreter):
+        try:
+            rope.MIN_ROPE_LENGTH = sys.maxsize
+            copied, length = run(interpreter_cls, program)
+        finally:
+            rope.MIN_ROPE_LENGTH = min_rope_length
+        roped, _ = run(interpreter_cls, program)
+        print(f"{interpreter_cls.__name__:<16} plain strings {copied:9.4f}s  ropes {roped:9.4f}s  "
+              f"{copied / roped:6.1f}x  ({length:,} characters)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Benchmark suite over synthetic workloads (see benchmarks/workloads.py).
+
+Every workload is generated at the requested scale and timed stage by stage:
+tokenize, parse, optimize and interpret (best of --repeat runs each). Results
+are printed and can be written as JSON; given a baseline JSON from an earlier
+run, any stage that got slower by more than --threshold is reported as a
+regression and the exit status is 1.
+
+Usage:
+    python benchmarks/bench_suite.py [--scale 1.0] [--repeat 3] [--backend tree]
+                                     [--only NAME ...] [--output results.json]
+                                     [--compare baseline.json] [--threshold 0.10]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+from benchmarks.workloads import WORKLOADS, generate
+from compiler.codegen.closures import ClosureInterpreter
+from compiler.codegen.generator import VirtualMachine
+from compiler.codegen.transpiler import PythonInterpreter
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.slot_interpreter import SlotInterpreter
+from compiler.semantics.stack_interpreter import StackInterpreter
+
+
+BACKENDS = {
+    "tree": Interpreter,
+    "slots": SlotInterpreter,
+    "stack": StackInterpreter,
+    "closure": ClosureInterpreter,
+    "vm": VirtualMachine,
+    "python": PythonInterpreter,
+}
+
+STAGES = ("tokenize", "parse", "optimize", "interpret")
+
+# stages faster than this are too noisy to compare
+MIN_COMPARABLE_SECONDS = 0.005
+
+
+def best_of(fn, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_workload(name, scale, repeat, interpreter_cls):
+    source = generate(name, scale)
+    timings = {}
+
+    timings["tokenize"], tokens = best_of(lambda: Tokenizer(source).tokenize(), repeat)
+    timings["parse"], _ = best_of(lambda: Parser(tokens).parse(), repeat)
+    # optimize() rewrites its argument, so each run gets a fresh tree
+    trees = [Parser(tokens).parse() for _ in range(repeat)]
+    timings["optimize"], program = best_of(lambda: optimize(trees.pop()), repeat)
+
+    def interpret():
+        output = []
+        interpreter_cls(output_fn=lambda *args: output.append(args)).interpret(program)
+        return output
+
+    timings["interpret"], output = best_of(interpret, repeat)
+    return {
+        "source_bytes": len(source),
+        "tokens": len(tokens),
+        "last_output": repr(output[-1]) if output else None,
+        "seconds": timings,
+    }
+
+
+def run_suite(names, scale=1.0, repeat=3, backend="tree"):
+    interpreter_cls = BACKENDS[backend]
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "backend": backend,
+        "scale": scale,
+        "repeat": repeat,
+        "workloads": {name: run_workload(name, scale, repeat, interpreter_cls) for name in names},
+    }
+
+
+def compare(results, baseline, threshold):
+    """(workload, stage, baseline seconds, seconds, ratio) for every stage slower than 1 + threshold."""
+    regressions = []
+    for name, entry in results["workloads"].items():
+        before = baseline.get("workloads", {}).get(name)
+        if before is None:
+            continue
+        for stage in STAGES:
+            old = before["seconds"].get(stage)
+            new = entry["seconds"].get(stage)
+            if old is None or new is None or max(old, new) < MIN_COMPARABLE_SECONDS:
+                continue
+            ratio = new / old if old else float("inf")
+            if ratio > 1 + threshold:
+                regressions.append((name, stage, old, new, ratio))
+    return regressions
+
+
+def print_results(results, baseline=None, file=sys.stdout):
+    header = f"{'workload':<16} {'KB':>7} {'tokens':>9}" + "".join(f" {stage:>10}" for stage in STAGES)
+    print(f"backend {results['backend']}, scale {results['scale']}, best of {results['repeat']} (seconds)",
+          file=file)
+    print(header, file=file)
+    for name, entry in results["workloads"].items():
+        seconds = entry["seconds"]
+        row = f"{name:<16} {entry['source_bytes'] / 1024:>7.0f} {entry['tokens']:>9}"
+        row += "".join(f" {seconds[stage]:>10.4f}" for stage in STAGES)
+        print(row, file=file)
+        before = (baseline or {}).get("workloads", {}).get(name)
+        if before is not None:
+            ratios = "".join(
+                f" {seconds[stage] / before['seconds'][stage]:>9.2f}x" if before["seconds"].get(stage) else f" {'-':>10}"
+                for stage in STAGES
+            )
+            print(f"{'  vs baseline':<34}{ratios}", file=file)
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="bench_suite.py", description="Time ZLang pipeline stages.")
+    parser.add_argument("--scale", type=float, default=1.0, help="workload size multiplier (default 1.0)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage; the best is kept (default 3)")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="tree",
+                        help="interpreter for the interpret stage (default tree)")
+    parser.add_argument("--only", nargs="+", choices=sorted(WORKLOADS), metavar="NAME",
+                        help=f"run only these workloads ({', '.join(WORKLOADS)})")
+    parser.add_argument("--output", metavar="FILE", help="write the results as JSON to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="slowdown over the baseline reported as a regression (default 0.10 = 10%%)")
+    return parser
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    args = build_arg_parser().parse_args(argv)
+
+    results = run_suite(args.only or list(WORKLOADS), args.scale, args.repeat, args.backend)
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    if baseline is not None:
+        if baseline.get("scale") != results["scale"] or baseline.get("backend") != results["backend"]:
+            print("warning: baseline was run with a different scale or backend", file=sys.stderr)
+        regressions = compare(results, baseline, args.threshold)
+        for name, stage, old, new, ratio in regressions:
+            print(f"REGRESSION {name}/{stage}: {old:.4f}s -> {new:.4f}s ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print(f"no regressions over {args.threshold:.0%}")
+    return 0
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root_path,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    sys.exit(main())
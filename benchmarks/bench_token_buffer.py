@@ -0,0 +1,57 @@
+"""
+Token storage benchmark: list of Token objects vs. TokenBuffer.
+
+Reports retained memory (tracemalloc) and lex + parse time for both forms.
+
+Usage:
+    python benchmarks/bench_token_buffer.py [size_in_kb]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from bench_lexer import make_source
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import BufferParser, Parser
+
+
+def retained(fn):
+    tracemalloc.start()
+    result = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    size_kb = int(argv[0]) if argv else 1024
+    source = make_source(size_kb)
+
+    list_bytes, tokens = retained(lambda: Tokenizer(source).tokenize())
+    buffer_bytes, buffer = retained(lambda: Tokenizer(source).tokenize_buffer())
+    count = len(tokens)
+    del tokens, buffer
+
+    list_time = timed(lambda: Parser(Tokenizer(source).tokenize()).parse())
+    buffer_time = timed(lambda: BufferParser(Tokenizer(source).tokenize_buffer()).parse())
+
+    print(f"source: {len(source) / 1024:.0f} KB, {count} tokens")
+    print(f"list[Token]  : {list_bytes / 1e6:8.2f} MB  {list_bytes / count:6.1f} B/token  lex+parse {list_time:.3f}s")
+    print(f"TokenBuffer  : {buffer_bytes / 1e6:8.2f} MB  {buffer_bytes / count:6.1f} B/token  lex+parse {buffer_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
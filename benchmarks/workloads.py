@@ -0,0 +1,95 @@
+"""
+Synthetic ZLang programs for benchmarks/bench_suite.py.
+
+Each generator takes a size and returns ZLang source whose cost grows
+linearly with it; WORKLOADS maps a workload name to its generator and its
+size at scale 1.0.
+"""
+
+
+def straight_line(statements):
+    """`statements` declarations, each reading the one before it."""
+    # v0 is reassigned so the optimizer cannot fold the whole chain away
+    lines = ["lit v0 = 1", "v0 = 2"]
+    for i in range(1, statements):
+        lines.append(f"lit v{i} = v{i - 1} * 2 - v{i - 1} + {i} / 4")
+    lines.append(f"say(v{statements - 1})")
+    return "\n".join(lines) + "\n"
+
+
+def deep_nesting(depth):
+    """`depth` nested single-iteration `yap` loops inside main()."""
+    lines = ["vibe main() {"]
+    for k in range(depth):
+        lines.append(f"lit i{k} = 0")
+        lines.append(f"yap i{k} < 1 {{")
+    lines.append('say("bottom")')
+    for k in reversed(range(depth)):
+        lines.append(f"i{k} = i{k} + 1")
+        lines.append("}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def tight_loop(iterations):
+    """One counter loop of `iterations` arithmetic-heavy iterations."""
+    return (
+        "vibe main() {\n"
+        " lit i = 0\n"
+        " lit total = 0\n"
+        " lit scale = 7\n"
+        f" yap i < {iterations} {{\n"
+        "  total = total + i * scale - i / 2\n"
+        "  if total > 1000000:\n"
+        "   total = total - 1000000\n"
+        "  i = i + 1\n"
+        " }\n"
+        " say(total)\n"
+        "}\n"
+    )
+
+
+def call_heavy(calls):
+    """`calls` calls through a chain of three small functions."""
+    return (
+        "lit hits = 0\n"
+        "vibe leaf() {\n hits = hits + 1\n}\n"
+        "vibe middle() {\n leaf()\n}\n"
+        "vibe outer() {\n middle()\n}\n"
+        "vibe main() {\n"
+        " lit i = 0\n"
+        f" yap i < {calls} {{\n"
+        "  outer()\n"
+        "  i = i + 1\n"
+        " }\n"
+        " say(hits)\n"
+        "}\n"
+    )
+
+
+def string_literals(size_kb):
+    """Roughly `size_kb` KB of string literals, joined with `+`."""
+    chunk = "lorem ipsum dolor sit amet " * 37  # ~1 KB
+    lines = []
+    for i in range(max(1, size_kb)):
+        lines.append(f'lit s{i} = "{chunk}{i}"')
+    lines.append("lit joined = s0")
+    for i in range(1, max(1, size_kb)):
+        lines.append(f"joined = joined + s{i}")
+    lines.append('say("done")')
+    return "\n".join(lines) + "\n"
+
+
+# name -> (generator, size at scale 1.0)
+WORKLOADS = {
+    "straight_line": (straight_line, 5_000),
+    "deep_nesting": (deep_nesting, 200),
+    "tight_loop": (tight_loop, 50_000),
+    "call_heavy": (call_heavy, 10_000),
+    "string_literals": (string_literals, 1_024),
+}
+
+
+def generate(name, scale=1.0):
+    generator, size = WORKLOADS[name]
+    return generator(max(1, int(size * scale)))
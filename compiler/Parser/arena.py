@@ -0,0 +1,156 @@
+"""
+Flat, array-based AST representation for ZLang.
+
+An AstArena stores every node as one row of parallel arrays instead of as an
+object: `kinds[i]` is the node kind, `a[i]`, `b[i]`, `c[i]` hold child node
+indices, list ids or payload indices depending on the kind (see FIELDS), and
+statement/argument lists live back to back in `list_items`. Names, operators
+and literal lexemes are kept once each in `payloads`.
+
+Pass an ArenaBuilder as the Parser's `nodes` to emit an arena directly:
+
+    arena = Parser(tokens, nodes=ArenaBuilder()).parse()
+"""
+
+from array import array
+
+
+# node kinds; 0 is the "no node" sentinel so a zero field means "absent"
+NONE = 0
+PROGRAM = 1
+FUNCTION_DECL = 2
+VAR_DECL = 3
+ASSIGN = 4
+IF_STMT = 5
+WHILE_STMT = 6
+EXPR_STMT = 7
+CALL_EXPR = 8
+BINARY_EXPR = 9
+LITERAL = 10
+IDENTIFIER = 11
+
+KIND_NAMES = [
+    "None", "Program", "FunctionDecl", "VarDecl", "Assign", "IfStmt", "WhileStmt",
+    "ExprStmt", "CallExpr", "BinaryExpr", "Literal", "Identifier",
+]
+
+# what the a/b/c columns mean for each kind
+FIELDS = {
+    PROGRAM: ("declarations: list",),
+    FUNCTION_DECL: ("name: payload", "body: list", "params: payload"),
+    VAR_DECL: ("name: payload", "initializer: node"),
+    ASSIGN: ("name: payload", "value: node"),
+    IF_STMT: ("condition: node", "then_branch: list", "else_branch: list"),
+    WHILE_STMT: ("condition: node", "body: list"),
+    EXPR_STMT: ("expression: node",),
+    CALL_EXPR: ("callee: node", "args: list"),
+    BINARY_EXPR: ("left: node", "operator: payload", "right: node"),
+    LITERAL: ("value: payload",),
+    IDENTIFIER: ("name: payload",),
+}
+
+
+class AstArena:
+    def __init__(self):
+        self.kinds = array('B', [NONE])
+        self.a = array('i', [0])
+        self.b = array('i', [0])
+        self.c = array('i', [0])
+        # list id i covers list_items[list_starts[i]:list_starts[i + 1]]
+        self.list_items = array('i')
+        self.list_starts = array('I', [0])
+        self.payloads = []
+        self.root = NONE
+
+    def __len__(self):
+        return len(self.kinds) - 1
+
+    def __repr__(self):
+        return f"AstArena({len(self)} nodes, root={self.root})"
+
+    def items(self, list_id):
+        return self.list_items[self.list_starts[list_id]:self.list_starts[list_id + 1]]
+
+    def payload(self, index):
+        return self.payloads[index]
+
+    def kind_name(self, node):
+        return KIND_NAMES[self.kinds[node]]
+
+    def nbytes(self):
+        arrays = (self.kinds, self.a, self.b, self.c, self.list_items, self.list_starts)
+        return sum(arr.itemsize * len(arr) for arr in arrays)
+
+
+class ArenaBuilder:
+    """
+    Node factory for Parser(tokens, nodes=ArenaBuilder()).
+
+    Each constructor mirrors the class of the same name in compiler.Parser.ast
+    but appends a row to the arena and returns its index. Program() is the last
+    call the parser makes, so it finishes and returns the AstArena itself.
+    """
+
+    def __init__(self):
+        self.arena = AstArena()
+        self._payload_ids = {}
+
+    def _node(self, kind, a=0, b=0, c=0):
+        arena = self.arena
+        arena.kinds.append(kind)
+        arena.a.append(a)
+        arena.b.append(b)
+        arena.c.append(c)
+        return len(arena.kinds) - 1
+
+    def _list(self, nodes):
+        arena = self.arena
+        # a None statement (e.g. `if x:` at end of input) is stored as the NONE node
+        arena.list_items.extend(node or NONE for node in nodes)
+        arena.list_starts.append(len(arena.list_items))
+        return len(arena.list_starts) - 2
+
+    def _payload(self, value):
+        key = (type(value), value)
+        index = self._payload_ids.get(key)
+        if index is None:
+            index = len(self.arena.payloads)
+            self.arena.payloads.append(value)
+            self._payload_ids[key] = index
+        return index
+
+    def Program(self, declarations=None):
+        self.arena.root = self._node(PROGRAM, self._list(declarations or []))
+        return self.arena
+
+    def FunctionDecl(self, name, params, body):
+        return self._node(FUNCTION_DECL, self._payload(name), self._list(body or []),
+                          self._payload(tuple(params or ())))
+
+    def VarDecl(self, name, initializer):
+        return self._node(VAR_DECL, self._payload(name), initializer)
+
+    def Assign(self, name, value):
+        return self._node(ASSIGN, self._payload(name), value)
+
+    def IfStmt(self, condition, then_branch, else_branch=None):
+        return self._node(IF_STMT, condition, self._list(then_branch or []),
+                          self._list(else_branch or []))
+
+    def WhileStmt(self, condition, body):
+        return self._node(WHILE_STMT, condition, self._list(body or []))
+
+    def ExprStmt(self, expression):
+        return self._node(EXPR_STMT, expression)
+
+    def CallExpr(self, callee, args):
+        return self._node(CALL_EXPR, callee, self._list(args or []))
+
+    def BinaryExpr(self, left, operator, right):
+        return self._node(BINARY_EXPR, left, self._payload(operator), right)
+
+    def Literal(self, value):
+        return self._node(LITERAL, self._payload(value))
+
+    def Identifier(self, name):
+        return self._node(IDENTIFIER, self._payload(name))
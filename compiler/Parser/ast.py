@@ -4,49 +4,92 @@ AST node definitions for ZLang.
 These are simple, plain Python classes used by the parser.
 They intentionally avoid heavy behavior — the analyzer and generator
 should traverse these node classes to perform checks and emit code.
+
+Every node declares __slots__ so instances carry no per-object __dict__;
+compiler.Parser.arena offers an even flatter array-based representation.
 """
 
+# runtime caches that are never pickled with a tree
+TRANSIENT_FIELDS = frozenset({"target", "target_epoch"})
+
+
 class Node:
-	pass
+	__slots__ = ()
+
+	def __reduce__(self):
+		# Pickle as a constructor call (much faster to load than slot state);
+		# slots that are not constructor parameters travel as extra state.
+		cls = type(self)
+		fields = node_fields(cls)
+		count = _constructor_arity(cls)
+		args = tuple(getattr(self, name, None) for name in fields[:count])
+		extra = {
+			name: value
+			for name in fields[count:]
+			if name not in TRANSIENT_FIELDS and (value := getattr(self, name, None)) is not None
+		}
+		return (cls, args, (None, extra) if extra else None)
 
 
 class Program(Node):
+	# type_errors: what type inference found, set by
+	# compiler.semantics.analyzer.infer_types
+	__slots__ = ("declarations", "type_errors")
+
 	def __init__(self, declarations=None):
 		self.declarations = declarations or []
+		self.type_errors = None
 
 	def __repr__(self):
 		return f"Program({self.declarations})"
 
 
 class FunctionDecl(Node):
+	# frame_size: number of local slots, filled in by the resolver;
+	# pure/global_reads: set by compiler.semantics.purity
+	__slots__ = ("name", "params", "body", "frame_size", "pure", "global_reads")
+
 	def __init__(self, name, params, body):
 		self.name = name
 		self.params = params
 		self.body = body or []
+		self.frame_size = None
+		self.pure = None
+		self.global_reads = None
 
 	def __repr__(self):
 		return f"FunctionDecl({self.name}, params={self.params}, body={self.body})"
 
 
 class VarDecl(Node):
+	__slots__ = ("name", "initializer", "depth", "slot")
+
 	def __init__(self, name, initializer):
 		self.name = name
 		self.initializer = initializer
+		self.depth = None
+		self.slot = None
 
 	def __repr__(self):
 		return f"VarDecl({self.name} = {self.initializer})"
 
 
 class Assign(Node):
+	__slots__ = ("name", "value", "depth", "slot")
+
 	def __init__(self, name, value):
 		self.name = name
 		self.value = value
+		self.depth = None
+		self.slot = None
 
 	def __repr__(self):
 		return f"Assign({self.name} = {self.value})"
 
 
 class IfStmt(Node):
+	__slots__ = ("condition", "then_branch", "else_branch")
+
 	def __init__(self, condition, then_branch, else_branch=None):
 		self.condition = condition
 		self.then_branch = then_branch or []
@@ -57,6 +100,8 @@ class IfStmt(Node):
 
 
 class WhileStmt(Node):
+	__slots__ = ("condition", "body")
+
 	def __init__(self, condition, body):
 		self.condition = condition
 		self.body = body or []
@@ -65,7 +110,33 @@ class WhileStmt(Node):
 		return f"While({self.condition}, body={self.body})"
 
 
+class FastLoop(WhileStmt):
+	"""
+	A `yap` rewritten by compiler.semantics.loops. `invariants` are its
+	InvariantExprs, whose cached values are forgotten on entry; for a counter
+	loop, `counter` names the variable that the last body statement steps by
+	`step_operator` `step` and `bound` is the invariant right side of the
+	condition.
+	"""
+	__slots__ = ("invariants", "counter", "bound", "step_operator", "step")
+
+	def __init__(self, condition, body, invariants=(), counter=None, bound=None, step_operator=None, step=None):
+		super().__init__(condition, body)
+		self.invariants = invariants
+		self.counter = counter
+		self.bound = bound
+		self.step_operator = step_operator
+		self.step = step
+
+	def __repr__(self):
+		if self.counter is None:
+			return f"FastLoop({self.condition}, body={self.body})"
+		return f"CounterLoop({self.counter} {self.step_operator}= {self.step!r}, {self.condition}, body={self.body})"
+
+
 class ExprStmt(Node):
+	__slots__ = ("expression",)
+
 	def __init__(self, expression):
 		self.expression = expression
 
@@ -74,15 +145,23 @@ class ExprStmt(Node):
 
 
 class CallExpr(Node):
+	# target/target_epoch: the interpreter's inline cache of the resolved
+	# builtin or FunctionDecl, valid while target_epoch matches its call epoch
+	__slots__ = ("callee", "args", "target", "target_epoch")
+
 	def __init__(self, callee, args):
 		self.callee = callee
 		self.args = args or []
+		self.target = None
+		self.target_epoch = None
 
 	def __repr__(self):
 		return f"Call({self.callee}, args={self.args})"
 
 
 class BinaryExpr(Node):
+	__slots__ = ("left", "operator", "right")
+
 	def __init__(self, left, operator, right):
 		self.left = left
 		self.operator = operator
@@ -92,7 +171,30 @@ class BinaryExpr(Node):
 		return f"Binary({self.left} {self.operator} {self.right})"
 
 
+class InvariantExpr(BinaryExpr):
+	"""A BinaryExpr whose value cannot change while its loop runs; computed once per run of the loop."""
+	__slots__ = ()
+
+	def __repr__(self):
+		return f"Invariant({self.left} {self.operator} {self.right})"
+
+
+class TypedBinaryExpr(BinaryExpr):
+	"""A BinaryExpr whose operand types are known statically; `kind` is e.g. "int+int"."""
+	__slots__ = ("kind", "result_type")
+
+	def __init__(self, left, operator, right, kind, result_type):
+		super().__init__(left, operator, right)
+		self.kind = kind
+		self.result_type = result_type
+
+	def __repr__(self):
+		return f"Typed[{self.kind}]({self.left} {self.operator} {self.right})"
+
+
 class Literal(Node):
+	__slots__ = ("value",)
+
 	def __init__(self, value):
 		self.value = value
 
@@ -100,10 +202,72 @@ class Literal(Node):
 		return f"Literal({self.value})"
 
 
+class Constant(Node):
+	"""A value computed at analysis time (e.g. a converted or folded literal)."""
+	__slots__ = ("value",)
+
+	def __init__(self, value):
+		self.value = value
+
+	def __repr__(self):
+		return f"Const({self.value!r})"
+
+
 class Identifier(Node):
+	# depth/slot: the (frame, index) coordinate assigned by the resolver
+	__slots__ = ("name", "depth", "slot")
+
 	def __init__(self, name):
 		self.name = name
+		self.depth = None
+		self.slot = None
 
 	def __repr__(self):
 		return f"Ident({self.name})"
 
+
+
+def node_fields(cls):
+	"""All slot names of a node class, including those declared by its bases."""
+	fields = _fields_cache.get(cls)
+	if fields is None:
+		fields = tuple(
+			name
+			for klass in reversed(cls.__mro__)
+			for name in klass.__dict__.get("__slots__", ())
+		)
+		_fields_cache[cls] = fields
+	return fields
+
+
+_fields_cache = {}
+
+
+def _constructor_arity(cls):
+	# constructor parameters are the leading slots, in slot order
+	arity = _arity_cache.get(cls)
+	if arity is None:
+		code = getattr(cls.__init__, "__code__", None)
+		arity = code.co_argcount - 1 if code is not None else 0
+		_arity_cache[cls] = arity
+	return arity
+
+
+_arity_cache = {}
+
+
+def walk(node):
+	"""Yield `node` and every node below it, depth-first, without recursion."""
+	stack = [node]
+	while stack:
+		current = stack.pop()
+		if isinstance(current, list):
+			stack.extend(reversed(current))
+			continue
+		if not isinstance(current, Node):
+			continue
+		yield current
+		for slot in reversed(node_fields(type(current))):
+			child = getattr(current, slot, None)
+			if isinstance(child, (Node, list)):
+				stack.append(child)
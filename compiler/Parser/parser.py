@@ -1,18 +1,9 @@
+from collections import deque
+
+from compiler.lexer.TokenBuffer import TOKEN_TYPES
 from compiler.lexer.TokenType import TokenType
 
-from compiler.Parser.ast import (
-    Program,
-    FunctionDecl,
-    VarDecl,
-    Assign,
-    IfStmt,
-    WhileStmt,
-    ExprStmt,
-    CallExpr,
-    BinaryExpr,
-    Literal,
-    Identifier,
-)
+import compiler.Parser.ast as ast_nodes
 
 
 class ParseError(Exception):
@@ -20,9 +11,12 @@ class ParseError(Exception):
 
 
 class Parser:
-    def __init__(self, tokens):
+    # `nodes` supplies the node constructors (Program, BinaryExpr, ...). It defaults
+    # to the classes in compiler.Parser.ast; an ArenaBuilder emits a flat AstArena instead.
+    def __init__(self, tokens, nodes=None):
         self.tokens = tokens
         self.current = 0
+        self.nodes = nodes if nodes is not None else ast_nodes
 
     def parse(self):
         declarations = []
@@ -34,7 +28,7 @@ class Parser:
                 stmt = self._statement()
                 if stmt:
                     declarations.append(stmt)
-        return Program(declarations)
+        return self.nodes.Program(declarations)
 
     # --- Declarations ---
     def _function_decl(self):
@@ -58,7 +52,7 @@ class Parser:
                 if stmt:
                     body.append(stmt)
 
-        return FunctionDecl(name, params=[], body=body)
+        return self.nodes.FunctionDecl(name, params=[], body=body)
 
     # --- Statements ---
     def _statement(self):
@@ -70,7 +64,7 @@ class Parser:
             return self._while_statement()
         # SAY and other keywords may be calls
         if self._match(TokenType.SAY):
-            return ExprStmt(self._parse_call_from_keyword('say'))
+            return self.nodes.ExprStmt(self._parse_call_from_keyword('say'))
 
 
         # assignment or expression statement
@@ -80,12 +74,12 @@ class Parser:
                 return self._assignment()
             else:
                 expr = self._expression()
-                return ExprStmt(expr)
+                return self.nodes.ExprStmt(expr)
 
         # fallback: try expression
         if not self._is_at_end():
             expr = self._expression()
-            return ExprStmt(expr)
+            return self.nodes.ExprStmt(expr)
 
         return None
 
@@ -94,14 +88,14 @@ class Parser:
         name = name_tok.lexeme
         self._consume(TokenType.EQUAL, "Expected '=' in variable declaration")
         initializer = self._expression()
-        return VarDecl(name, initializer)
+        return self.nodes.VarDecl(name, initializer)
 
     def _assignment(self):
         name_tok = self._consume(TokenType.IDENTIFIER, "Expected identifier for assignment")
         name = name_tok.lexeme
         self._consume(TokenType.EQUAL, "Expected '=' in assignment")
         value = self._expression()
-        return Assign(name, value)
+        return self.nodes.Assign(name, value)
 
     def _if_statement(self):
         condition = self._expression()
@@ -117,7 +111,7 @@ class Parser:
             then_branch = [self._statement()]
 
         # optional else not implemented fully — return basic IfStmt
-        return IfStmt(condition, then_branch)
+        return self.nodes.IfStmt(condition, then_branch)
 
     def _while_statement(self):
         condition = self._expression()
@@ -130,7 +124,7 @@ class Parser:
                 self._advance()
         else:
             body = [self._statement()]
-        return WhileStmt(condition, body)
+        return self.nodes.WhileStmt(condition, body)
 
     def _block_until(self, end_token_type):
         stmts = []
@@ -149,7 +143,7 @@ class Parser:
         while self._match(TokenType.EQUAL_EQUAL, TokenType.NOT_EQUAL):
             operator = self._previous().lexeme
             right = self._comparison()
-            expr = BinaryExpr(expr, operator, right)
+            expr = self.nodes.BinaryExpr(expr, operator, right)
         return expr
 
     def _comparison(self):
@@ -157,7 +151,7 @@ class Parser:
         while self._match(TokenType.GREATER_THAN, TokenType.GREATER_THAN_EQUAL, TokenType.LESS_THAN, TokenType.LESS_THAN_EQUAL):
             operator = self._previous().lexeme
             right = self._term()
-            expr = BinaryExpr(expr, operator, right)
+            expr = self.nodes.BinaryExpr(expr, operator, right)
         return expr
 
     def _term(self):
@@ -165,7 +159,7 @@ class Parser:
         while self._match(TokenType.PLUS, TokenType.MINUS):
             operator = self._previous().lexeme
             right = self._factor()
-            expr = BinaryExpr(expr, operator, right)
+            expr = self.nodes.BinaryExpr(expr, operator, right)
         return expr
 
     def _factor(self):
@@ -173,7 +167,7 @@ class Parser:
         while self._match(TokenType.STAR, TokenType.SLASH):
             operator = self._previous().lexeme
             right = self._unary()
-            expr = BinaryExpr(expr, operator, right)
+            expr = self.nodes.BinaryExpr(expr, operator, right)
         return expr
 
     def _unary(self):
@@ -190,7 +184,7 @@ class Parser:
                     while self._match(TokenType.COMMA):
                         args.append(self._expression())
                 self._consume(TokenType.RIGHT_PAREN, "Expected ')' after arguments")
-                expr = CallExpr(expr, args)
+                expr = self.nodes.CallExpr(expr, args)
             else:
                 break
         return expr
@@ -204,19 +198,22 @@ class Parser:
             while self._match(TokenType.COMMA):
                 args.append(self._expression())
         self._consume(TokenType.RIGHT_PAREN, "Expected ')' after call")
-        return CallExpr(Identifier(name), args)
+        return self.nodes.CallExpr(self.nodes.Identifier(name), args)
 
     def _primary(self):
         if self._match(TokenType.NUMBER):
-            return Literal(self._previous().lexeme)
+            return self.nodes.Literal(self._previous().lexeme)
         if self._match(TokenType.STRING):
-            return Literal(self._previous().lexeme)
+            return self.nodes.Literal(self._previous().lexeme)
         if self._match(TokenType.IDENTIFIER):
-            return Identifier(self._previous().lexeme)
+            return self.nodes.Identifier(self._previous().lexeme)
         # keywords like spill are tokenized as IDENTIFIER? but tokenizer has SPILL keyword
         if self._match(TokenType.SPILL):
             # treat spill like a call expression with name 'spill'
             return self._parse_call_from_keyword('spill')
+        if self._match(TokenType.SQUAD):
+            # squad(1, 2, 3) builds an array value
+            return self._parse_call_from_keyword('squad')
 
         raise ParseError(f"Unexpected token: {self._peek().token_type}")
 
@@ -257,3 +254,74 @@ class Parser:
         if self.current + 1 >= len(self.tokens):
             return False
         return self.tokens[self.current + 1].token_type == TokenType.EQUAL
+
+
+class StreamingParser(Parser):
+    """
+    Parser that pulls tokens lazily from an iterator (e.g. Tokenizer.iter_tokens()).
+
+    The grammar never looks further than one token ahead, so only the previous
+    token, the current token and at most one lookahead token are held at a time.
+    The token iterator must end with an EOF token, as the Tokenizer's does.
+    """
+
+    def __init__(self, tokens, nodes=None):
+        super().__init__(None, nodes)
+        self._source = iter(tokens)
+        self._buffer = deque()
+        self._prev = None
+
+    def _fill(self, count):
+        # make sure at least `count` unread tokens are buffered; False if the stream ran dry
+        while len(self._buffer) < count:
+            token = next(self._source, None)
+            if token is None:
+                return False
+            self._buffer.append(token)
+        return True
+
+    def _advance(self):
+        if not self._is_at_end():
+            self._prev = self._buffer.popleft()
+            self.current += 1
+        return self._previous()
+
+    def _peek(self):
+        if not self._buffer and not self._fill(1):
+            raise ParseError("Token stream ended without an EOF token")
+        return self._buffer[0]
+
+    def _previous(self):
+        return self._prev
+
+    def _lookahead_is_assign(self):
+        if not self._fill(2):
+            return False
+        return self._buffer[1].token_type == TokenType.EQUAL
+
+
+class BufferParser(Parser):
+    """
+    Parser over a TokenBuffer (see Tokenizer.tokenize_buffer()).
+
+    Token-kind tests read the buffer's kind array directly; TokenViews are only
+    created where the grammar needs a lexeme or an error message needs a token.
+    """
+
+    def __init__(self, buffer, nodes=None):
+        super().__init__(buffer, nodes)
+        self._kinds = buffer.kinds
+        self._eof = TokenType.EOF.value
+        self._equal = TokenType.EQUAL.value
+
+    def _check(self, type_):
+        kind = self._kinds[self.current]
+        return kind != self._eof and TOKEN_TYPES[kind] is type_
+
+    def _is_at_end(self):
+        return self._kinds[self.current] == self._eof
+
+    def _lookahead_is_assign(self):
+        if self.current + 1 >= len(self._kinds):
+            return False
+        return self._kinds[self.current + 1] == self._equal
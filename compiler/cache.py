@@ -0,0 +1,132 @@
+"""
+On-disk cache of parsed (and optimized) ZLang programs.
+
+Like CPython's __pycache__, each source file gets entries in a `__zlcache__`
+directory next to it. An entry records the compiler version, whether the
+optimizer ran, and a SHA-256 of the source text; it is only used when all
+three match, so editing the file or upgrading the compiler invalidates it.
+Entries are pickled Program trees written atomically. Unreadable, corrupt or
+stale entries are ignored and rebuilt, and a directory that cannot be written
+simply means no caching.
+
+Entries are unpickled, and unpickling runs whatever code the pickle names, so
+anyone who can write to a `__zlcache__` directory can run code as whoever
+runs the programs next to it. The cache trusts its directories accordingly:
+on POSIX, an entry is only loaded if both it and its directory are owned by
+the current user. Do not share a source tree with users you would not let run
+code as you.
+
+Bump COMPILER_VERSION whenever the AST classes, the parser or the optimizer
+change what they produce.
+
+Usage:
+    program = cache.load(path, source, optimize_ast)
+    if program is None:
+        program = ...parse...
+        cache.store(path, source, program, optimize_ast)
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+
+COMPILER_VERSION = "zlang-0.17"
+CACHE_DIRECTORY = "__zlcache__"
+_TAG = f"{COMPILER_VERSION}-py{sys.version_info[0]}{sys.version_info[1]}"
+
+
+def source_hash(source):
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def cache_path(source_path, optimize_ast=True):
+    """Where the cache entry for `source_path` lives."""
+    directory, filename = os.path.split(os.path.abspath(source_path))
+    stem = os.path.splitext(filename)[0]
+    flavor = "opt" if optimize_ast else "noopt"
+    return os.path.join(directory, CACHE_DIRECTORY, f"{stem}.{_TAG}.{flavor}.pickle")
+
+
+def _owned(stat_result):
+    # platforms without user ids (Windows) rely on the directory's ACLs
+    return not hasattr(os, "getuid") or stat_result.st_uid == os.getuid()
+
+
+def load(source_path, source, optimize_ast=True):
+    """The cached Program for this exact source, or None."""
+    path = cache_path(source_path, optimize_ast)
+    try:
+        with open(path, "rb") as f:
+            # someone else's entry could unpickle to anything
+            if not (_owned(os.fstat(f.fileno())) and _owned(os.stat(os.path.dirname(path)))):
+                return None
+            data = f.read()
+    except OSError:
+        return None
+    try:
+        entry = loads(data)
+    except Exception:
+        # truncated or written by an incompatible build
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("version") != COMPILER_VERSION or entry.get("optimized") != optimize_ast:
+        return None
+    if entry.get("hash") != source_hash(source):
+        return None
+    return entry.get("program")
+
+
+def loads(data):
+    """Unpickle `data`, a tree pickled by this module (or dumps())."""
+    # unpickling allocates a whole tree of container objects; cyclic GC
+    # passes over it would only add time, so hold them off
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def dumps(program):
+    """`program` pickled, or None if it cannot be."""
+    try:
+        return pickle.dumps(program, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, RecursionError, TypeError):
+        return None
+
+
+def store(source_path, source, program, optimize_ast=True):
+    """Write `program` as the entry for this source; returns False if it could not be cached."""
+    path = cache_path(source_path, optimize_ast)
+    entry = {
+        "version": COMPILER_VERSION,
+        "optimized": optimize_ast,
+        "hash": source_hash(source),
+        "program": program,
+    }
+    data = dumps(entry)
+    if data is None:
+        return False
+
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # write then rename so a concurrent reader never sees a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,238 @@
+"""
+Closure-compiling backend for ZLang.
+
+Every AST node is translated once into a nested Python closure that takes the
+current Environment: operators are resolved to their `operator` functions at
+compile time and child closures are captured directly, so running a program
+no longer re-dispatches on node types. Semantics (scoping, builtins, call
+resolution, error messages) are the same as Interpreter's.
+
+Usage:
+    ClosureInterpreter().interpret(program_ast)
+"""
+
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    VarDecl,
+    Assign,
+    IfStmt,
+    WhileStmt,
+    ExprStmt,
+    CallExpr,
+    BinaryExpr,
+    Literal,
+    Constant,
+    Identifier,
+)
+from compiler.semantics.analyzer import (
+    BINARY_OPERATORS,
+    Environment,
+    Interpreter,
+    ZLangRuntimeError,
+    convert_literal,
+)
+
+
+class ClosureInterpreter(Interpreter):
+    meters_limits = False
+
+    def __init__(self, input_fn=input, output_fn=print):
+        super().__init__(input_fn, output_fn)
+        # function name -> compiled body (a closure taking the call's Environment)
+        self.compiled = {}
+        self._compiled_decls = {}
+
+    def interpret(self, program: Program):
+        for decl in program.declarations:
+            if isinstance(decl, FunctionDecl):
+                self._define_function(decl)
+            else:
+                self.compile_statement(decl)(self.env)
+
+        if "main" in self.functions:
+            self._call_function("main", [])
+
+    def _define_function(self, decl):
+        body = self._compiled_decls.get(id(decl))
+        if body is None:
+            body = self.compile_block(decl.body)
+            self._compiled_decls[id(decl)] = body
+        self.functions[decl.name] = decl
+        self.compiled[decl.name] = body
+
+    def _call_function(self, name, arg_values):
+        body = self.compiled.get(name)
+        if body is None:
+            return self._call_squad_builtin(name, arg_values)
+        body(Environment(self.globals))
+        return None
+
+    # --- Statements ---
+    def compile_block(self, stmts):
+        compiled = tuple(self.compile_statement(stmt) for stmt in stmts)
+        if len(compiled) == 1:
+            return compiled[0]
+
+        def run_block(env):
+            for stmt in compiled:
+                stmt(env)
+
+        return run_block
+
+    def compile_statement(self, node):
+        if isinstance(node, ExprStmt):
+            return self.compile_expression(node.expression)
+
+        if isinstance(node, Assign):
+            name = node.name
+            value = self.compile_expression(node.value)
+
+            def run_assign(env):
+                result = value(env)
+                values = env.values
+                if name in values:
+                    values[name] = result
+                else:
+                    env.assign(name, result)
+
+            return run_assign
+
+        if isinstance(node, VarDecl):
+            name = node.name
+            value = self.compile_expression(node.initializer)
+
+            def run_var_decl(env):
+                env.values[name] = value(env)
+
+            return run_var_decl
+
+        if isinstance(node, IfStmt):
+            condition = self.compile_expression(node.condition)
+            then_branch = self.compile_block(node.then_branch)
+            if not node.else_branch:
+                def run_if(env):
+                    if condition(env):
+                        then_branch(env)
+
+                return run_if
+
+            else_branch = self.compile_block(node.else_branch)
+
+            def run_if_else(env):
+                if condition(env):
+                    then_branch(env)
+                else:
+                    else_branch(env)
+
+            return run_if_else
+
+        if isinstance(node, WhileStmt):
+            condition = self.compile_expression(node.condition)
+            body = tuple(self.compile_statement(stmt) for stmt in node.body)
+
+            def run_while(env):
+                while condition(env):
+                    for stmt in body:
+                        stmt(env)
+
+            return run_while
+
+        if isinstance(node, FunctionDecl):
+            def run_function_decl(env):
+                self._define_function(node)
+
+            return run_function_decl
+
+        if isinstance(node, Program):
+            def run_program(env):
+                self.interpret(node)
+
+            return run_program
+
+        if node is None:
+            return _noop
+
+        message = f"Cannot execute node type: {type(node).__name__}"
+
+        def run_unknown(env):
+            raise ZLangRuntimeError(message)
+
+        return run_unknown
+
+    # --- Expressions ---
+    def compile_expression(self, expr):
+        if isinstance(expr, (Constant, Literal)):
+            value = expr.value if isinstance(expr, Constant) else convert_literal(expr.value)
+            return lambda env: value
+
+        if isinstance(expr, Identifier):
+            name = expr.name
+
+            def load(env):
+                values = env.values
+                if name in values:
+                    return values[name]
+                return env.get(name)
+
+            return load
+
+        if isinstance(expr, BinaryExpr):
+            return self._compile_binary(expr)
+
+        if isinstance(expr, CallExpr):
+            return self._compile_call(expr)
+
+        message = f"Unknown expression node: {type(expr).__name__}"
+
+        def unknown(env):
+            raise ZLangRuntimeError(message)
+
+        return unknown
+
+    def _compile_binary(self, expr):
+        left = self.compile_expression(expr.left)
+        right = self.compile_expression(expr.right)
+        fn = BINARY_OPERATORS.get(expr.operator)
+
+        if fn is None:
+            message = f"Unknown binary operator '{expr.operator}'"
+
+            def unknown_operator(env):
+                left(env)
+                right(env)
+                raise ZLangRuntimeError(message)
+
+            return unknown_operator
+
+        if isinstance(expr.right, Constant):
+            constant = expr.right.value
+            return lambda env: fn(left(env), constant)
+
+        return lambda env: fn(left(env), right(env))
+
+    def _compile_call(self, expr):
+        callee = expr.callee
+        if not isinstance(callee, Identifier):
+            def bad_callee(env):
+                raise ZLangRuntimeError("Can only call named functions.")
+
+            return bad_callee
+
+        name = callee.name
+        args = tuple(self.compile_expression(arg) for arg in expr.args)
+        global_values = self.globals.values
+        call_function = self._call_function
+
+        def call(env):
+            arg_values = [arg(env) for arg in args]
+            builtin = global_values.get(name)
+            if callable(builtin):
+                return builtin(arg_values)
+            return call_function(name, arg_values)
+
+        return call
+
+
+def _noop(env):
+    return None
@@ -0,0 +1,519 @@
+"""
+Bytecode code generator and stack virtual machine for ZLang.
+
+BytecodeCompiler lowers a Program (and each FunctionDecl body) to a CodeObject:
+a flat array('i') of (opcode, operand) pairs plus a constant pool, a name
+table and a table of multi-operand instruction arguments. Control flow (`if`,
+`yap`) becomes jumps to absolute instruction numbers, and common shapes such
+as `i < n` tests and `i = i + 1` updates compile to single fused instructions. VirtualMachine runs CodeObjects in a single
+dispatch loop and is a drop-in replacement for Interpreter; disassemble()
+renders a CodeObject as text for debugging.
+
+Usage:
+    VirtualMachine().interpret(program_ast)
+    print(disassemble(BytecodeCompiler().compile_program(program_ast)))
+"""
+
+from array import array
+
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    VarDecl,
+    Assign,
+    IfStmt,
+    WhileStmt,
+    ExprStmt,
+    CallExpr,
+    BinaryExpr,
+    Literal,
+    Constant,
+    Identifier,
+)
+from compiler.semantics.analyzer import (
+    BINARY_OPERATORS,
+    Interpreter,
+    ZLangRuntimeError,
+    convert_literal,
+)
+
+
+# --- Opcodes ---
+# Every instruction is two ints: the opcode and one operand (0 when unused).
+# Instructions that need several operands index the code object's `operands`
+# table instead. Jump targets are instruction numbers.
+LOAD_CONST = 0              # push consts[arg]
+LOAD_NAME = 1               # push the variable names[arg]
+STORE_NAME = 2              # pop, assign to names[arg] (local if defined there, else global)
+DEFINE_NAME = 3             # pop, define names[arg] in the current scope (`lit`)
+BINARY = 4                  # pop right, pop left, push OPERATOR_FUNCTIONS[arg](left, right)
+BINARY_CONST = 5            # operands[arg] = (fn, const): replace top with fn(top, const)
+BINARY_NAME = 6             # operands[arg] = (fn, name): replace top with fn(top, variable)
+NAME_OP_CONST = 7           # operands[arg] = (name, fn, const): push fn(variable, const)
+UPDATE_NAME_CONST = 8       # operands[arg] = (name, fn, const): name = fn(variable, const)
+POP = 9                     # discard the top of the stack
+JUMP = 10                   # continue at instruction arg
+JUMP_IF_FALSE = 11          # pop, jump to arg if the value is falsy
+JUMP_IF_TRUE = 12           # pop, jump to arg if the value is truthy
+JUMP_UNLESS_NAME_CONST = 13 # operands[arg] = [name, fn, const, target]: jump unless fn(variable, const)
+JUMP_IF_NAME_CONST = 14     # operands[arg] = [name, fn, const, target]: jump if fn(variable, const)
+CALL = 15                   # operands[arg] = (name, argc): call with argc popped arguments
+DEF_FUNCTION = 16           # register the FunctionDecl / CodeObject pair consts[arg]
+RUN_PROGRAM = 17            # interpret the nested Program consts[arg]
+RAISE = 18                  # raise ZLangRuntimeError(consts[arg])
+RETURN = 19                 # leave the current code object
+BINARY_UNKNOWN = 20         # pop two operands, raise for the unknown operator consts[arg]
+
+OPCODE_NAMES = [
+    "LOAD_CONST", "LOAD_NAME", "STORE_NAME", "DEFINE_NAME", "BINARY", "BINARY_CONST",
+    "BINARY_NAME", "NAME_OP_CONST", "UPDATE_NAME_CONST", "POP", "JUMP", "JUMP_IF_FALSE",
+    "JUMP_IF_TRUE", "JUMP_UNLESS_NAME_CONST", "JUMP_IF_NAME_CONST", "CALL", "DEF_FUNCTION",
+    "RUN_PROGRAM", "RAISE", "RETURN", "BINARY_UNKNOWN",
+]
+
+OPERATOR_SYMBOLS = list(BINARY_OPERATORS)
+OPERATOR_FUNCTIONS = [BINARY_OPERATORS[op] for op in OPERATOR_SYMBOLS]
+OPERATOR_INDEX = {op: i for i, op in enumerate(OPERATOR_SYMBOLS)}
+OPERATOR_NAMES = {fn: op for op, fn in BINARY_OPERATORS.items()}
+
+
+class CodeObject:
+    def __init__(self, name):
+        self.name = name
+        self.code = array('i')
+        self.consts = []
+        self.names = []
+        self.operands = []
+        self._const_ids = {}
+        self._name_ids = {}
+        self._decoded = None
+
+    def __repr__(self):
+        return f"<code {self.name}: {len(self.code) // 2} instructions>"
+
+    def emit(self, opcode, operand=0):
+        self.code.append(opcode)
+        self.code.append(operand)
+        return len(self.code) // 2 - 1
+
+    def emit_with(self, opcode, operands):
+        self.operands.append(operands)
+        return self.emit(opcode, len(self.operands) - 1)
+
+    def patch(self, instruction, target):
+        opcode = self.code[2 * instruction]
+        if opcode in (JUMP_UNLESS_NAME_CONST, JUMP_IF_NAME_CONST):
+            self.operands[self.code[2 * instruction + 1]][3] = target
+        else:
+            self.code[2 * instruction + 1] = target
+
+    def here(self):
+        return len(self.code) // 2
+
+    def add_const(self, value):
+        # bool and int compare equal, so the type is part of the key
+        key = (type(value), value) if _hashable(value) else (type(value), id(value))
+        index = self._const_ids.get(key)
+        if index is None:
+            index = len(self.consts)
+            self.consts.append(value)
+            self._const_ids[key] = index
+        return index
+
+    def add_name(self, name):
+        index = self._name_ids.get(name)
+        if index is None:
+            index = len(self.names)
+            self.names.append(name)
+            self._name_ids[name] = index
+        return index
+
+    def instructions(self):
+        # (opcode, operand) tuples decoded once from the array for the dispatch loop
+        if self._decoded is None or len(self._decoded) != len(self.code) // 2:
+            self._decoded = list(zip(self.code[0::2], self.code[1::2]))
+        return self._decoded
+
+
+class BytecodeCompiler:
+    def compile_program(self, program: Program):
+        code = CodeObject("<program>")
+        for decl in program.declarations:
+            self._statement(decl, code)
+        code.emit(RETURN)
+        return code
+
+    def compile_function(self, func: FunctionDecl):
+        code = CodeObject(func.name)
+        for stmt in func.body:
+            self._statement(stmt, code)
+        code.emit(RETURN)
+        return code
+
+    # --- Statements ---
+    def _statement(self, node, code):
+        if isinstance(node, ExprStmt):
+            self._expression(node.expression, code)
+            code.emit(POP)
+
+        elif isinstance(node, Assign):
+            update = self._name_op_const(node.value)
+            if update is not None and update[0] == node.name:
+                # x = x <op> constant
+                code.emit_with(UPDATE_NAME_CONST, update)
+            else:
+                self._expression(node.value, code)
+                code.emit(STORE_NAME, code.add_name(node.name))
+
+        elif isinstance(node, VarDecl):
+            self._expression(node.initializer, code)
+            code.emit(DEFINE_NAME, code.add_name(node.name))
+
+        elif isinstance(node, IfStmt):
+            to_else = self._jump_unless(node.condition, code)
+            for stmt in node.then_branch:
+                self._statement(stmt, code)
+            if node.else_branch:
+                to_end = code.emit(JUMP)
+                code.patch(to_else, code.here())
+                for stmt in node.else_branch:
+                    self._statement(stmt, code)
+                code.patch(to_end, code.here())
+            else:
+                code.patch(to_else, code.here())
+
+        elif isinstance(node, WhileStmt):
+            # test at the bottom so each iteration costs one conditional jump
+            to_test = code.emit(JUMP)
+            top = code.here()
+            for stmt in node.body:
+                self._statement(stmt, code)
+            code.patch(to_test, code.here())
+            self._jump_if(node.condition, code, top)
+
+        elif isinstance(node, FunctionDecl):
+            code.emit(DEF_FUNCTION, code.add_const((node, self.compile_function(node))))
+
+        elif isinstance(node, Program):
+            code.emit(RUN_PROGRAM, code.add_const(node))
+
+        elif node is None:
+            return
+
+        else:
+            code.emit(RAISE, code.add_const(f"Cannot execute node type: {type(node).__name__}"))
+
+    def _jump_unless(self, condition, code):
+        fused = self._name_op_const(condition)
+        if fused is not None:
+            return code.emit_with(JUMP_UNLESS_NAME_CONST, [*fused, None])
+        self._expression(condition, code)
+        return code.emit(JUMP_IF_FALSE)
+
+    def _jump_if(self, condition, code, target):
+        fused = self._name_op_const(condition)
+        if fused is not None:
+            return code.emit_with(JUMP_IF_NAME_CONST, [*fused, target])
+        self._expression(condition, code)
+        return code.emit(JUMP_IF_TRUE, target)
+
+    def _name_op_const(self, expr):
+        # (name, fn, const) when expr is `identifier <op> constant`, else None
+        if not isinstance(expr, BinaryExpr) or not isinstance(expr.left, Identifier):
+            return None
+        fn = BINARY_OPERATORS.get(expr.operator)
+        constant = _constant_value(expr.right)
+        if fn is None or constant is _NOT_CONSTANT:
+            return None
+        return expr.left.name, fn, constant
+
+    # --- Expressions ---
+    def _expression(self, expr, code):
+        if isinstance(expr, Constant):
+            code.emit(LOAD_CONST, code.add_const(expr.value))
+
+        elif isinstance(expr, Literal):
+            code.emit(LOAD_CONST, code.add_const(convert_literal(expr.value)))
+
+        elif isinstance(expr, Identifier):
+            code.emit(LOAD_NAME, code.add_name(expr.name))
+
+        elif isinstance(expr, BinaryExpr):
+            self._binary(expr, code)
+
+        elif isinstance(expr, CallExpr):
+            if not isinstance(expr.callee, Identifier):
+                code.emit(RAISE, code.add_const("Can only call named functions."))
+                return
+            for arg in expr.args:
+                self._expression(arg, code)
+            code.emit_with(CALL, (expr.callee.name, len(expr.args)))
+
+        else:
+            code.emit(RAISE, code.add_const(f"Unknown expression node: {type(expr).__name__}"))
+
+    def _binary(self, expr, code):
+        # operator chains parse left-deep: emit the spine iteratively
+        spine = []
+        while isinstance(expr, BinaryExpr):
+            spine.append(expr)
+            expr = expr.left
+        spine.reverse()
+
+        fused = self._name_op_const(spine[0])
+        if fused is not None:
+            code.emit_with(NAME_OP_CONST, fused)
+            spine = spine[1:]
+        else:
+            self._expression(expr, code)
+
+        for binary in spine:
+            op = OPERATOR_INDEX.get(binary.operator)
+            right = binary.right
+            constant = _constant_value(right)
+            if op is None:
+                self._expression(right, code)
+                code.emit(BINARY_UNKNOWN, code.add_const(binary.operator))
+            elif constant is not _NOT_CONSTANT:
+                code.emit_with(BINARY_CONST, (OPERATOR_FUNCTIONS[op], constant))
+            elif isinstance(right, Identifier):
+                code.emit_with(BINARY_NAME, (OPERATOR_FUNCTIONS[op], right.name))
+            else:
+                self._expression(right, code)
+                code.emit(BINARY, op)
+
+
+class VirtualMachine(Interpreter):
+    """
+    Stack VM for CodeObjects produced by BytecodeCompiler.
+
+    A frame's variables live in a dict; function frames fall back to the
+    globals dict exactly like an Environment enclosed by the globals.
+    """
+
+    meters_limits = False
+
+    def __init__(self, input_fn=input, output_fn=print):
+        super().__init__(input_fn, output_fn)
+        self.function_code = {}
+
+    def interpret(self, program: Program):
+        module = BytecodeCompiler().compile_program(program)
+        self.run(module, self.globals.values)
+
+        if "main" in self.functions:
+            self._call_function("main", [])
+
+    def _call_function(self, name, arg_values):
+        code = self.function_code.get(name)
+        if code is None:
+            return self._call_squad_builtin(name, arg_values)
+        self.run(code, {})
+        return None
+
+    def run(self, code_object, local_values):
+        instructions = code_object.instructions()
+        consts = code_object.consts
+        names = code_object.names
+        operands = code_object.operands
+        global_values = self.globals.values
+        operators = OPERATOR_FUNCTIONS
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+
+        # Variable reads inline Environment.get for a local scope enclosed by
+        # the globals: the local dict first, then the globals, else an error.
+        while True:
+            op, arg = instructions[pc]
+            pc += 1
+
+            if op == LOAD_NAME:
+                name = names[arg]
+                if name in local_values:
+                    push(local_values[name])
+                elif name in global_values:
+                    push(global_values[name])
+                else:
+                    raise ZLangRuntimeError(f"Undefined variable '{name}'.")
+
+            elif op == NAME_OP_CONST:
+                name, fn, constant = operands[arg]
+                if name in local_values:
+                    push(fn(local_values[name], constant))
+                elif name in global_values:
+                    push(fn(global_values[name], constant))
+                else:
+                    raise ZLangRuntimeError(f"Undefined variable '{name}'.")
+
+            elif op == STORE_NAME:
+                name = names[arg]
+                if name in local_values:
+                    local_values[name] = pop()
+                else:
+                    global_values[name] = pop()
+
+            elif op == BINARY:
+                right = pop()
+                stack[-1] = operators[arg](stack[-1], right)
+
+            elif op == UPDATE_NAME_CONST:
+                name, fn, constant = operands[arg]
+                if name in local_values:
+                    local_values[name] = fn(local_values[name], constant)
+                elif name in global_values:
+                    global_values[name] = fn(global_values[name], constant)
+                else:
+                    raise ZLangRuntimeError(f"Undefined variable '{name}'.")
+
+            elif op == JUMP_IF_NAME_CONST:
+                name, fn, constant, target = operands[arg]
+                if name in local_values:
+                    value = local_values[name]
+                elif name in global_values:
+                    value = global_values[name]
+                else:
+                    raise ZLangRuntimeError(f"Undefined variable '{name}'.")
+                if fn(value, constant):
+                    pc = target
+
+            elif op == JUMP_UNLESS_NAME_CONST:
+                name, fn, constant, target = operands[arg]
+                if name in local_values:
+                    value = local_values[name]
+                elif name in global_values:
+                    value = global_values[name]
+                else:
+                    raise ZLangRuntimeError(f"Undefined variable '{name}'.")
+                if not fn(value, constant):
+                    pc = target
+
+            elif op == LOAD_CONST:
+                push(consts[arg])
+
+            elif op == BINARY_CONST:
+                fn, constant = operands[arg]
+                stack[-1] = fn(stack[-1], constant)
+
+            elif op == CALL:
+                name, argc = operands[arg]
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+                builtin = global_values.get(name)
+                if callable(builtin):
+                    push(builtin(args))
+                else:
+                    push(self._call_function(name, args))
+
+            elif op == POP:
+                pop()
+
+            elif op == JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+
+            elif op == JUMP_IF_TRUE:
+                if pop():
+                    pc = arg
+
+            elif op == JUMP:
+                pc = arg
+
+            elif op == BINARY_NAME:
+                fn, name = operands[arg]
+                if name in local_values:
+                    right = local_values[name]
+                elif name in global_values:
+                    right = global_values[name]
+                else:
+                    raise ZLangRuntimeError(f"Undefined variable '{name}'.")
+                stack[-1] = fn(stack[-1], right)
+
+            elif op == DEFINE_NAME:
+                local_values[names[arg]] = pop()
+
+            elif op == RETURN:
+                return None
+
+            elif op == DEF_FUNCTION:
+                decl, function_code = consts[arg]
+                self.functions[decl.name] = decl
+                self.function_code[decl.name] = function_code
+
+            elif op == RUN_PROGRAM:
+                self.interpret(consts[arg])
+
+            elif op == RAISE:
+                raise ZLangRuntimeError(consts[arg])
+
+            elif op == BINARY_UNKNOWN:
+                del stack[-2:]
+                raise ZLangRuntimeError(f"Unknown binary operator '{consts[arg]}'")
+
+            else:
+                raise ZLangRuntimeError(f"Bad opcode {op} at instruction {pc - 1} in {code_object.name}")
+
+
+def disassemble(code_object):
+    """Human-readable listing of a CodeObject and the functions it defines."""
+    lines = [f"code {code_object.name}:"]
+    nested = []
+    for index, (op, arg) in enumerate(code_object.instructions()):
+        detail = ""
+        if op in (LOAD_CONST, RAISE, BINARY_UNKNOWN):
+            detail = repr(code_object.consts[arg])
+        elif op in (LOAD_NAME, STORE_NAME, DEFINE_NAME):
+            detail = code_object.names[arg]
+        elif op == BINARY:
+            detail = OPERATOR_SYMBOLS[arg]
+        elif op == BINARY_CONST:
+            fn, constant = code_object.operands[arg]
+            detail = f"{OPERATOR_NAMES[fn]} {constant!r}"
+        elif op == BINARY_NAME:
+            fn, name = code_object.operands[arg]
+            detail = f"{OPERATOR_NAMES[fn]} {name}"
+        elif op in (NAME_OP_CONST, UPDATE_NAME_CONST):
+            name, fn, constant = code_object.operands[arg]
+            detail = f"{name} {OPERATOR_NAMES[fn]} {constant!r}"
+        elif op in (JUMP_UNLESS_NAME_CONST, JUMP_IF_NAME_CONST):
+            name, fn, constant, target = code_object.operands[arg]
+            detail = f"{name} {OPERATOR_NAMES[fn]} {constant!r} -> {target}"
+        elif op in (JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE):
+            detail = f"-> {arg}"
+        elif op == CALL:
+            call_name, argc = code_object.operands[arg]
+            detail = f"{call_name}/{argc}"
+        elif op == DEF_FUNCTION:
+            function_code = code_object.consts[arg][1]
+            detail = function_code.name
+            nested.append(function_code)
+        arg_text = "" if op in (RETURN, POP) else str(arg)
+        lines.append(f"  {index:5d} {OPCODE_NAMES[op]:<22} {arg_text:>5}  {detail}".rstrip())
+    for function_code in nested:
+        lines.append("")
+        lines.append(disassemble(function_code))
+    return "\n".join(lines)
+
+
+_NOT_CONSTANT = object()
+
+
+def _constant_value(expr):
+    # runtime value of a Constant/Literal operand, or _NOT_CONSTANT
+    if isinstance(expr, Constant):
+        return expr.value
+    if isinstance(expr, Literal):
+        return convert_literal(expr.value)
+    return _NOT_CONSTANT
+
+
+def _hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
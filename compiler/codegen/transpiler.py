@@ -0,0 +1,357 @@
+"""
+ZLang-to-Python transpiler backend.
+
+PythonTranspiler turns a Program into Python source: functions become `def`s,
+`yap` becomes `while`, `say`/`spill` call the interpreter's output_fn/input_fn
+and the squad builtins are called as they are.
+PythonInterpreter compiles that source with compile() and exec()s it, so
+CPython's own bytecode compiler and interpreter run the program.
+
+ZLang names are prefixed so they can never clash with Python keywords or the
+helpers the generated code uses: variables become `v_<name>` and functions
+`f_<name>` (separate namespaces, as in the tree-walking Interpreter).
+
+Scoping follows Environment exactly. Top-level variables are module globals.
+Inside a function, a name whose first appearance is an unconditional
+top-level `lit` is a plain Python local; a name the function never `lit`s is
+a global; anything else goes through a per-call `_zl_locals` dict with the
+same local-then-global lookup the Interpreter performs.
+
+Usage:
+    print(PythonTranspiler().transpile(program_ast))
+    PythonInterpreter().interpret(program_ast)
+"""
+
+import math
+
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    VarDecl,
+    Assign,
+    IfStmt,
+    WhileStmt,
+    ExprStmt,
+    CallExpr,
+    BinaryExpr,
+    Literal,
+    Constant,
+    Identifier,
+)
+from compiler.semantics.analyzer import (
+    Interpreter,
+    ZLangRuntimeError,
+    convert_literal,
+)
+from compiler.semantics.resolver import classify_locals, scope_nodes
+from compiler.semantics.rope import plain
+from compiler.semantics.squad import SQUAD_BUILTINS
+
+
+VARIABLE_PREFIX = "v_"
+FUNCTION_PREFIX = "f_"
+INDENT = "    "
+
+# builtins the generated code calls as _zl_<name>
+BUILTINS = ("say", "spill") + tuple(SQUAD_BUILTINS)
+
+# Python precedence of the ZLang operators (higher binds tighter)
+COMPARISON, ADDITIVE, MULTIPLICATIVE, ATOM = range(4)
+PRECEDENCE = {
+    "==": COMPARISON, "!=": COMPARISON, ">": COMPARISON,
+    ">=": COMPARISON, "<": COMPARISON, "<=": COMPARISON,
+    "+": ADDITIVE, "-": ADDITIVE,
+    "*": MULTIPLICATIVE, "/": MULTIPLICATIVE,
+}
+
+
+def python_name(prefix, name):
+    """Python identifier for a ZLang name; non-ASCII names are hex-encoded."""
+    if name.isascii():
+        return prefix + name
+    return prefix + "_u" + name.encode("utf-8").hex()
+
+
+def zlang_name(identifier):
+    """Inverse of python_name: (prefix, ZLang name), or None for other identifiers."""
+    for prefix in (VARIABLE_PREFIX, FUNCTION_PREFIX):
+        if identifier.startswith(prefix):
+            name = identifier[len(prefix):]
+            if name.startswith("_u"):
+                name = bytes.fromhex(name[2:]).decode("utf-8")
+            return prefix, name
+    return None
+
+
+class PythonTranspiler:
+    def __init__(self):
+        # values the generated code cannot spell as literals (nan, inf, nested Programs)
+        self.constants = []
+        self._hoisted = []
+        self.builtins = BUILTINS
+
+    def transpile(self, program: Program):
+        self.constants = []
+        self._hoisted = []
+        # a function named after a squad builtin replaces it (say and spill stay)
+        functions = {node.name for node in scope_nodes(program, skip=()) if isinstance(node, FunctionDecl)}
+        self.builtins = tuple(name for name in BUILTINS if name in ("say", "spill") or name not in functions)
+        body = self._block(program.declarations, _ModuleScope(), 0)
+        lines = ["# generated from ZLang", ""]
+        for hoisted in self._hoisted:
+            lines.extend(hoisted)
+            lines.append("")
+        lines.extend(body)
+        return "\n".join(lines) + "\n"
+
+    # --- Functions ---
+    def _function(self, decl, py_name):
+        scope = _FunctionScope(decl.body)
+        body = self._block(decl.body, scope, 1)
+        lines = [f"def {py_name}():"]
+        if scope.globals:
+            lines.append(INDENT + "global " + ", ".join(sorted(scope.globals)))
+        if scope.dynamic:
+            lines.append(INDENT + "_zl_locals = {}")
+        lines.extend(body)
+        return lines
+
+    # --- Statements ---
+    def _block(self, stmts, scope, depth):
+        lines = []
+        for stmt in stmts:
+            self._statement(stmt, scope, depth, lines)
+        if not lines:
+            lines.append(INDENT * depth + "pass")
+        return lines
+
+    def _statement(self, node, scope, depth, lines):
+        pad = INDENT * depth
+
+        if isinstance(node, ExprStmt):
+            lines.append(pad + self._expression(node.expression, scope))
+
+        elif isinstance(node, VarDecl):
+            value = self._expression(node.initializer, scope)
+            lines.extend(pad + line for line in scope.define(node.name, value))
+
+        elif isinstance(node, Assign):
+            value = self._expression(node.value, scope)
+            lines.extend(pad + line for line in scope.assign(node.name, value))
+
+        elif isinstance(node, IfStmt):
+            lines.append(pad + f"if {self._expression(node.condition, scope)}:")
+            lines.extend(self._block(node.then_branch, scope, depth + 1))
+            if node.else_branch:
+                lines.append(pad + "else:")
+                lines.extend(self._block(node.else_branch, scope, depth + 1))
+
+        elif isinstance(node, WhileStmt):
+            lines.append(pad + f"while {self._expression(node.condition, scope)}:")
+            lines.extend(self._block(node.body, scope, depth + 1))
+
+        elif isinstance(node, FunctionDecl):
+            py_name = python_name(FUNCTION_PREFIX, node.name)
+            if isinstance(scope, _ModuleScope):
+                lines.extend(pad + line for line in self._function(node, py_name))
+                lines.append("")
+            else:
+                # a nested def would close over the enclosing locals; ZLang
+                # functions only ever see globals, so define it at module level
+                hoisted = f"_zl_def{len(self._hoisted)}"
+                self._hoisted.append(self._function(node, hoisted))
+                scope.globals.add(py_name)
+                lines.append(pad + f"{py_name} = {hoisted}")
+
+        elif isinstance(node, Program):
+            lines.append(pad + f"_zl_run_program({self._constant(node)})")
+
+        elif node is None:
+            return
+
+        else:
+            message = f"Cannot execute node type: {type(node).__name__}"
+            lines.append(pad + f"_zl_raise({message!r})")
+
+    # --- Expressions ---
+    def _expression(self, expr, scope):
+        if isinstance(expr, Constant):
+            return self._value(expr.value)
+
+        if isinstance(expr, Literal):
+            return self._value(convert_literal(expr.value))
+
+        if isinstance(expr, Identifier):
+            return scope.load(expr.name)
+
+        if isinstance(expr, BinaryExpr):
+            return self._binary(expr, scope)[0]
+
+        if isinstance(expr, CallExpr):
+            callee = expr.callee
+            if not isinstance(callee, Identifier):
+                return '_zl_raise("Can only call named functions.")'
+            args = [self._expression(arg, scope) for arg in expr.args]
+            if callee.name in self.builtins:
+                return f"_zl_{callee.name}({', '.join(args)})"
+            # arguments are evaluated (and discarded) before the function is looked up
+            call = python_name(FUNCTION_PREFIX, callee.name) + "()"
+            if not args:
+                return call
+            return f"({', '.join(args)}, {call})[-1]"
+
+        message = f"Unknown expression node: {type(expr).__name__}"
+        return f"_zl_raise({message!r})"
+
+    def _binary(self, expr, scope):
+        # Returns (code, precedence). Operator chains parse left-deep, so the
+        # spine is built iteratively and parenthesised only where Python's
+        # precedence differs: `a + b - c` stays flat, comparisons never chain.
+        spine = []
+        while isinstance(expr, BinaryExpr):
+            spine.append(expr)
+            expr = expr.left
+        code, precedence = self._operand(expr, scope)
+        for binary in reversed(spine):
+            right, right_precedence = self._operand(binary.right, scope)
+            op_precedence = PRECEDENCE.get(binary.operator)
+            if op_precedence is None:
+                code = f"_zl_unknown_operator({code}, {right}, {binary.operator!r})"
+                precedence = ATOM
+                continue
+            if precedence < op_precedence or precedence == op_precedence == COMPARISON:
+                code = f"({code})"
+            if right_precedence <= op_precedence:
+                right = f"({right})"
+            code = f"{code} {binary.operator} {right}"
+            precedence = op_precedence
+        return code, precedence
+
+    def _operand(self, expr, scope):
+        if isinstance(expr, BinaryExpr):
+            return self._binary(expr, scope)
+        return self._expression(expr, scope), ATOM
+
+    def _value(self, value):
+        if value is None or isinstance(value, (bool, int, str)):
+            return repr(value)
+        if isinstance(value, float) and math.isfinite(value):
+            return repr(value)
+        return self._constant(value)
+
+    def _constant(self, value):
+        self.constants.append(value)
+        return f"_zl_constants[{len(self.constants) - 1}]"
+
+
+class _ModuleScope:
+    # top-level code: every variable is a module global
+    def load(self, name):
+        return python_name(VARIABLE_PREFIX, name)
+
+    def define(self, name, value):
+        return [f"{python_name(VARIABLE_PREFIX, name)} = {value}"]
+
+    assign = define
+
+
+class _FunctionScope:
+    def __init__(self, body):
+        self.globals = set()
+        self.locals, self.dynamic = classify_locals(body)
+
+    def load(self, name):
+        py_name = python_name(VARIABLE_PREFIX, name)
+        if name in self.dynamic:
+            return f"(_zl_locals[{name!r}] if {name!r} in _zl_locals else {py_name})"
+        return py_name
+
+    def define(self, name, value):
+        if name in self.dynamic:
+            return [f"_zl_locals[{name!r}] = {value}"]
+        return [f"{python_name(VARIABLE_PREFIX, name)} = {value}"]
+
+    def assign(self, name, value):
+        py_name = python_name(VARIABLE_PREFIX, name)
+        if name in self.locals:
+            return [f"{py_name} = {value}"]
+        self.globals.add(py_name)
+        if name in self.dynamic:
+            return [
+                f"_zl_value = {value}",
+                f"if {name!r} in _zl_locals:",
+                f"{INDENT}_zl_locals[{name!r}] = _zl_value",
+                "else:",
+                f"{INDENT}{py_name} = _zl_value",
+            ]
+        return [f"{py_name} = {value}"]
+
+
+class PythonInterpreter(Interpreter):
+    """Runs a Program by transpiling it to Python and exec()ing the result."""
+
+    meters_limits = False
+
+    def __init__(self, input_fn=input, output_fn=print):
+        super().__init__(input_fn, output_fn)
+        self.namespace = self._new_namespace()
+
+    def _new_namespace(self):
+        def say(*args):
+            self.output_fn(*map(plain, args))
+
+        def spill(*args):
+            prompt = str(args[0]) if args else ""
+            self._flush_output()
+            return self.input_fn(prompt)
+
+        def unknown_operator(left, right, op):
+            raise ZLangRuntimeError(f"Unknown binary operator '{op}'")
+
+        def fail(message):
+            raise ZLangRuntimeError(message)
+
+        namespace = {
+            "__builtins__": {},
+            "_zl_say": say,
+            "_zl_spill": spill,
+            "_zl_unknown_operator": unknown_operator,
+            "_zl_raise": fail,
+            "_zl_run_program": self.interpret,
+            "_zl_constants": [],
+        }
+        for name, builtin in SQUAD_BUILTINS.items():
+            namespace[f"_zl_{name}"] = _positional(builtin)
+        return namespace
+
+    def interpret(self, program: Program):
+        transpiler = PythonTranspiler()
+        source = transpiler.transpile(program)
+        code = compile(source, "<zlang>", "exec")
+        # a nested Program runs through here too; keep the caller's constants
+        outer_constants = self.namespace["_zl_constants"]
+        try:
+            self.namespace["_zl_constants"] = transpiler.constants
+            exec(code, self.namespace)
+            main = self.namespace.get(python_name(FUNCTION_PREFIX, "main"))
+            if main is not None:
+                main()
+        except NameError as e:
+            # undefined ZLang names surface as NameErrors of their prefixed identifiers
+            found = zlang_name(e.name or "")
+            if found is None:
+                raise
+            prefix, name = found
+            if prefix == FUNCTION_PREFIX:
+                raise ZLangRuntimeError(f"Undefined function '{name}'") from None
+            raise ZLangRuntimeError(f"Undefined variable '{name}'.") from None
+        finally:
+            self.namespace["_zl_constants"] = outer_constants
+
+
+def _positional(builtin):
+    # interpreter builtins take their arguments as one list
+    def call(*args):
+        return builtin(list(args))
+
+    return call
@@ -0,0 +1,51 @@
+from array import array
+from bisect import bisect_right
+
+
+class LineIndex:
+    """
+    Precomputed table of line start offsets for a source string.
+
+    Lines and columns are 1-based, like Tokenizer.line_num. A lookup is a bisect
+    over the table, so it never rescans the source, and update() patches the
+    table after an edit without walking the unchanged text.
+    """
+
+    def __init__(self, source_code):
+        self.line_starts = array('I', [0])
+        self.line_starts.extend(_line_starts_in(source_code, 0, len(source_code)))
+
+    def __len__(self):
+        return len(self.line_starts)
+
+    def line_of(self, offset):
+        return bisect_right(self.line_starts, offset)
+
+    def line_col(self, offset):
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def offset_of(self, line, column):
+        return self.line_starts[line - 1] + column - 1
+
+    def update(self, new_source, start, old_end, new_end):
+        # source[start:old_end] was replaced by new_source[start:new_end]
+        starts = self.line_starts
+        delta = new_end - old_end
+        # a line start s belongs to the newline at s - 1, so the edit owns (start, old_end]
+        low = bisect_right(starts, start)
+        high = bisect_right(starts, old_end)
+        patched = starts[:low]
+        patched.extend(_line_starts_in(new_source, start, new_end))
+        patched.extend(s + delta for s in starts[high:])
+        self.line_starts = patched
+
+
+def _line_starts_in(source, start, end):
+    # offsets just past every newline in source[start:end]
+    found = []
+    index = source.find("\n", start, end)
+    while index != -1:
+        found.append(index + 1)
+        index = source.find("\n", index + 1, end)
+    return found
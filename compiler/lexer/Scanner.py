@@ -0,0 +1,201 @@
+import re
+
+from compiler.lexer.Token import Token
+from compiler.lexer.TokenType import TokenType
+
+
+# One master pattern that recognises every token class in a single regex pass.
+# Whitespace and comments are swallowed as a prefix of the following token so
+# they never cost a match of their own; the alternatives are tried in order and
+# the catch-all `other` group comes last (`end` only matches trailing blanks).
+# `\w` matches exactly str.isalnum() or '_', which is the rule the character
+# loop in Tokenizer uses for identifiers.
+MASTER_PATTERN = re.compile(r"""
+    (?:[ \t\r\n]+|//[^\n]*\n?)*
+    (?:
+      (?P<ident>[A-Za-z]\w*)
+    | (?P<number>[0-9]+)(?![0-9]|[^\x00-\x7f])
+    | "(?P<string>[^"]*)(?P<close>"?)
+    | (?P<op>[=!<>]=|[-+*/=(),:;<>{}])
+    | (?P<other>.)
+    | (?P<end>\Z)
+    )
+""", re.VERBOSE | re.DOTALL)
+
+
+OPERATORS = {
+    "==": TokenType.EQUAL_EQUAL,
+    "!=": TokenType.NOT_EQUAL,
+    ">=": TokenType.GREATER_THAN_EQUAL,
+    "<=": TokenType.LESS_THAN_EQUAL,
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "*": TokenType.STAR,
+    "/": TokenType.SLASH,
+    "=": TokenType.EQUAL,
+    "(": TokenType.LEFT_PAREN,
+    ")": TokenType.RIGHT_PAREN,
+    ",": TokenType.COMMA,
+    ":": TokenType.COLON,
+    ";": TokenType.SEMICOLON,
+    ">": TokenType.GREATER_THAN,
+    "<": TokenType.LESS_THAN,
+    "{": TokenType.BRACE_LEFT,
+    "}": TokenType.BRACE_RIGHT,
+}
+
+
+class Scanner:
+    """
+    Regex-driven scanner producing the same Token stream as the
+    character-at-a-time loop in Tokenizer.
+
+    ASCII source is handled entirely by MASTER_PATTERN. Identifiers that start
+    with a non-ASCII letter and numbers made of non-ASCII digits fall through
+    to the `other` group and are finished with the same str predicates the
+    character loop uses, so both engines agree on every input.
+    """
+
+    def __init__(self, source_code, keywords):
+        self.source_code = source_code
+        self.keywords = keywords
+        # word -> TokenType, saves a lower() + keyword lookup per identifier
+        self._word_types = {}
+
+    def scan(self):
+        return list(self.iter_tokens())
+
+    # Generator form: tokens are produced one at a time as the regex advances,
+    # so a consumer never needs the whole token list in memory. `pos` must be a
+    # token boundary (0, or the end offset of a previously scanned token).
+    def iter_tokens(self, pos=0):
+        source = self.source_code
+        length = len(source)
+        word_types = self._word_types
+        keywords = self.keywords
+        operators = OPERATORS
+        finditer = MASTER_PATTERN.finditer
+        IDENTIFIER = TokenType.IDENTIFIER
+        NUMBER = TokenType.NUMBER
+        STRING = TokenType.STRING
+
+        while pos < length:
+            resume = length
+            for match in finditer(source, pos):
+                kind = match.lastgroup
+                if kind == "ident":
+                    word = match.group("ident")
+                    token_type = word_types.get(word)
+                    if token_type is None:
+                        token_type = keywords.get(word.lower(), IDENTIFIER)
+                        word_types[word] = token_type
+                    yield Token(token_type, word, match.start("ident"), match.end())
+                elif kind == "op":
+                    lexeme = match.group("op")
+                    yield Token(operators[lexeme], lexeme, match.start("op"), match.end())
+                elif kind == "number":
+                    yield Token(NUMBER, match.group("number"), match.start("number"), match.end("number"))
+                elif kind == "close":
+                    # `close` is the last group of the string alternative
+                    text = match.group("string")
+                    if not match.group("close") and text:
+                        self._warn_unterminated(match.end(), text)
+                    yield Token(STRING, text, match.start("string") - 1, match.end())
+                elif kind == "end":
+                    break
+                else:
+                    # Anything left is either a non-ASCII letter/digit (slow
+                    # path below) or a character the language ignores.
+                    char = match.group("other")
+                    if char.isalpha() or char.isdigit():
+                        token_type, start, resume = self._scan_unicode(match.start("other"))
+                        yield Token(token_type, source[start:resume], start, resume)
+                        break
+            pos = resume
+
+        yield Token(TokenType.EOF, "End of File", length, length)
+
+    # Same scan as iter_tokens, but appends TokenType codes and (start, end)
+    # offsets to the given arrays instead of building Token objects and lexeme
+    # strings. String spans include their quotes; EOF is an empty span at the end.
+    def scan_spans(self, kinds, starts, ends):
+        source = self.source_code
+        length = len(source)
+        word_codes = {}
+        keywords = self.keywords
+        operator_codes = {lexeme: token_type.value for lexeme, token_type in OPERATORS.items()}
+        finditer = MASTER_PATTERN.finditer
+        add_kind = kinds.append
+        add_start = starts.append
+        add_end = ends.append
+        IDENTIFIER = TokenType.IDENTIFIER
+        NUMBER = TokenType.NUMBER.value
+        STRING = TokenType.STRING.value
+
+        pos = 0
+        while pos < length:
+            resume = length
+            for match in finditer(source, pos):
+                kind = match.lastgroup
+                if kind == "ident":
+                    word = match.group("ident")
+                    code = word_codes.get(word)
+                    if code is None:
+                        code = keywords.get(word.lower(), IDENTIFIER).value
+                        word_codes[word] = code
+                    add_kind(code)
+                    add_start(match.start("ident"))
+                elif kind == "op":
+                    add_kind(operator_codes[match.group("op")])
+                    add_start(match.start("op"))
+                elif kind == "number":
+                    add_kind(NUMBER)
+                    add_start(match.start("number"))
+                elif kind == "close":
+                    if not match.group("close") and match.end("string") > match.start("string"):
+                        self._warn_unterminated(match.end(), match.group("string"))
+                    add_kind(STRING)
+                    add_start(match.start("string") - 1)
+                elif kind == "end":
+                    break
+                else:
+                    char = match.group("other")
+                    if char.isalpha() or char.isdigit():
+                        token_type, start, resume = self._scan_unicode(match.start("other"))
+                        add_kind(token_type.value)
+                        add_start(start)
+                        add_end(resume)
+                        break
+                    continue
+                add_end(match.end())
+            pos = resume
+
+        add_kind(TokenType.EOF.value)
+        add_start(length)
+        add_end(length)
+
+    def _warn_unterminated(self, end, text):
+        line = self.source_code.count("\n", 0, end) + 1
+        print(f"Unterminated String at line {line}: {text}")
+
+    def _scan_unicode(self, start):
+        source = self.source_code
+        length = len(source)
+        end = start + 1
+
+        if source[start].isalpha():
+            while end < length and (source[end].isalnum() or source[end] == '_'):
+                end += 1
+            word = source[start:end]
+            return self.keywords.get(word.lower(), TokenType.IDENTIFIER), start, end
+
+        while end < length and source[end].isdigit():
+            end += 1
+        return TokenType.NUMBER, start, end
+
+
+def string_content_end(source, start, end):
+    # end offset of a string token's text: drop the closing quote when there is one
+    if end - start >= 2 and source[end - 1] == '"':
+        return end - 1
+    return end
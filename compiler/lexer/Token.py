@@ -2,9 +2,14 @@ from compiler.lexer.TokenType import TokenType
 
 
 class Token:
-    def __init__(self, type: TokenType, lexeme):
+    __slots__ = ("_type", "_lexeme", "_start", "_end")
+
+    def __init__(self, type: TokenType, lexeme, start=None, end=None):
         self._type = type
         self._lexeme = lexeme
+        # offsets of the token's text in the source (strings include their quotes)
+        self._start = start
+        self._end = end
 
     def __repr__(self):
         return f"[{self._type} : {self._lexeme}]"
@@ -39,9 +44,19 @@ class Token:
         del self._lexeme
 
 
+    #source span
+    @property
+    def start(self):
+        return self._start
 
+    @start.setter
+    def start(self, value):
+        self._start = value
 
+    @property
+    def end(self):
+        return self._end
 
-
-
-
+    @end.setter
+    def end(self, value):
+        self._end = value
@@ -0,0 +1,105 @@
+import sys
+from array import array
+
+from compiler.lexer.Scanner import Scanner, string_content_end
+from compiler.lexer.Token import Token
+from compiler.lexer.TokenType import TokenType
+
+
+# TokenType.value -> TokenType (auto() values are small ints, index 0 unused)
+TOKEN_TYPES = [None] * (max(t.value for t in TokenType) + 1)
+for _token_type in TokenType:
+    TOKEN_TYPES[_token_type.value] = _token_type
+
+EOF_LEXEME = "End of File"
+
+
+class TokenBuffer:
+    """
+    Struct-of-arrays token stream.
+
+    Token kinds are stored as TokenType values in an array('B') and each token's
+    span as start/end offsets into the original source in two array('I')s, so a
+    token costs 9 bytes instead of a Token object plus a lexeme string. Lexemes
+    are sliced out of the source only when asked for; identifier names are
+    interned so repeated uses of a name share one string.
+
+    Indexing returns a TokenView, which offers the read-only Token API, so code
+    written against a list of Tokens (including Parser) works unchanged.
+    """
+
+    def __init__(self, source_code, kinds, starts, ends):
+        self.source_code = source_code
+        self.kinds = kinds
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def from_source(cls, source_code, keywords):
+        kinds, starts, ends = array('B'), array('I'), array('I')
+        Scanner(source_code, keywords).scan_spans(kinds, starts, ends)
+        return cls(source_code, kinds, starts, ends)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("token index out of range")
+        return TokenView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield TokenView(self, index)
+
+    def __repr__(self):
+        return f"TokenBuffer({len(self.kinds)} tokens)"
+
+    def token_type(self, index):
+        return TOKEN_TYPES[self.kinds[index]]
+
+    def lexeme(self, index):
+        token_type = TOKEN_TYPES[self.kinds[index]]
+        start, end = self.starts[index], self.ends[index]
+        if token_type is TokenType.IDENTIFIER:
+            return sys.intern(self.source_code[start:end])
+        if token_type is TokenType.STRING:
+            return self.source_code[start + 1:string_content_end(self.source_code, start, end)]
+        if token_type is TokenType.EOF:
+            return EOF_LEXEME
+        return self.source_code[start:end]
+
+    def to_tokens(self):
+        return [Token(self.token_type(i), self.lexeme(i), self.starts[i], self.ends[i])
+                for i in range(len(self.kinds))]
+
+
+class TokenView(Token):
+    """Read-only Token facade over one entry of a TokenBuffer."""
+
+    __slots__ = ("_buffer", "_index")
+
+    def __init__(self, buffer, index):
+        self._buffer = buffer
+        self._index = index
+
+    def __repr__(self):
+        return f"[{self.token_type} : {self.lexeme}]"
+
+    @property
+    def token_type(self):
+        return TOKEN_TYPES[self._buffer.kinds[self._index]]
+
+    @property
+    def lexeme(self):
+        return self._buffer.lexeme(self._index)
+
+    @property
+    def start(self):
+        return self._buffer.starts[self._index]
+
+    @property
+    def end(self):
+        return self._buffer.ends[self._index]
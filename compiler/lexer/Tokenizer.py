@@ -1,4 +1,9 @@
+from bisect import bisect_left
+
+from compiler.lexer.LineIndex import LineIndex
+from compiler.lexer.Scanner import Scanner
 from compiler.lexer.Token import Token
+from compiler.lexer.TokenBuffer import TokenBuffer
 from compiler.lexer.TokenType import TokenType
 
 
@@ -7,7 +12,9 @@ class Tokenizer:
         self.source_code = source_code
         self.current_index = 0
         self.line_num = 1
+        self.token_start = 0
         self.tokens = []
+        self._line_index = None
 
 
         #Keyword hashmap
@@ -38,14 +45,88 @@ class Tokenizer:
         }
 
 
-    #Tokennize is the only public method here
+    #Tokenize runs the regex Scanner, which yields the same tokens as the character loop below
     def tokenize(self):
+        self.tokens = Scanner(self.source_code, self.keywords).scan()
+        self.current_index = len(self.source_code)
+        self.line_num = self.source_code.count("\n") + 1
+        return self.tokens
+
+    #Line-start table for the current source, built on first use
+    @property
+    def line_index(self):
+        if self._line_index is None:
+            self._line_index = LineIndex(self.source_code)
+        return self._line_index
+
+    #(line, column) of a source offset or of a token's start, both 1-based
+    def position(self, offset_or_token):
+        offset = getattr(offset_or_token, "start", offset_or_token)
+        return self.line_index.line_col(offset)
+
+    #Incremental re-lex after an edit that replaced source_code[start:end] with new_text.
+    #Only the text around the edit is rescanned; tokens after it are reused from self.tokens
+    #with their offsets shifted in place. Returns the updated token list.
+    def relex(self, start, end, new_text):
+        old_source = self.source_code
+        old_tokens = self.tokens
+        new_source = old_source[:start] + new_text + old_source[end:]
+        new_end = start + len(new_text)
+        delta = new_end - end
+
+        if self._line_index is not None:
+            self._line_index.update(new_source, start, end, new_end)
+        self.source_code = new_source
+        self.current_index = len(new_source)
+        self.line_num = self.line_num + new_text.count("\n") - old_source.count("\n", start, end)
+
+        if not old_tokens:
+            return self.tokenize()
+
+        #the scanner looks one character past a token, so only tokens ending before the edit are safe
+        first = bisect_left(old_tokens, start, key=lambda t: t.end)
+        restart = old_tokens[first - 1].end if first > 0 else 0
+
+        tokens = old_tokens[:first]
+        reused = []
+        for token in Scanner(new_source, self.keywords).iter_tokens(restart):
+            tokens.append(token)
+            if token.token_type == TokenType.EOF:
+                break
+            if token.end < new_end:
+                continue
+            #past the edit: if the old scan also had a token ending here, the rest is unchanged
+            old_end = token.end - delta
+            match = bisect_left(old_tokens, old_end, lo=first, key=lambda t: t.end)
+            if match < len(old_tokens) and old_tokens[match].end == old_end \
+                    and old_tokens[match].token_type != TokenType.EOF:
+                reused = old_tokens[match + 1:]
+                break
+
+        for token in reused:
+            token.start += delta
+            token.end += delta
+        tokens.extend(reused)
+
+        self.tokens = tokens
+        return tokens
+
+    #Lazy version of tokenize: yields tokens as they are scanned and keeps none of them in self.tokens
+    def iter_tokens(self):
+        return Scanner(self.source_code, self.keywords).iter_tokens()
+
+    #Compact form of tokenize: a TokenBuffer of kind codes and source offsets, lexemes sliced on access
+    def tokenize_buffer(self):
+        return TokenBuffer.from_source(self.source_code, self.keywords)
+
+    #Original character-at-a-time scanner, kept as the reference implementation for tests and benchmarks
+    def tokenize_by_char(self):
         while not self.__is_at_end():
             self.__scan_tokens()
 
         #passing an end of file token if there are no more token to be made
 
-        eof_token = Token(TokenType.EOF, "End of File")
+        eof_token = Token(TokenType.EOF, "End of File", self.current_index, self.current_index)
         self.tokens.append(eof_token)
         return self.tokens
 
@@ -55,6 +136,7 @@ class Tokenizer:
         if self.__is_at_end():
             return
 
+        self.token_start = self.current_index
         current_char = self.__advance()
 
         #Handling for if character is a letter, digit, or beginning of a string
@@ -73,20 +155,20 @@ class Tokenizer:
         #hande special operands
 
         if current_char == '=' and self.__peek() == '=':
-            self.tokens.append(Token(TokenType.EQUAL_EQUAL, "=="))
             self.__advance()
+            self.__add_token(TokenType.EQUAL_EQUAL, "==")
             return
         elif current_char == '!' and self.__peek() == '=':
-            self.tokens.append(Token(TokenType.NOT_EQUAL, "!="))
             self.__advance()
+            self.__add_token(TokenType.NOT_EQUAL, "!=")
             return
         elif current_char == '>' and self.__peek() == '=':
-            self.tokens.append(Token(TokenType.GREATER_THAN_EQUAL, ">="))
             self.__advance()
+            self.__add_token(TokenType.GREATER_THAN_EQUAL, ">=")
             return
         elif current_char == '<' and self.__peek() == '=':
-            self.tokens.append(Token(TokenType.LESS_THAN_EQUAL, "<="))
             self.__advance()
+            self.__add_token(TokenType.LESS_THAN_EQUAL, "<=")
             return
 
 
@@ -94,33 +176,33 @@ class Tokenizer:
 
         match current_char:
             case '+':
-                self.tokens.append(Token(TokenType.PLUS, "+"))
+                self.__add_token(TokenType.PLUS, "+")
             case '-':
-                self.tokens.append(Token(TokenType.MINUS, "-"))
+                self.__add_token(TokenType.MINUS, "-")
             case '*':
-                self.tokens.append(Token(TokenType.STAR, "*"))
+                self.__add_token(TokenType.STAR, "*")
             case '/':
-                self.tokens.append(Token(TokenType.SLASH, "/"))
+                self.__add_token(TokenType.SLASH, "/")
             case '=':
-                self.tokens.append(Token(TokenType.EQUAL, "="))
+                self.__add_token(TokenType.EQUAL, "=")
             case '(':
-                self.tokens.append(Token(TokenType.LEFT_PAREN, "("))
+                self.__add_token(TokenType.LEFT_PAREN, "(")
             case ')':
-                self.tokens.append(Token(TokenType.RIGHT_PAREN, ")"))
+                self.__add_token(TokenType.RIGHT_PAREN, ")")
             case ',':
-                self.tokens.append(Token(TokenType.COMMA, ","))
+                self.__add_token(TokenType.COMMA, ",")
             case ':':
-                self.tokens.append(Token(TokenType.COLON, ":"))
+                self.__add_token(TokenType.COLON, ":")
             case ';':
-                self.tokens.append(Token(TokenType.SEMICOLON, ";"))
+                self.__add_token(TokenType.SEMICOLON, ";")
             case '>':
-                self.tokens.append(Token(TokenType.GREATER_THAN, ">"))
+                self.__add_token(TokenType.GREATER_THAN, ">")
             case '<':
-                self.tokens.append(Token(TokenType.LESS_THAN, "<"))
+                self.__add_token(TokenType.LESS_THAN, "<")
             case '{':
-                self.tokens.append(Token(TokenType.BRACE_LEFT, "{"))
+                self.__add_token(TokenType.BRACE_LEFT, "{")
             case '}':
-                self.tokens.append(Token(TokenType.BRACE_RIGHT, "}"))
+                self.__add_token(TokenType.BRACE_RIGHT, "}")
 
 
 
@@ -134,7 +216,7 @@ class Tokenizer:
 
         token_type = self.keywords.get(word.lower(), TokenType.IDENTIFIER)
 
-        self.tokens.append(Token(token_type, word))
+        self.__add_token(token_type, word)
 
 
     def __read_string(self):
@@ -160,7 +242,7 @@ class Tokenizer:
         if not self.__is_at_end():
          self.__advance()
 
-        self.tokens.append(Token(TokenType.STRING, found_string))
+        self.__add_token(TokenType.STRING, found_string)
 
 
 
@@ -169,15 +251,12 @@ class Tokenizer:
         #Back track one chracter since we skip in 'scan_tokens'
         number = self.source_code[self.current_index - 1]
 
-        if self.__peek() == '\n':
-            self.line_num += 1
-
         #
         while not self.__is_at_end() and self.__peek().isdigit():
             number += self.__advance()
 
 
-        self.tokens.append(Token(TokenType.NUMBER, number))
+        self.__add_token(TokenType.NUMBER, number)
 
 
 
@@ -213,6 +292,9 @@ class Tokenizer:
 
 
 # Base helpers
+    def __add_token(self, token_type, lexeme):
+        self.tokens.append(Token(token_type, lexeme, self.token_start, self.current_index))
+
     def __peek(self):
         end = self.__is_at_end()
         if end:
@@ -1,4 +1,5 @@
 from .Token import Token
+from .TokenBuffer import TokenBuffer, TokenView
 from .TokenType import TokenType
 from .Tokenizer import Tokenizer
 
@@ -1,3 +1,7 @@
+import itertools
+import operator
+import time
+
 from compiler.Parser.ast import (
     Program,
     FunctionDecl,
@@ -9,8 +13,50 @@ from compiler.Parser.ast import (
     CallExpr,
     BinaryExpr,
     Literal,
+    Constant,
     Identifier,
+    InvariantExpr,
+    TypedBinaryExpr,
+    FastLoop,
 )
+from compiler.semantics.profiler import Profiler
+from compiler.semantics.purity import MISSING, FunctionMemo, analyze_purity
+from compiler.semantics.resolver import LoopEffects, classify_locals, scope_nodes
+from compiler.semantics.rope import concat, plain
+
+
+# ZLang binary operators and the Python operations that implement them
+BINARY_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+def convert_literal(value):
+    """Runtime value of a literal lexeme: numeric-looking text becomes int/float."""
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            if value.isdigit():
+                return int(value)
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+# Call epochs are unique across interpreters, so a call site cached by one
+# interpreter never looks valid to another running the same tree.
+_call_epochs = itertools.count()
 
 
 class ZLangRuntimeError(Exception):
@@ -55,36 +101,108 @@ class Interpreter:
         interp.interpret(program_ast)
     """
 
+    # whether running a program honours self.limits (see enable_limits)
+    meters_limits = True
+
     def __init__(self, input_fn=input, output_fn=print):
         self.globals = Environment()
         self.env = self.globals
         self.functions = {}
+        # changes whenever self.functions or self.squad_builtins does; CallExpr
+        # caches are keyed by it (variables never change what a call reaches)
+        self.call_epoch = next(_call_epochs)
+        # FunctionMemo for pure functions, or None (see enable_memoization)
+        self.memo = None
+        # Profiler, or None (see enable_profiling)
+        self.profiler = None
+        # RunLimits, or None (see enable_limits)
+        self.limits = None
+        # TypedBinaryExpr.kind -> operation; size-checked under a value size limit
+        self.typed_operators = TYPED_OPERATORS
+        # name -> the squad builtin a call reaches when no function has the name
+        self.squad_builtins = {}
+        # InvariantExpr -> its value in the current run of its loop
+        self.invariants = {}
         self.input_fn = input_fn
         self.output_fn = output_fn
         self._install_builtins()
 
     def interpret(self, program: Program):
+        if self.memo is not None:
+            analyze_purity(program)
+
         for decl in program.declarations:
             if isinstance(decl, FunctionDecl):
-                self.functions[decl.name] = decl
+                self._define_function(decl)
             else:
                 self._execute(decl, self.env)
 
         if "main" in self.functions:
             self._call_function("main", [])
 
+    def enable_memoization(self, maxsize=128):
+        """Cache the outcome of pure function calls in per-function LRUs of `maxsize` entries."""
+        self.memo = FunctionMemo(maxsize)
+
+    def enable_profiling(self, clock=time.perf_counter):
+        """Record per-function times and per-statement counts in self.profiler."""
+        self.profiler = Profiler(clock).attach(self)
+        return self.profiler
+
+    def enable_limits(self, max_steps=None, timeout=None, max_value_size=None, clock=time.monotonic):
+        """
+        Stop the run with LimitExceeded after `max_steps` loop iterations and
+        calls, `timeout` seconds from now, or before building a value larger
+        than `max_value_size` (see compiler.semantics.limits). Raises
+        NotImplementedError on backends that would not enforce them.
+        """
+        if not self.meters_limits:
+            raise NotImplementedError(f"{type(self).__name__} does not enforce run limits.")
+        from compiler.semantics.limits import RunLimits
+
+        self.limits = RunLimits(max_steps, timeout, max_value_size, clock)
+        self.typed_operators = self.limits.checked_operators(TYPED_OPERATORS)
+        from compiler.semantics.squad import metered_builtins
+
+        self._install_squad_builtins(metered_builtins(self.limits))
+        return self.limits
+
+    def _define_function(self, decl):
+        self.functions[decl.name] = decl
+        self.call_epoch = next(_call_epochs)
+
     def _install_builtins(self):
         def _builtin_say(args):
             # say("hello"), say("a", "b") etc.
-            self.output_fn(*args)
+            self.output_fn(*map(plain, args))
 
         def _builtin_spill(args):
             # spill("prompt") -> string input
             prompt = str(args[0]) if args else ""
+            self._flush_output()
             return self.input_fn(prompt)
 
         self.globals.define("say", _builtin_say)
         self.globals.define("spill", _builtin_spill)
+        self._install_squad_builtins()
+
+    def _install_squad_builtins(self, builtins=None):
+        """Make calls reach `builtins` (default SQUAD_BUILTINS) in place of the squad builtins before."""
+        if builtins is None:
+            from compiler.semantics.squad import SQUAD_BUILTINS
+
+            builtins = SQUAD_BUILTINS
+        # unlike say and spill these are not globals: they can only be
+        # called, and a user function of the same name replaces them
+        self.squad_builtins = builtins
+        self.call_epoch = next(_call_epochs)
+
+    def _flush_output(self):
+        # a buffered output_fn (see compiler.semantics.output) must show
+        # everything said so far before input is read
+        flush = getattr(self.output_fn, "flush", None)
+        if flush is not None:
+            flush()
 
     def _execute(self, node, env):
         if isinstance(node, VarDecl):
@@ -105,7 +223,13 @@ class Interpreter:
                     self._execute(stmt, env)
 
         elif isinstance(node, WhileStmt):
+            if type(node) is FastLoop:
+                self._execute_fast_loop(node, env)
+                return
+            limits = self.limits
             while self._truthy(self._evaluate(node.condition, env)):
+                if limits is not None:
+                    limits.step()
                 for stmt in node.body:
                     self._execute(stmt, env)
 
@@ -114,7 +238,7 @@ class Interpreter:
 
         elif isinstance(node, FunctionDecl):
             # Allow nested declarations too.
-            self.functions[node.name] = node
+            self._define_function(node)
 
         elif isinstance(node, Program):
             self.interpret(node)
@@ -126,6 +250,9 @@ class Interpreter:
             raise ZLangRuntimeError(f"Cannot execute node type: {type(node).__name__}")
 
     def _evaluate(self, expr, env):
+        if isinstance(expr, Constant):
+            return expr.value
+
         if isinstance(expr, Literal):
             return self._convert_literal(expr.value)
 
@@ -133,13 +260,21 @@ class Interpreter:
             return env.get(expr.name)
 
         if isinstance(expr, BinaryExpr):
+            kind = type(expr)
+            if kind is TypedBinaryExpr:
+                # operand types are known: no operator dispatch
+                return self.typed_operators[expr.kind](self._evaluate(expr.left, env), self._evaluate(expr.right, env))
+            if kind is InvariantExpr:
+                return self._evaluate_invariant(expr, env)
             left = self._evaluate(expr.left, env)
             right = self._evaluate(expr.right, env)
             op = expr.operator
+            if self.limits is not None:
+                return self.limits.apply(op, left, right)
 
             # Arithmetic
             if op == "+":
-                return left + right
+                return concat(left, right)
             if op == "-":
                 return left - right
             if op == "*":
@@ -169,26 +304,123 @@ class Interpreter:
             if not isinstance(callee, Identifier):
                 raise ZLangRuntimeError("Can only call named functions.")
 
-            name = callee.name
             args = [self._evaluate(a, env) for a in expr.args]
 
-            try:
-                builtin = self.globals.get(name)
-            except ZLangRuntimeError:
-                builtin = None
-
-            if callable(builtin):
-                return builtin(args)
+            # inline cache: resolve the callee once per call epoch
+            if expr.target_epoch != self.call_epoch:
+                expr.target = self._resolve_call(callee.name)
+                expr.target_epoch = self.call_epoch
+            target = expr.target
 
-            return self._call_function(name, args)
+            if isinstance(target, FunctionDecl):
+                return self._run_function(target, args)
+            if target is None:
+                raise ZLangRuntimeError(f"Undefined function '{callee.name}'")
+            return target(args)
 
         raise ZLangRuntimeError(f"Unknown expression node: {type(expr).__name__}")
 
+    def _execute_fast_loop(self, node, env):
+        if not node.invariants:
+            self._run_fast_loop(node, env)
+            return
+        # each run of the loop computes its invariants afresh; a call made by
+        # the loop can run the same loop, so the values cached for this run
+        # are put back once that one ends
+        invariants = self.invariants
+        saved = [invariants.pop(invariant, MISSING) for invariant in node.invariants]
+        try:
+            self._run_fast_loop(node, env)
+        finally:
+            for invariant, value in zip(node.invariants, saved):
+                if value is MISSING:
+                    invariants.pop(invariant, None)
+                else:
+                    invariants[invariant] = value
+
+    def _run_fast_loop(self, node, env):
+        limits = self.limits
+        if node.counter is None:
+            while self._truthy(self._evaluate(node.condition, env)):
+                if limits is not None:
+                    limits.step()
+                for stmt in node.body:
+                    self._execute(stmt, env)
+            return
+
+        # Counter loop: the counter lives in a Python local and is written
+        # back after each step; the bound is invariant, so it is read once.
+        name = node.counter
+        counter = env.get(name)
+        scope = env
+        while name not in scope.values:
+            scope = scope.enclosing
+        counter_values = scope.values
+        bound = self._evaluate(node.bound, env)
+        compare = BINARY_OPERATORS[node.condition.operator]
+        step = BINARY_OPERATORS[node.step_operator]
+        step_value = node.step
+        body = node.body[:-1]
+
+        while compare(counter, bound):
+            if limits is not None:
+                limits.step()
+            for stmt in body:
+                self._execute(stmt, env)
+            counter = step(counter, step_value)
+            counter_values[name] = counter
+
+    def _evaluate_invariant(self, expr, env):
+        # computed on first use within a run of its loop, then reused
+        value = self.invariants.get(expr, MISSING)
+        if value is not MISSING:
+            return value
+        left = self._evaluate(expr.left, env)
+        right = self._evaluate(expr.right, env)
+        if self.limits is not None:
+            value = self.limits.apply(expr.operator, left, right)
+        else:
+            value = BINARY_OPERATORS[expr.operator](left, right)
+        self.invariants[expr] = value
+        return value
+
+    def _resolve_call(self, name):
+        """The builtin or FunctionDecl a call to `name` reaches, or None."""
+        builtin = self.globals.values.get(name)
+        if callable(builtin):
+            return builtin
+        func = self.functions.get(name)
+        if func is None:
+            return self.squad_builtins.get(name)
+        return func
+
     def _call_function(self, name, arg_values):
         func = self.functions.get(name)
         if func is None:
-            raise ZLangRuntimeError(f"Undefined function '{name}'")
+            return self._call_squad_builtin(name, arg_values)
+        return self._run_function(func, arg_values)
 
+    def _call_squad_builtin(self, name, arg_values):
+        # what a call to `name` does when no function has that name
+        builtin = self.squad_builtins.get(name)
+        if builtin is None:
+            raise ZLangRuntimeError(f"Undefined function '{name}'")
+        return builtin(arg_values)
+
+    def _run_function(self, func, arg_values):
+        if self.memo is not None and func.pure:
+            state = self._memo_state(func.global_reads)
+            return self.memo.call(func, arg_values, state, self._enter_function)
+        return self._enter_function(func, arg_values)
+
+    def _memo_state(self, names):
+        # current values of the globals a pure function reads
+        values = self.globals.values
+        return tuple(values.get(name, MISSING) for name in names)
+
+    def _enter_function(self, func, arg_values):
+        if self.limits is not None:
+            self.limits.step()
         local_env = Environment(self.globals)
         previous_env = self.env
         try:
@@ -200,17 +432,294 @@ class Interpreter:
 
         return None
 
-    def _convert_literal(self, value):
-        if isinstance(value, (int, float)):
-            return value
-        if isinstance(value, str):
-            try:
-                if value.isdigit():
-                    return int(value)
-                return float(value)
-            except ValueError:
-                return value
-        return value
+    _convert_literal = staticmethod(convert_literal)
 
     def _truthy(self, value):
         return bool(value)
+
+
+# --- Static types ---
+INT = "int"
+FLOAT = "float"
+STRING = "string"
+BOOL = "bool"
+NONE = "none"
+SQUAD = "squad"
+
+NUMERIC_TYPES = (INT, FLOAT, BOOL)
+COMPARISON_OPERATORS = ("<", "<=", ">", ">=")
+# builtins and the type of their result (None: int or float, depending on the squad)
+BUILTIN_RESULT_TYPES = {
+    "say": NONE,
+    "spill": STRING,
+    # see compiler.semantics.squad
+    "squad": SQUAD,
+    "range": SQUAD,
+    "slice": SQUAD,
+    "len": INT,
+    "sum": None,
+    "min": None,
+    "max": None,
+    "at": None,
+}
+
+
+def type_of(value):
+    """Static type of a runtime value, or None when ZLang has no name for it."""
+    if isinstance(value, bool):
+        return BOOL
+    if isinstance(value, int):
+        return INT
+    if isinstance(value, float):
+        return FLOAT
+    if isinstance(value, str):
+        return STRING
+    if value is None:
+        return NONE
+    return None
+
+
+def binary_result_type(op, left, right):
+    """
+    Type of `left op right` for operand types `left` and `right`, or None when
+    the operation raises for every pair of values of those types.
+    """
+    if SQUAD in (left, right):
+        # element-wise with a number or another squad
+        other = right if left == SQUAD else left
+        if other == SQUAD or other in NUMERIC_TYPES:
+            return SQUAD
+        return BOOL if op in ("==", "!=") else None
+    if op in ("==", "!="):
+        return BOOL
+    if left in NUMERIC_TYPES and right in NUMERIC_TYPES:
+        if op in COMPARISON_OPERATORS:
+            return BOOL
+        if op == "/" or FLOAT in (left, right):
+            return FLOAT
+        return INT
+    if left == STRING and right == STRING:
+        if op in COMPARISON_OPERATORS:
+            return BOOL
+        return STRING if op == "+" else None
+    if op == "*" and STRING in (left, right) and (left in (INT, BOOL) or right in (INT, BOOL)):
+        return STRING
+    return None
+
+
+# TypedBinaryExpr.kind -> the operation it performs
+TYPED_OPERATORS = {
+    f"{left}{op}{right}": fn
+    for op, fn in BINARY_OPERATORS.items()
+    for left in (INT, FLOAT, STRING, BOOL, NONE, SQUAD)
+    for right in (INT, FLOAT, STRING, BOOL, NONE, SQUAD)
+    if binary_result_type(op, left, right) is not None
+}
+# long strings are built lazily (see compiler.semantics.rope)
+TYPED_OPERATORS[f"{STRING}+{STRING}"] = concat
+
+
+class TypeCheckError(Exception):
+    def __init__(self, errors):
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+def infer_types(program: Program, specialize=True):
+    """
+    Infer static types through `program`; returns the type errors it found.
+
+    With `specialize`, every BinaryExpr whose operand types are known is
+    replaced by a TypedBinaryExpr of the matching kind. The errors are also
+    kept on the program, so check_types does not infer them again.
+    """
+    program.type_errors = TypeInference(specialize).infer(program)
+    return program.type_errors
+
+
+def check_types(program: Program):
+    """Raise TypeCheckError if some operation in `program` can only fail."""
+    errors = program.type_errors
+    if errors is None:
+        errors = TypeInference(specialize=False).infer(program)
+    if errors:
+        raise TypeCheckError(errors)
+    return program
+
+
+class TypeInference:
+    """
+    Flow-sensitive type inference over int, float, string, bool and none.
+
+    Statements are followed in execution order with a map from variable name to
+    the type a read of that name would produce; names missing from the map have
+    an unknown type. The two arms of an `if` are joined (a name keeps its type
+    only if both arms agree) and a `yap` body is iterated to a fixed point
+    before it is specialized. Function bodies start from an empty map, since a
+    function can run at any time, and a call to a user function forgets every
+    name that is not a plain local of the enclosing function, since the callee
+    may assign it.
+
+    An operation whose operand types are known but unsupported (say string -
+    int) is a type error: it raises whenever it runs.
+    """
+
+    def __init__(self, specialize=True):
+        self.specialize = specialize
+        self.errors = []
+        self.functions = set()
+        self.effects = LoopEffects(BUILTIN_RESULT_TYPES)
+        self.where = "top level"
+
+    def infer(self, program: Program):
+        functions = [node for node in scope_nodes(program, skip=()) if isinstance(node, FunctionDecl)]
+        self.functions = {func.name for func in functions}
+        self.effects = LoopEffects(set(BUILTIN_RESULT_TYPES) - self.functions)
+
+        self.where = "top level"
+        self._block(program.declarations, {}, frozenset(), True)
+        for func in functions:
+            plain, _ = classify_locals(func.body)
+            self.where = f"{func.name}()"
+            self._block(func.body, {}, frozenset(plain), True)
+        return list(dict.fromkeys(self.errors))
+
+    # --- Statements ---
+    def _block(self, stmts, types, plain, emit):
+        for stmt in stmts:
+            self._statement(stmt, types, plain, emit)
+
+    def _statement(self, stmt, types, plain, emit):
+        if isinstance(stmt, (VarDecl, Assign)):
+            value = stmt.initializer if isinstance(stmt, VarDecl) else stmt.value
+            value, value_type = self._expression(value, types, plain, emit)
+            if emit:
+                if isinstance(stmt, VarDecl):
+                    stmt.initializer = value
+                else:
+                    stmt.value = value
+            self._set(types, stmt.name, value_type)
+
+        elif isinstance(stmt, ExprStmt):
+            expression, _ = self._expression(stmt.expression, types, plain, emit)
+            if emit:
+                stmt.expression = expression
+
+        elif isinstance(stmt, IfStmt):
+            condition, _ = self._expression(stmt.condition, types, plain, emit)
+            if emit:
+                stmt.condition = condition
+            then_types = dict(types)
+            else_types = dict(types)
+            self._block(stmt.then_branch, then_types, plain, emit)
+            self._block(stmt.else_branch, else_types, plain, emit)
+            joined = _join(then_types, else_types)
+            types.clear()
+            types.update(joined)
+
+        elif isinstance(stmt, WhileStmt):
+            if not emit:
+                # a loop nested in one whose fixed point is being computed: forget
+                # whatever it may change rather than iterating it too, which
+                # would take time exponential in the nesting depth
+                names, calls = self.effects.of(stmt)
+                for name in names:
+                    types.pop(name, None)
+                if calls:
+                    _forget_globals(types, plain)
+                return
+            # the loop head sees both the entry state and every state after the body
+            entry = dict(types)
+            while True:
+                trial = dict(entry)
+                self._expression(stmt.condition, trial, plain, False)
+                self._block(stmt.body, trial, plain, False)
+                joined = _join(entry, trial)
+                if joined == entry:
+                    break
+                entry = joined
+            condition, _ = self._expression(stmt.condition, entry, plain, emit)
+            if emit:
+                stmt.condition = condition
+            self._block(stmt.body, dict(entry), plain, emit)
+            types.clear()
+            types.update(entry)
+
+        elif isinstance(stmt, Program):
+            # a nested program runs arbitrary top-level code
+            _forget_globals(types, plain)
+
+    def _set(self, types, name, value_type):
+        if value_type is None:
+            types.pop(name, None)
+        else:
+            types[name] = value_type
+
+    # --- Expressions ---
+    def _expression(self, expr, types, plain, emit):
+        """(expr, type): `expr`, specialized when emitting, and its type or None."""
+        if isinstance(expr, BinaryExpr):
+            # left-deep chains are walked iteratively, as in the optimizer
+            spine = []
+            while isinstance(expr, BinaryExpr):
+                spine.append(expr)
+                expr = expr.left
+            result, result_type = self._expression(expr, types, plain, emit)
+            for binary in reversed(spine):
+                right, right_type = self._expression(binary.right, types, plain, emit)
+                left_type = result_type
+                result_type = self._binary(binary.operator, left_type, right_type, emit)
+                if emit:
+                    binary.left = result
+                    binary.right = right
+                    if self.specialize and result_type is not None and type(binary) is BinaryExpr:
+                        binary = TypedBinaryExpr(binary.left, binary.operator, binary.right,
+                                                 f"{left_type}{binary.operator}{right_type}", result_type)
+                result = binary
+            return result, result_type
+
+        if isinstance(expr, Constant):
+            return expr, type_of(expr.value)
+
+        if isinstance(expr, Literal):
+            return expr, type_of(convert_literal(expr.value))
+
+        if isinstance(expr, Identifier):
+            return expr, types.get(expr.name)
+
+        if isinstance(expr, CallExpr):
+            args = [self._expression(arg, types, plain, emit)[0] for arg in expr.args]
+            if emit:
+                expr.args = args
+            if not isinstance(expr.callee, Identifier):
+                return expr, None
+            name = expr.callee.name
+            if name in self.functions:
+                _forget_globals(types, plain)
+                # ZLang functions have no return values, but a call made
+                # before a function named after a builtin is declared still
+                # reaches the builtin
+                return expr, None if name in BUILTIN_RESULT_TYPES else NONE
+            if name in BUILTIN_RESULT_TYPES:
+                return expr, BUILTIN_RESULT_TYPES[name]
+            return expr, None
+
+        return expr, None
+
+    def _binary(self, op, left_type, right_type, emit):
+        if left_type is None or right_type is None or op not in BINARY_OPERATORS:
+            return None
+        result_type = binary_result_type(op, left_type, right_type)
+        if result_type is None and emit:
+            self.errors.append(f"{self.where}: cannot apply '{op}' to {left_type} and {right_type}.")
+        return result_type
+
+
+def _join(left, right):
+    return {name: value_type for name, value_type in left.items() if right.get(name) == value_type}
+
+
+def _forget_globals(types, plain):
+    for name in list(types):
+        if name not in plain:
+            del types[name]
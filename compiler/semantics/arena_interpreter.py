@@ -0,0 +1,170 @@
+from compiler.Parser.arena import (
+    NONE,
+    PROGRAM,
+    FUNCTION_DECL,
+    VAR_DECL,
+    ASSIGN,
+    IF_STMT,
+    WHILE_STMT,
+    EXPR_STMT,
+    CALL_EXPR,
+    BINARY_EXPR,
+    LITERAL,
+    IDENTIFIER,
+    KIND_NAMES,
+)
+from compiler.semantics.analyzer import Environment, Interpreter, ZLangRuntimeError
+from compiler.semantics.rope import concat
+
+
+class ArenaInterpreter(Interpreter):
+    """
+    Tree-walk interpreter over an AstArena (see compiler.Parser.arena).
+
+    Mirrors Interpreter statement for statement, but nodes are indices into the
+    arena's arrays and `self.functions` maps names to FunctionDecl indices.
+
+    Usage:
+        arena = Parser(tokens, nodes=ArenaBuilder()).parse()
+        ArenaInterpreter().interpret(arena)
+    """
+
+    meters_limits = False
+
+    def interpret(self, arena):
+        self.arena = arena
+        kinds, payloads = arena.kinds, arena.payloads
+        for decl in arena.items(arena.a[arena.root]):
+            if kinds[decl] == FUNCTION_DECL:
+                self._define_arena_function(decl)
+            else:
+                self._execute(decl, self.env)
+
+        if "main" in self.functions:
+            self._call_function("main", [])
+
+    def _define_arena_function(self, decl):
+        name = self.arena.payloads[self.arena.a[decl]]
+        self.functions[name] = decl
+
+    def _execute(self, node, env):
+        arena = self.arena
+        kind = arena.kinds[node]
+
+        if kind == EXPR_STMT:
+            self._evaluate(arena.a[node], env)
+
+        elif kind == ASSIGN:
+            value = self._evaluate(arena.b[node], env)
+            env.assign(arena.payloads[arena.a[node]], value)
+
+        elif kind == VAR_DECL:
+            value = self._evaluate(arena.b[node], env)
+            env.define(arena.payloads[arena.a[node]], value)
+
+        elif kind == IF_STMT:
+            cond_val = self._evaluate(arena.a[node], env)
+            if self._truthy(cond_val):
+                for stmt in arena.items(arena.b[node]):
+                    self._execute(stmt, env)
+            else:
+                for stmt in arena.items(arena.c[node]):
+                    self._execute(stmt, env)
+
+        elif kind == WHILE_STMT:
+            condition = arena.a[node]
+            body = arena.items(arena.b[node])
+            while self._truthy(self._evaluate(condition, env)):
+                for stmt in body:
+                    self._execute(stmt, env)
+
+        elif kind == FUNCTION_DECL:
+            self._define_arena_function(node)
+
+        elif kind == PROGRAM:
+            self.interpret(arena)
+
+        elif kind == NONE:
+            return
+
+        else:
+            raise ZLangRuntimeError(f"Cannot execute node type: {KIND_NAMES[kind]}")
+
+    def _evaluate(self, expr, env):
+        arena = self.arena
+        kind = arena.kinds[expr]
+
+        if kind == LITERAL:
+            return self._convert_literal(arena.payloads[arena.a[expr]])
+
+        if kind == IDENTIFIER:
+            return env.get(arena.payloads[arena.a[expr]])
+
+        if kind == BINARY_EXPR:
+            left = self._evaluate(arena.a[expr], env)
+            right = self._evaluate(arena.c[expr], env)
+            return self._binary(arena.payloads[arena.b[expr]], left, right)
+
+        if kind == CALL_EXPR:
+            callee = arena.a[expr]
+            if arena.kinds[callee] != IDENTIFIER:
+                raise ZLangRuntimeError("Can only call named functions.")
+
+            name = arena.payloads[arena.a[callee]]
+            args = [self._evaluate(a, env) for a in arena.items(arena.b[expr])]
+
+            try:
+                builtin = self.globals.get(name)
+            except ZLangRuntimeError:
+                builtin = None
+
+            if callable(builtin):
+                return builtin(args)
+
+            return self._call_function(name, args)
+
+        raise ZLangRuntimeError(f"Unknown expression node: {KIND_NAMES[kind]}")
+
+    def _binary(self, op, left, right):
+        # Arithmetic
+        if op == "+":
+            return concat(left, right)
+        if op == "-":
+            return left - right
+        if op == "*":
+            return left * right
+        if op == "/":
+            return left / right
+
+        # Comparisons
+        if op == "==":
+            return left == right
+        if op == "!=":
+            return left != right
+        if op == ">":
+            return left > right
+        if op == ">=":
+            return left >= right
+        if op == "<":
+            return left < right
+        if op == "<=":
+            return left <= right
+
+        raise ZLangRuntimeError(f"Unknown binary operator '{op}'")
+
+    def _call_function(self, name, arg_values):
+        func = self.functions.get(name)
+        if func is None:
+            return self._call_squad_builtin(name, arg_values)
+
+        arena = self.arena
+        local_env = Environment(self.globals)
+        previous_env = self.env
+        try:
+            self.env = local_env
+            for stmt in arena.items(arena.b[func]):
+                self._execute(stmt, self.env)
+        finally:
+            self.env = previous_env
+
+        return None
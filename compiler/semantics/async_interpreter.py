@@ -0,0 +1,79 @@
+"""
+Asynchronous ZLang sessions for asyncio.
+
+AsyncInterpreter runs a program as a coroutine: `spill` awaits its input_fn
+and `say` awaits its output_fn (plain functions work too), so one event loop
+can drive many concurrent sessions. It is built on StackInterpreter, whose run
+loop suspends at every builtin call instead of calling it; here the builtin is
+awaited and the loop resumed with its result. A session also hands the event
+loop back every `time_slice` loop iterations and function calls, so a busy
+session never starves the others.
+
+Usage:
+    async def read(prompt):
+        return await queue.get()
+
+    async def write(*args):
+        await client.send(" ".join(map(str, args)))
+
+    await AsyncInterpreter(input_fn=read, output_fn=write).run(program_ast)
+"""
+
+import asyncio
+import inspect
+
+from compiler.Parser.ast import Program
+from compiler.semantics.rope import plain
+from compiler.semantics.stack_interpreter import StackInterpreter
+
+
+# loop iterations and calls a session runs before letting other sessions in
+DEFAULT_TIME_SLICE = 1000
+
+
+class AsyncInterpreter(StackInterpreter):
+    def __init__(self, input_fn=input, output_fn=print, time_slice=DEFAULT_TIME_SLICE):
+        super().__init__(input_fn, output_fn)
+        self.time_slice = time_slice
+
+    def interpret(self, program: Program):
+        # for callers outside an event loop
+        asyncio.run(self.run(program))
+
+    async def run(self, program: Program):
+        """Run `program` to completion in this session."""
+        steps = self._program_steps(program)
+        try:
+            request = next(steps)
+            while True:
+                if request is None:
+                    await asyncio.sleep(0)
+                    request = steps.send(None)
+                    continue
+                target, args = request
+                result = target(args)
+                if inspect.isawaitable(result):
+                    result = await result
+                request = steps.send(result)
+        except StopIteration:
+            return None
+        finally:
+            steps.close()
+
+    def _install_builtins(self):
+        async def _builtin_say(args):
+            result = self.output_fn(*map(plain, args))
+            if inspect.isawaitable(result):
+                await result
+
+        async def _builtin_spill(args):
+            prompt = str(args[0]) if args else ""
+            self._flush_output()
+            result = self.input_fn(prompt)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        self.globals.define("say", _builtin_say)
+        self.globals.define("spill", _builtin_spill)
+        self._install_squad_builtins()
@@ -0,0 +1,189 @@
+"""
+Resource limits for running untrusted ZLang programs.
+
+RunLimits meters a run three ways:
+
+  * steps: every loop iteration and every user function call costs one step,
+    as does every squad element built, combined or reduced, and the run stops
+    once `max_steps` have been taken;
+  * time: the run stops once `timeout` seconds have passed since the limits
+    were enabled;
+  * value size: a string longer than `max_value_size` characters, or an
+    integer or squad of more than `max_value_size` bytes (8 per element), is
+    never built. `+`, `-` and `*` are the only operators that make values
+    bigger (a difference of integers can be as large as their sum), so they
+    are the ones checked, and a product or repetition is checked before it
+    is computed; squad() and range() check the squads they build.
+
+Exhausting any of them raises LimitExceeded, a ZLangRuntimeError whose
+`limit` says which one ("steps", "time" or "size").
+
+A step is a decrement and a compare. The step budget and the clock are only
+looked at every CHECK_INTERVAL steps, or sooner when fewer steps are left.
+Interpreters without limits (the default) meter nothing.
+
+Usage:
+    interp = Interpreter()
+    interp.enable_limits(max_steps=1_000_000, timeout=2.0, max_value_size=1 << 20)
+    try:
+        interp.interpret(program_ast)
+    except LimitExceeded as e:
+        print(e.limit, e)
+"""
+
+import functools
+import string
+import time
+
+from compiler.semantics.analyzer import BINARY_OPERATORS, SQUAD, ZLangRuntimeError
+from compiler.semantics.rope import STRING_TYPES, concat
+from compiler.semantics.squad import Squad
+
+
+# steps taken between two looks at the budget and the clock
+CHECK_INTERVAL = 1024
+# bytes per squad element
+ELEMENT_SIZE = 8
+
+
+class LimitExceeded(ZLangRuntimeError):
+    """A run used up its step budget, its time or its value size limit."""
+
+    def __init__(self, limit, message):
+        super().__init__(message)
+        self.limit = limit
+
+
+class RunLimits:
+    def __init__(self, max_steps=None, timeout=None, max_value_size=None, clock=time.monotonic):
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.max_value_size = max_value_size
+        self.clock = clock
+        self.deadline = None if timeout is None else clock() + timeout
+        # steps accounted for by earlier checks, and how many the current
+        # countdown started from
+        self._used = 0
+        self._period = self._next_period()
+        self.countdown = self._period
+
+    @property
+    def steps(self):
+        """Steps taken so far."""
+        return self._used + self._period - self.countdown
+
+    def step(self):
+        self.countdown -= 1
+        if self.countdown <= 0:
+            self._check()
+
+    def charge(self, steps):
+        """Take `steps` steps at once."""
+        self.countdown -= steps
+        if self.countdown <= 0:
+            self._check()
+
+    def _check(self):
+        # charge() can overshoot the countdown
+        self._used += self._period - self.countdown
+        self._period = self.countdown = 0
+        if self.max_steps is not None and self._used > self.max_steps:
+            raise LimitExceeded("steps", f"Step budget of {self.max_steps} exhausted.")
+        if self.deadline is not None and self.clock() > self.deadline:
+            raise LimitExceeded("time", f"Time limit of {self.timeout}s exceeded.")
+        self._period = self.countdown = self._next_period()
+
+    def _next_period(self):
+        if self.max_steps is None:
+            return CHECK_INTERVAL
+        # the check must run on the first step past the budget
+        return max(1, min(CHECK_INTERVAL, self.max_steps + 1 - self._used))
+
+    # --- value size ---
+
+    def apply(self, op, left, right):
+        """left `op` right, for the ZLang binary operator `op`, size-checked and metered."""
+        if op == "+":
+            return self.add(left, right)
+        if op == "-":
+            return self.subtract(left, right)
+        if op == "*":
+            return self.multiply(left, right)
+        fn = BINARY_OPERATORS.get(op)
+        if fn is None:
+            raise ZLangRuntimeError(f"Unknown binary operator '{op}'")
+        self._squad_work(left, right)
+        return fn(left, right)
+
+    def add(self, left, right):
+        if isinstance(left, STRING_TYPES) and isinstance(right, STRING_TYPES):
+            self._fits(len(left) + len(right))
+            return concat(left, right)
+        self._squad_work(left, right)
+        result = left + right
+        if isinstance(result, int):
+            self._fits(_int_size(result))
+        return result
+
+    def subtract(self, left, right):
+        self._squad_work(left, right)
+        result = left - right
+        if isinstance(result, int):
+            self._fits(_int_size(result))
+        return result
+
+    def multiply(self, left, right):
+        if isinstance(left, STRING_TYPES) or isinstance(right, STRING_TYPES):
+            text, count = (left, right) if isinstance(left, STRING_TYPES) else (right, left)
+            if isinstance(count, int):
+                self._fits(len(text) * max(count, 0))
+        elif isinstance(left, int) and isinstance(right, int):
+            # a product has at most as many bytes as its factors together
+            self._fits(_int_size(left) + _int_size(right))
+        else:
+            self._squad_work(left, right)
+        return left * right
+
+    def elements(self, count):
+        """Account for building or walking a squad of `count` elements."""
+        self._fits(count * ELEMENT_SIZE)
+        self.charge(count)
+
+    def _squad_work(self, left, right):
+        # an element-wise operation builds a squad as long as its operands
+        if type(left) is Squad:
+            self.elements(len(left))
+        elif type(right) is Squad:
+            self.elements(len(right))
+
+    def checked_operators(self, operators):
+        """
+        A copy of an operator table (see TYPED_OPERATORS) whose squad operations
+        are metered and, under a value size limit, whose `+`, `-` and `*` are
+        size-checked.
+        """
+        checked = {}
+        for kind, fn in operators.items():
+            if SQUAD in kind:
+                # a kind is the operator between two type names
+                fn = functools.partial(self.apply, kind.strip(string.ascii_lowercase))
+            elif self.max_value_size is None:
+                pass
+            elif "+" in kind:
+                fn = self.add
+            elif "-" in kind:
+                fn = self.subtract
+            elif "*" in kind:
+                fn = self.multiply
+            checked[kind] = fn
+        return checked
+
+    def _fits(self, size):
+        if self.max_value_size is not None and size > self.max_value_size:
+            raise LimitExceeded(
+                "size", f"A value of size {size} would exceed the size limit of {self.max_value_size}."
+            )
+
+
+def _int_size(value):
+    return (value.bit_length() + 7) // 8
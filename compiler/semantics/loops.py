@@ -0,0 +1,186 @@
+"""
+Loop optimizations for `yap`.
+
+optimize_loops(program) rewrites WhileStmt nodes in place:
+
+  * Loop-invariant hoisting: a maximal call-free BinaryExpr in a loop (but not
+    in a loop nested in it, which hoists its own) whose variables cannot
+    change while the loop runs becomes an InvariantExpr. It
+    is evaluated the first time the loop needs it and reused for the rest of
+    that run of the loop, so it is computed at most once per loop entry and
+    any error it raises still surfaces at exactly the original point.
+  * Counter loops: `yap i < bound { ...  i = i + step }`, where `i` changes
+    only through that final statement and `bound` is invariant, become a
+    FastLoop the Interpreter runs with the counter held in a Python local:
+    no condition tree, no increment statement dispatch.
+
+Both node types subclass the nodes they replace, so every other backend
+simply executes them as ordinary BinaryExpr/WhileStmt nodes.
+
+A variable counts as changing inside a loop when the loop assigns or `lit`s
+it, or when the loop calls a user function and the variable is not a plain
+local of the enclosing function (a callee can assign any global).
+"""
+
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    VarDecl,
+    Assign,
+    IfStmt,
+    WhileStmt,
+    ExprStmt,
+    CallExpr,
+    BinaryExpr,
+    Constant,
+    Identifier,
+    InvariantExpr,
+    FastLoop,
+)
+from compiler.semantics.analyzer import BINARY_OPERATORS, BUILTIN_RESULT_TYPES
+from compiler.semantics.resolver import LoopEffects, classify_locals, scope_nodes
+
+
+COUNTER_COMPARISONS = ("<", "<=", ">", ">=", "!=")
+COUNTER_STEPS = ("+", "-")
+# builtins that assign no variables
+EFFECT_FREE_BUILTINS = tuple(BUILTIN_RESULT_TYPES)
+
+
+def optimize_loops(program: Program):
+    return LoopOptimizer().optimize(program)
+
+
+class LoopOptimizer:
+    def __init__(self):
+        self.effects = LoopEffects(EFFECT_FREE_BUILTINS)
+
+    def optimize(self, program: Program):
+        # a user function named after a builtin may assign anything
+        functions = {node.name for node in scope_nodes(program, skip=()) if isinstance(node, FunctionDecl)}
+        self.effects = LoopEffects(set(EFFECT_FREE_BUILTINS) - functions)
+        self._block(program.declarations, frozenset())
+        for node in scope_nodes(program, skip=()):
+            if isinstance(node, FunctionDecl):
+                plain, _ = classify_locals(node.body)
+                self._block(node.body, frozenset(plain))
+        return program
+
+    def _block(self, stmts, plain_locals):
+        for index, stmt in enumerate(stmts):
+            if isinstance(stmt, WhileStmt):
+                stmts[index] = self._loop(stmt, plain_locals)
+            elif isinstance(stmt, IfStmt):
+                self._block(stmt.then_branch, plain_locals)
+                self._block(stmt.else_branch, plain_locals)
+
+    def _loop(self, loop, plain_locals):
+        changing, calls_user_function = self.effects.of(loop)
+
+        def private(name):
+            # no function called from the loop can change it
+            return not calls_user_function or name in plain_locals
+
+        def invariant(name):
+            return name not in changing and private(name)
+
+        # nested loops are left to hoist their own invariants
+        hoisted = []
+        loop.condition = self._hoist(loop.condition, invariant, hoisted)
+        for node in scope_nodes(loop.body, skip=(FunctionDecl, Program, WhileStmt)):
+            self._hoist_children(node, invariant, hoisted)
+
+        optimized = self._counter_loop(loop, hoisted, invariant, private)
+        self._block(optimized.body, plain_locals)
+        return optimized
+
+    def _counter_loop(self, loop, hoisted, invariant, private):
+        condition = loop.condition
+        body = loop.body
+        plain = FastLoop(condition, body, tuple(hoisted)) if hoisted else loop
+        if type(condition) is not BinaryExpr:
+            return plain
+        if condition.operator not in COUNTER_COMPARISONS or not isinstance(condition.left, Identifier):
+            return plain
+        counter = condition.left.name
+        if not body or not isinstance(body[-1], Assign) or body[-1].name != counter:
+            return plain
+        step = body[-1].value
+        if not (type(step) is BinaryExpr and step.operator in COUNTER_STEPS
+                and isinstance(step.left, Identifier) and step.left.name == counter
+                and isinstance(step.right, Constant) and _is_number(step.right.value)):
+            return plain
+        if not self._is_invariant(condition.right, invariant):
+            return plain
+        # the counter may only change through the final increment
+        if counter in self.effects.of_block(body[:-1])[0] or not private(counter):
+            return plain
+        return FastLoop(condition, body, tuple(hoisted), counter, condition.right,
+                        step.operator, step.right.value)
+
+    def _is_invariant(self, expr, invariant):
+        for node in scope_nodes(expr):
+            if isinstance(node, InvariantExpr):
+                continue
+            if isinstance(node, CallExpr):
+                return False
+            if isinstance(node, Identifier) and not invariant(node.name):
+                return False
+            if isinstance(node, BinaryExpr) and node.operator not in BINARY_OPERATORS:
+                return False
+        return True
+
+    def _hoist_children(self, node, invariant, hoisted):
+        if isinstance(node, VarDecl):
+            node.initializer = self._hoist(node.initializer, invariant, hoisted)
+        elif isinstance(node, Assign):
+            node.value = self._hoist(node.value, invariant, hoisted)
+        elif isinstance(node, (IfStmt, WhileStmt)):
+            node.condition = self._hoist(node.condition, invariant, hoisted)
+        elif isinstance(node, ExprStmt):
+            node.expression = self._hoist(node.expression, invariant, hoisted)
+        elif isinstance(node, CallExpr):
+            node.args = [self._hoist(arg, invariant, hoisted) for arg in node.args]
+
+    def _hoist(self, expr, invariant, hoisted):
+        """`expr` with its maximal invariant BinaryExpr subtrees wrapped in InvariantExprs."""
+        if type(expr) is not BinaryExpr:
+            return expr
+        # left-deep chains: find the longest invariant prefix of the spine iteratively
+        spine = []
+        node = expr
+        while type(node) is BinaryExpr:
+            spine.append(node)
+            node = node.left
+        spine.reverse()
+
+        prefix_invariant = self._is_invariant(node, invariant)
+        top = -1
+        for index, binary in enumerate(spine):
+            prefix_invariant = (
+                prefix_invariant
+                and binary.operator in BINARY_OPERATORS
+                and self._is_invariant(binary.right, invariant)
+            )
+            if not prefix_invariant:
+                break
+            top = index
+
+        if top >= 0:
+            wrapped = self._wrap(spine[top], hoisted)
+            if top + 1 < len(spine):
+                spine[top + 1].left = wrapped
+            else:
+                return wrapped
+        for binary in spine[top + 1:]:
+            binary.right = self._hoist(binary.right, invariant, hoisted)
+        return expr
+
+    def _wrap(self, binary, hoisted):
+        wrapped = InvariantExpr(binary.left, binary.operator, binary.right)
+        hoisted.append(wrapped)
+        return wrapped
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
@@ -0,0 +1,190 @@
+"""
+Analysis-time optimizations over the ZLang AST.
+
+optimize(program) rewrites a parsed Program in place (and returns it):
+
+  * every Literal becomes a Constant holding its converted runtime value, so the
+    interpreter stops re-parsing numeric lexemes on each evaluation;
+  * BinaryExpr nodes whose operands are both constant are folded;
+  * a `lit` declaration that is the only declaration of its name, is never the
+    target of an assignment and has a constant initializer is propagated into
+    the reads that are guaranteed to run after it;
+  * `yap` loops get loop-invariant hoisting and counter-loop nodes
+    (see compiler.semantics.loops);
+  * BinaryExpr nodes whose operand types are statically known become
+    TypedBinaryExpr nodes (see TypeInference in compiler.semantics.analyzer).
+
+Folding never changes observable behaviour: an operation that would raise
+(e.g. "a" - 1 or 1 / 0) or build an oversized string is left for runtime.
+"""
+
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    VarDecl,
+    Assign,
+    IfStmt,
+    WhileStmt,
+    ExprStmt,
+    CallExpr,
+    BinaryExpr,
+    Literal,
+    Constant,
+    Identifier,
+    walk,
+)
+from compiler.semantics.analyzer import BINARY_OPERATORS, convert_literal, infer_types
+from compiler.semantics.loops import optimize_loops
+
+
+# longest string a fold may produce; longer results are built at runtime
+MAX_FOLDED_STRING = 4096
+
+
+def optimize(program, loops=True, types=True):
+    return Optimizer(loops, types).optimize(program)
+
+
+class Optimizer:
+    def __init__(self, loops=True, types=True):
+        self.loops = loops
+        self.types = types
+        self.functions = set()
+        self.assigned = set()
+        self.declarations = {}
+
+    def optimize(self, program: Program):
+        for node in walk(program):
+            if isinstance(node, Assign):
+                self.assigned.add(node.name)
+            elif isinstance(node, VarDecl):
+                self.declarations[node.name] = self.declarations.get(node.name, 0) + 1
+            elif isinstance(node, FunctionDecl):
+                self.functions.add(node.name)
+
+        # Top-level statements run in order before main(). A global constant is
+        # only safe to propagate into function bodies if no user function can
+        # have run before its declaration.
+        global_consts = {}
+        function_consts = {}
+        user_call_seen = False
+        for decl in program.declarations:
+            if isinstance(decl, FunctionDecl):
+                continue
+            self._statement(decl, global_consts)
+            if isinstance(decl, VarDecl) and self._record(decl, global_consts) and not user_call_seen:
+                function_consts[decl.name] = global_consts[decl.name]
+            if not user_call_seen and self._calls_user_function(decl):
+                user_call_seen = True
+
+        for decl in program.declarations:
+            if isinstance(decl, FunctionDecl):
+                self._function(decl, function_consts)
+
+        if self.loops:
+            optimize_loops(program)
+        if self.types:
+            # the errors are kept on the program for check_types to report
+            infer_types(program)
+        return program
+
+    # --- Statements ---
+    def _function(self, func, visible_consts):
+        consts = dict(visible_consts)
+        for stmt in func.body:
+            self._statement(stmt, consts)
+            if isinstance(stmt, VarDecl):
+                self._record(stmt, consts)
+
+    def _block(self, stmts, consts):
+        # nested blocks may run zero or many times, so their declarations are not recorded
+        for stmt in stmts:
+            self._statement(stmt, consts)
+
+    def _statement(self, stmt, consts):
+        if isinstance(stmt, VarDecl):
+            stmt.initializer = self._expression(stmt.initializer, consts)
+        elif isinstance(stmt, Assign):
+            stmt.value = self._expression(stmt.value, consts)
+        elif isinstance(stmt, IfStmt):
+            stmt.condition = self._expression(stmt.condition, consts)
+            self._block(stmt.then_branch, consts)
+            self._block(stmt.else_branch, consts)
+        elif isinstance(stmt, WhileStmt):
+            stmt.condition = self._expression(stmt.condition, consts)
+            self._block(stmt.body, consts)
+        elif isinstance(stmt, ExprStmt):
+            stmt.expression = self._expression(stmt.expression, consts)
+        elif isinstance(stmt, FunctionDecl):
+            # nested declarations can be called at any time: no propagation
+            self._function(stmt, {})
+
+    def _record(self, decl, consts):
+        name = decl.name
+        if self.declarations.get(name) != 1 or name in self.assigned:
+            return False
+        if not isinstance(decl.initializer, Constant):
+            return False
+        consts[name] = decl.initializer.value
+        return True
+
+    def _calls_user_function(self, stmt):
+        for node in walk(stmt):
+            if isinstance(node, CallExpr) and isinstance(node.callee, Identifier) \
+                    and node.callee.name in self.functions:
+                return True
+        return False
+
+    # --- Expressions ---
+    def _expression(self, expr, consts):
+        if isinstance(expr, BinaryExpr):
+            # Operator chains parse left-deep; walk the spine iteratively so
+            # long chains do not hit the recursion limit.
+            spine = []
+            while isinstance(expr, BinaryExpr):
+                spine.append(expr)
+                expr = expr.left
+            result = self._expression(expr, consts)
+            for binary in reversed(spine):
+                binary.left = result
+                binary.right = self._expression(binary.right, consts)
+                result = self._fold(binary)
+            return result
+
+        if isinstance(expr, Literal):
+            return Constant(convert_literal(expr.value))
+
+        if isinstance(expr, Identifier):
+            if expr.name in consts:
+                return Constant(consts[expr.name])
+            return expr
+
+        if isinstance(expr, CallExpr):
+            # the callee stays an Identifier: calls are resolved by name
+            expr.args = [self._expression(arg, consts) for arg in expr.args]
+            return expr
+
+        return expr
+
+    def _fold(self, binary):
+        left, right = binary.left, binary.right
+        if not (isinstance(left, Constant) and isinstance(right, Constant)):
+            return binary
+        fn = BINARY_OPERATORS.get(binary.operator)
+        if fn is None or _too_large(binary.operator, left.value, right.value):
+            return binary
+        try:
+            return Constant(fn(left.value, right.value))
+        except Exception:
+            return binary
+
+
+def _too_large(op, left, right):
+    if op == "+" and isinstance(left, str) and isinstance(right, str):
+        return len(left) + len(right) > MAX_FOLDED_STRING
+    if op == "*":
+        if isinstance(left, str) and isinstance(right, int):
+            return len(left) * right > MAX_FOLDED_STRING
+        if isinstance(right, str) and isinstance(left, int):
+            return len(right) * left > MAX_FOLDED_STRING
+    return False
@@ -0,0 +1,57 @@
+"""
+Buffered output for the `say` builtin.
+
+BufferedOutput is a drop-in output_fn: it formats its arguments exactly as
+print(*args) does, but collects the text and writes it to the stream in one
+piece once `buffer_size` characters are pending. Interpreters flush it before
+`spill` reads input, so a prompt always appears after everything said before
+it; whoever runs the program flushes it at the end.
+
+Usage:
+    output = BufferedOutput(buffer_size=64 * 1024)
+    try:
+        Interpreter(output_fn=output).interpret(program_ast)
+    finally:
+        output.flush()
+"""
+
+import sys
+
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class BufferedOutput:
+    def __init__(self, stream=None, buffer_size=DEFAULT_BUFFER_SIZE):
+        # None means whatever sys.stdout is when the buffer is flushed
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self._parts = []
+        self._pending = 0
+
+    def __call__(self, *args):
+        if len(args) == 1:
+            text = f"{args[0]}\n"
+        else:
+            text = " ".join(map(str, args)) + "\n"
+        self._parts.append(text)
+        self._pending += len(text)
+        if self._pending >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if not self._parts:
+            return
+        stream = self.stream if self.stream is not None else sys.stdout
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._pending = 0
+        stream.write(text)
+        stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
@@ -0,0 +1,224 @@
+"""
+Per-function and per-statement profiling for ZLang interpreters.
+
+Profiler.attach(interp) wraps the interpreter's interpret, _run_function and
+_execute methods on that one instance, so an interpreter that is not being
+profiled runs exactly the code it always did. While attached it records:
+
+  * for every FunctionDecl: calls, inclusive time (the call and everything it
+    calls; recursive re-entries are not counted twice) and exclusive time (the
+    function's own statements only);
+  * for every statement: how many times it was executed;
+  * exclusive time per call stack, for collapsed-stack flamegraph tools.
+
+Top-level code is profiled as the pseudo-function "<top level>". Statements
+an optimized loop runs without dispatching them (the step of a counter loop)
+are not counted.
+
+Usage:
+    interp = Interpreter()
+    interp.enable_profiling()
+    interp.interpret(program_ast)
+    interp.profiler.report()               # tables to stderr
+    interp.profiler.collapsed_stacks()     # ["<top level>;main;helper 1250", ...]
+"""
+
+import sys
+import time
+
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    VarDecl,
+    Assign,
+    IfStmt,
+    WhileStmt,
+    ExprStmt,
+    CallExpr,
+    BinaryExpr,
+    Literal,
+    Constant,
+    Identifier,
+)
+from compiler.semantics.resolver import scope_nodes
+
+
+TOP_LEVEL = "<top level>"
+
+# longest statement text shown in a report
+MAX_LABEL = 60
+
+
+class FunctionStats:
+    __slots__ = ("calls", "inclusive", "exclusive")
+
+    def __init__(self):
+        self.calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+
+
+class Profiler:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        # function name -> FunctionStats
+        self.functions = {}
+        # statement node -> times executed
+        self.statements = {}
+        # statement node -> "function():path  source"
+        self.labels = {}
+        # call stack -> exclusive seconds; a stack is (caller's stack, name),
+        # starting from None, so entering a call never copies the whole stack
+        self.stacks = {}
+        # active calls: [name, start time, time spent in callees, stack]
+        self._frames = []
+        # function name -> how many of its calls are active
+        self._active = {}
+
+    def attach(self, interp):
+        interpret = interp.interpret
+        run_function = interp._run_function
+        execute = interp._execute
+        statements = self.statements
+
+        def profiled_interpret(program):
+            self.register(program)
+            self._enter(TOP_LEVEL)
+            try:
+                return interpret(program)
+            finally:
+                self._exit()
+
+        def profiled_run_function(func, arg_values):
+            self._enter(func.name)
+            try:
+                return run_function(func, arg_values)
+            finally:
+                self._exit()
+
+        def profiled_execute(node, env):
+            statements[node] = statements.get(node, 0) + 1
+            return execute(node, env)
+
+        interp.interpret = profiled_interpret
+        interp._run_function = profiled_run_function
+        interp._execute = profiled_execute
+        return self
+
+    def register(self, program: Program):
+        """Label the statements of `program` for reports."""
+        self._label_block(program.declarations, TOP_LEVEL, "")
+        for node in scope_nodes(program, skip=()):
+            if isinstance(node, FunctionDecl):
+                self._label_block(node.body, f"{node.name}()", "")
+
+    def _label_block(self, stmts, owner, prefix):
+        for index, stmt in enumerate(stmts):
+            path = f"{prefix}{index}"
+            if isinstance(stmt, FunctionDecl):
+                continue
+            self.labels[stmt] = f"{owner}:{path}  {_statement_text(stmt)}"
+            if isinstance(stmt, IfStmt):
+                self._label_block(stmt.then_branch, owner, f"{path}.")
+                self._label_block(stmt.else_branch, owner, f"{path}.else.")
+            elif isinstance(stmt, WhileStmt):
+                self._label_block(stmt.body, owner, f"{path}.")
+
+    # --- Timing ---
+    def _enter(self, name):
+        self._active[name] = self._active.get(name, 0) + 1
+        caller = self._frames[-1][3] if self._frames else None
+        self._frames.append([name, self.clock(), 0.0, (caller, name)])
+
+    def _exit(self):
+        name, start, in_callees, stack = self._frames.pop()
+        elapsed = self.clock() - start
+        self._active[name] -= 1
+        stats = self.functions.get(name)
+        if stats is None:
+            stats = self.functions[name] = FunctionStats()
+        stats.calls += 1
+        stats.exclusive += elapsed - in_callees
+        if not self._active[name]:
+            # only the outermost of recursive calls adds inclusive time
+            stats.inclusive += elapsed
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + elapsed - in_callees
+        if self._frames:
+            self._frames[-1][2] += elapsed
+
+    # --- Reports ---
+    def function_table(self):
+        """(name, calls, inclusive seconds, exclusive seconds), most exclusive time first."""
+        rows = [(name, s.calls, s.inclusive, s.exclusive) for name, s in self.functions.items()]
+        rows.sort(key=lambda row: (-row[3], row[0]))
+        return rows
+
+    def statement_table(self):
+        """(count, label), most executed first."""
+        rows = [(count, self.labels.get(node, repr(node))) for node, count in self.statements.items()]
+        rows.sort(key=lambda row: (-row[0], row[1]))
+        return rows
+
+    def collapsed_stacks(self):
+        """Lines of `frame;frame;frame microseconds`, the input format of flamegraph.pl."""
+        lines = []
+        for stack, seconds in self.stacks.items():
+            micros = round(seconds * 1_000_000)
+            if micros > 0:
+                lines.append(f"{';'.join(_frame_names(stack))} {micros}")
+        lines.sort()
+        return lines
+
+    def report(self, file=sys.stderr, statements=20):
+        print(f"{'function':<24} {'calls':>10} {'inclusive ms':>14} {'exclusive ms':>14}", file=file)
+        for name, calls, inclusive, exclusive in self.function_table():
+            print(f"{name:<24} {calls:>10} {inclusive * 1000:>14.3f} {exclusive * 1000:>14.3f}", file=file)
+        print(file=file)
+        print(f"{'executions':>10}  statement", file=file)
+        for count, label in self.statement_table()[:statements]:
+            print(f"{count:>10}  {label}", file=file)
+
+
+def _frame_names(stack):
+    names = []
+    while stack is not None:
+        stack, name = stack
+        names.append(name)
+    return names[::-1]
+
+
+def _statement_text(stmt):
+    if isinstance(stmt, VarDecl):
+        text = f"lit {stmt.name} = {_expression_text(stmt.initializer)}"
+    elif isinstance(stmt, Assign):
+        text = f"{stmt.name} = {_expression_text(stmt.value)}"
+    elif isinstance(stmt, IfStmt):
+        text = f"if {_expression_text(stmt.condition)}:"
+    elif isinstance(stmt, WhileStmt):
+        text = f"yap {_expression_text(stmt.condition)} {{"
+    elif isinstance(stmt, ExprStmt):
+        text = _expression_text(stmt.expression)
+    else:
+        text = type(stmt).__name__
+    return text if len(text) <= MAX_LABEL else text[:MAX_LABEL - 3] + "..."
+
+
+def _expression_text(expr):
+    if isinstance(expr, Constant):
+        return repr(expr.value) if isinstance(expr.value, str) else str(expr.value)
+    if isinstance(expr, Literal):
+        return str(expr.value)
+    if isinstance(expr, Identifier):
+        return expr.name
+    if isinstance(expr, BinaryExpr):
+        # labels are truncated anyway: render long chains only partially
+        parts = []
+        while isinstance(expr, BinaryExpr) and len(parts) < MAX_LABEL:
+            parts.append(f"{expr.operator} {_expression_text(expr.right)}")
+            expr = expr.left
+        head = "..." if isinstance(expr, BinaryExpr) else _expression_text(expr)
+        return " ".join([head] + parts[::-1])
+    if isinstance(expr, CallExpr):
+        args = ", ".join(_expression_text(arg) for arg in expr.args)
+        return f"{_expression_text(expr.callee)}({args})"
+    return type(expr).__name__
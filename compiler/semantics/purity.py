@@ -0,0 +1,176 @@
+"""
+Purity analysis and memoization of ZLang functions.
+
+analyze_purity(program) marks each FunctionDecl in the program: `pure` is True
+when the function has no observable effect, i.e. it never calls say/spill,
+never assigns a name that could be a global, never (re)defines functions and
+only calls other pure functions or squad builtins. `global_reads` lists the
+names that it, or any function it calls, reads and that may resolve to
+globals; together with the call's arguments their values are everything a
+pure call's outcome can depend on.
+
+FunctionMemo keeps one bounded LRU cache per FunctionDecl, keyed by the
+arguments and those global values (with their types, so 1, 1.0 and True stay
+distinct). Only calls that complete are cached; a call that raises is
+re-executed next time, so errors surface exactly as without memoization.
+
+Usage:
+    interp = Interpreter()
+    interp.enable_memoization(maxsize=256)
+    interp.interpret(program_ast)
+    interp.memo.stats()   # {"helper": {"hits": ..., "misses": ..., ...}}
+"""
+
+from collections import OrderedDict
+
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    Assign,
+    CallExpr,
+    Identifier,
+)
+from compiler.semantics.resolver import classify_locals, scope_nodes
+
+
+EFFECT_BUILTINS = ("say", "spill")
+# squad builtins (see compiler.semantics.squad): results depend on the arguments only
+PURE_BUILTINS = ("squad", "range", "len", "sum", "min", "max", "at", "slice")
+
+# marks a global that is not defined when the memo key is built
+MISSING = object()
+
+
+def analyze_purity(program: Program):
+    """Set `pure` and `global_reads` on every FunctionDecl; returns the names of pure functions."""
+    functions = [node for node in scope_nodes(program, skip=()) if isinstance(node, FunctionDecl)]
+    callees = {}
+    own_reads = {}
+    impure = set()
+
+    for func in functions:
+        plain, dynamic = classify_locals(func.body)
+        reads = set()
+        calls = set()
+        callee_ids = set()
+        effects = False
+        for node in scope_nodes(func.body, skip=()):
+            if isinstance(node, CallExpr):
+                if not isinstance(node.callee, Identifier):
+                    continue
+                callee_ids.add(id(node.callee))
+                calls.add(node.callee.name)
+                if node.callee.name in EFFECT_BUILTINS:
+                    effects = True
+            elif isinstance(node, Identifier):
+                if node.name not in plain and id(node) not in callee_ids:
+                    reads.add(node.name)
+            elif isinstance(node, Assign):
+                if node.name not in plain:
+                    # a dynamic local may still fall through to the global
+                    effects = True
+            elif isinstance(node, (FunctionDecl, Program)):
+                effects = True
+        own_reads[id(func)] = reads
+        callees[id(func)] = calls
+        if effects:
+            impure.add(func.name)
+
+    # a function is only as pure as everything it calls (and every
+    # declaration that shares a callee's name)
+    declared = {func.name for func in functions}
+    changed = True
+    while changed:
+        changed = False
+        for func in functions:
+            if func.name in impure:
+                continue
+            if any(name in impure or (name not in declared and name not in PURE_BUILTINS)
+                   for name in callees[id(func)]):
+                impure.add(func.name)
+                changed = True
+
+    # a call's outcome also depends on the globals its callees read
+    reads_by_name = {}
+    for func in functions:
+        reads_by_name.setdefault(func.name, set()).update(own_reads[id(func)])
+    changed = True
+    while changed:
+        changed = False
+        for func in functions:
+            reads = reads_by_name[func.name]
+            before = len(reads)
+            for name in callees[id(func)]:
+                reads |= reads_by_name.get(name, set())
+            changed = changed or len(reads) != before
+
+    for func in functions:
+        func.pure = func.name not in impure
+        func.global_reads = tuple(sorted(reads_by_name[func.name]))
+    return declared - impure
+
+
+class LRUCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, key):
+        """(True, value) on a hit, (False, None) on a miss."""
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return True, entries[key]
+        self.misses += 1
+        return False, None
+
+    def store(self, key, value):
+        entries = self.entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+
+class FunctionMemo:
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        # FunctionDecl -> LRUCache; a redefined function gets a fresh cache
+        self.caches = {}
+
+    def call(self, func, arg_values, state, run):
+        """Result of run(func, arg_values), served from the cache when possible."""
+        key = (_typed(arg_values), _typed(state))
+        cache = self.caches.get(func)
+        if cache is None:
+            cache = self.caches[func] = LRUCache(self.maxsize)
+        try:
+            found, result = cache.lookup(key)
+        except TypeError:
+            # an unhashable argument: run uncached
+            return run(func, arg_values)
+        if found:
+            return result
+        result = run(func, arg_values)
+        cache.store(key, result)
+        return result
+
+    def stats(self):
+        """Per function name: hits, misses, current size and maximum size."""
+        totals = {}
+        for func, cache in self.caches.items():
+            entry = totals.setdefault(func.name, {"hits": 0, "misses": 0, "size": 0, "maxsize": cache.maxsize})
+            entry["hits"] += cache.hits
+            entry["misses"] += cache.misses
+            entry["size"] += len(cache)
+        return totals
+
+
+def _typed(values):
+    return tuple((type(value), value) for value in values)
@@ -0,0 +1,221 @@
+"""
+Static name resolution for ZLang.
+
+Resolver gives every Identifier, VarDecl and Assign a (depth, slot) coordinate
+so SlotInterpreter can keep variables in fixed-size lists instead of chains of
+Environment dicts:
+
+  * depth LOCAL (0) indexes the current frame: the globals frame in top-level
+    code, the call's own frame inside a function;
+  * depth GLOBAL (1) indexes the globals frame from inside a function;
+  * depth LOCAL_OR_GLOBAL (-1) marks a function name that is only sometimes
+    `lit` (e.g. inside an `if`): the local slot is used once it has been
+    defined, the global of the same name otherwise, as Environment would.
+
+A function's slots are the names it `lit`s; FunctionDecl.frame_size records
+how many. Globals are every name that top-level code defines, that a
+function assigns without declaring it or that a function only sometimes
+`lit`s. Reading a name that nothing in the
+program can ever define is reported before the program runs, as a
+ResolveError listing every such name.
+"""
+
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    VarDecl,
+    Assign,
+    WhileStmt,
+    CallExpr,
+    Identifier,
+    Node,
+    node_fields,
+)
+
+
+LOCAL = 0
+GLOBAL = 1
+LOCAL_OR_GLOBAL = -1
+
+
+class ResolveError(Exception):
+    def __init__(self, errors):
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+class Resolver:
+    def __init__(self):
+        # name -> slot in the globals frame; kept across programs so an
+        # interpreter can resolve and run several programs in one session
+        self.global_slots = {}
+
+    def resolve(self, program: Program):
+        functions = [node for node in _all_nodes(program) if isinstance(node, FunctionDecl)]
+        scopes = {id(func): FunctionScope(func.body) for func in functions}
+
+        for node in scope_nodes(program.declarations, skip=(FunctionDecl,)):
+            if isinstance(node, (VarDecl, Assign)):
+                self._global_slot(node.name)
+        for func in functions:
+            scope = scopes[id(func)]
+            for node in scope_nodes(func.body):
+                if isinstance(node, Assign) and node.name not in scope.locals:
+                    # assigning an undeclared name falls back to the globals
+                    self._global_slot(node.name)
+            for name in scope.locals - scope.plain:
+                # so does using a sometimes-local name before its `lit` has run
+                self._global_slot(name)
+
+        errors = []
+        self._annotate(program.declarations, None, errors, skip=(FunctionDecl,))
+        for func in functions:
+            scope = scopes[id(func)]
+            self._annotate(func.body, scope, errors)
+            func.frame_size = len(scope.slots)
+        if errors:
+            raise ResolveError(list(dict.fromkeys(errors)))
+        return program
+
+    def _global_slot(self, name):
+        slot = self.global_slots.get(name)
+        if slot is None:
+            slot = self.global_slots[name] = len(self.global_slots)
+        return slot
+
+    def _annotate(self, stmts, scope, errors, skip=(FunctionDecl, Program)):
+        callees = set()
+        for node in scope_nodes(stmts, skip):
+            if isinstance(node, CallExpr):
+                # a named callee is a function, not a variable read
+                callees.add(id(node.callee))
+                continue
+            if not isinstance(node, (Identifier, VarDecl, Assign)) or id(node) in callees:
+                continue
+            if scope is None:
+                node.depth, node.slot = LOCAL, self.global_slots.get(node.name)
+            elif isinstance(node, VarDecl):
+                node.depth, node.slot = LOCAL, scope.slots[node.name]
+            elif node.name in scope.plain:
+                node.depth, node.slot = LOCAL, scope.slots[node.name]
+            elif node.name in scope.locals:
+                node.depth, node.slot = LOCAL_OR_GLOBAL, scope.slots[node.name]
+            else:
+                node.depth, node.slot = GLOBAL, self.global_slots.get(node.name)
+            if node.slot is None:
+                node.depth = None
+                errors.append(f"Undefined variable '{node.name}'.")
+
+
+class FunctionScope:
+    """The local names of one function body and their slots."""
+
+    def __init__(self, body):
+        self.plain, dynamic = classify_locals(body)
+        self.locals = self.plain | dynamic
+        self.slots = {}
+        for node in scope_nodes(body):
+            if isinstance(node, VarDecl) and node.name not in self.slots:
+                self.slots[node.name] = len(self.slots)
+
+
+def classify_locals(body):
+    """
+    Split the names a function body `lit`s into (plain, dynamic).
+
+    A name is plain when its first appearance is an unconditional top-level
+    VarDecl of the body (its own initializer counts as earlier), so every
+    later use is guaranteed to find it defined. Other `lit` names may or may
+    not be local at a given point and need a runtime check.
+    """
+    declared = {node.name for node in scope_nodes(body) if isinstance(node, VarDecl)}
+
+    seen = set()
+    plain = set()
+    for stmt in body:
+        if isinstance(stmt, VarDecl):
+            seen.update(_names_in(stmt.initializer))
+            if stmt.name not in seen:
+                plain.add(stmt.name)
+            seen.add(stmt.name)
+        else:
+            seen.update(_names_in(stmt))
+    return plain, declared - plain
+
+
+class LoopEffects:
+    """
+    What running a loop can change: the names it declares or assigns, and
+    whether it makes a call (other than to `effect_free` names) or runs a
+    nested program, either of which may assign any global.
+
+    Each loop is examined once and nested loops reuse their cached result, so
+    asking about every loop of a deeply nested tree stays linear in its size.
+    """
+
+    def __init__(self, effect_free=()):
+        self.effect_free = frozenset(effect_free)
+        self._cache = {}
+
+    def of(self, loop):
+        """(frozenset of names, calls) for a WhileStmt."""
+        found = self._cache.get(loop)
+        if found is None:
+            found = self._cache[loop] = self.of_block([loop.condition, loop.body])
+        return found
+
+    def of_block(self, stmts):
+        names = set()
+        calls = False
+        stack = [stmts]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, list):
+                stack.extend(current)
+                continue
+            if not isinstance(current, Node) or isinstance(current, FunctionDecl):
+                continue
+            if isinstance(current, WhileStmt):
+                nested_names, nested_calls = self.of(current)
+                names |= nested_names
+                calls = calls or nested_calls
+                continue
+            if isinstance(current, (VarDecl, Assign)):
+                names.add(current.name)
+            elif isinstance(current, Program):
+                calls = True
+                continue
+            elif isinstance(current, CallExpr) and not (
+                isinstance(current.callee, Identifier) and current.callee.name in self.effect_free
+            ):
+                calls = True
+            for slot in node_fields(type(current)):
+                child = getattr(current, slot, None)
+                if isinstance(child, (Node, list)):
+                    stack.append(child)
+        return frozenset(names), calls
+
+
+def _names_in(node):
+    return {child.name for child in scope_nodes(node) if isinstance(child, (Identifier, VarDecl, Assign))}
+
+
+def scope_nodes(node, skip=(FunctionDecl, Program)):
+    """Like ast.walk, but does not descend into nodes of the `skip` types (other scopes)."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, list):
+            stack.extend(reversed(current))
+            continue
+        if not isinstance(current, Node) or isinstance(current, skip):
+            continue
+        yield current
+        for slot in reversed(node_fields(type(current))):
+            child = getattr(current, slot, None)
+            if isinstance(child, (Node, list)):
+                stack.append(child)
+
+
+def _all_nodes(program):
+    return scope_nodes(program, skip=())
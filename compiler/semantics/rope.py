@@ -0,0 +1,125 @@
+"""
+Lazily joined strings.
+
+`s = s + piece` in a `yap` loop copies all of s on every pass, so building a
+long string one piece at a time is quadratic. The interpreters' `+` is
+concat(), which builds any string of MIN_ROPE_LENGTH characters or more as a
+Rope: a node holding its two halves and the total length. Appending to a rope
+copies nothing. A rope is joined into one string only when it is observed:
+printed by `say`, compared, hashed, repeated, passed to spill() or measured
+by anything but len(). The joined string is kept, so that happens once per
+rope. `say` hands output_fn the joined string, never the Rope.
+
+Ropes stand in for strings everywhere a ZLang value can go. Operations with
+anything that is not a string are applied to the joined string, so they
+succeed or fail exactly as they would on a str.
+
+Usage:
+    s = ""
+    for piece in pieces:
+        s = concat(s, piece)
+    print(s)
+"""
+
+
+# shorter results are plain strings: copying them is cheaper than a node
+MIN_ROPE_LENGTH = 256
+
+
+class Rope:
+    __slots__ = ("left", "right", "length")
+
+    def __init__(self, left, right):
+        # each half is a str or a Rope; right is None once the rope is joined
+        # and left holds the whole string
+        self.left = left
+        self.right = right
+        self.length = len(left) + len(right)
+
+    def flatten(self):
+        """The joined string."""
+        if self.right is None:
+            return self.left
+        # iterative, since a rope built by appending is as deep as it is long
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if type(node) is str:
+                parts.append(node)
+            elif node.right is None:
+                parts.append(node.left)
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+        text = "".join(parts)
+        # drop the halves; the nodes below may still be shared by other ropes
+        self.left, self.right = text, None
+        return text
+
+    __str__ = flatten
+
+    def __repr__(self):
+        return repr(self.flatten())
+
+    def __format__(self, spec):
+        return format(self.flatten(), spec)
+
+    def __len__(self):
+        return self.length
+
+    def __hash__(self):
+        return hash(self.flatten())
+
+    def __add__(self, other):
+        if type(other) in STRING_TYPES:
+            return Rope(self, other)
+        return self.flatten() + other
+
+    def __radd__(self, other):
+        if type(other) in STRING_TYPES:
+            return Rope(other, self)
+        return other + self.flatten()
+
+    def __mul__(self, other):
+        return self.flatten() * other
+
+    def __rmul__(self, other):
+        return other * self.flatten()
+
+    # a str on the other side returns NotImplemented for a Rope, and Python
+    # retries the reflected comparison here
+    def __eq__(self, other):
+        return self.flatten() == other
+
+    def __ne__(self, other):
+        return self.flatten() != other
+
+    def __lt__(self, other):
+        return self.flatten() < other
+
+    def __le__(self, other):
+        return self.flatten() <= other
+
+    def __gt__(self, other):
+        return self.flatten() > other
+
+    def __ge__(self, other):
+        return self.flatten() >= other
+
+
+# the runtime types of ZLang strings
+STRING_TYPES = (str, Rope)
+
+
+def plain(value):
+    """`value`, or the joined string if it is a Rope."""
+    return value.flatten() if type(value) is Rope else value
+
+
+def concat(left, right):
+    """left + right, as a Rope when both are strings and the result is long."""
+    if type(left) in STRING_TYPES and type(right) in STRING_TYPES:
+        if len(left) + len(right) >= MIN_ROPE_LENGTH:
+            return Rope(left, right)
+    return left + right
@@ -0,0 +1,213 @@
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    VarDecl,
+    Assign,
+    IfStmt,
+    WhileStmt,
+    ExprStmt,
+    CallExpr,
+    BinaryExpr,
+    Literal,
+    Constant,
+    Identifier,
+    TypedBinaryExpr,
+)
+from compiler.semantics.analyzer import Interpreter, ZLangRuntimeError
+from compiler.semantics.purity import MISSING, analyze_purity
+from compiler.semantics.resolver import LOCAL, GLOBAL, Resolver
+from compiler.semantics.rope import concat
+
+
+class _Unset:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<unset>"
+
+
+# value of a slot whose variable has not been defined yet
+UNSET = _Unset()
+
+
+class SlotInterpreter(Interpreter):
+    """
+    Tree-walk interpreter over resolved programs (see compiler.semantics.resolver).
+
+    Variables live in fixed-size lists indexed by the slots the Resolver
+    assigned: one globals frame for the whole session and one list of
+    FunctionDecl.frame_size entries per call, in place of Environment dicts.
+    Reading a name nothing in the program defines is a ResolveError raised by
+    interpret() before any statement runs.
+
+    Usage:
+        SlotInterpreter().interpret(program_ast)
+    """
+
+    def __init__(self, input_fn=input, output_fn=print):
+        super().__init__(input_fn, output_fn)
+        self.resolver = Resolver()
+        self.global_frame = []
+
+    def interpret(self, program: Program):
+        self.resolver.resolve(program)
+        if self.memo is not None:
+            analyze_purity(program)
+        missing = len(self.resolver.global_slots) - len(self.global_frame)
+        self.global_frame.extend([UNSET] * missing)
+
+        for decl in program.declarations:
+            if isinstance(decl, FunctionDecl):
+                self._define_function(decl)
+            else:
+                self._execute(decl, self.global_frame)
+
+        if "main" in self.functions:
+            self._call_function("main", [])
+
+    def _execute(self, node, frame):
+        if isinstance(node, Assign):
+            value = self._evaluate(node.value, frame)
+            depth = node.depth
+            if depth == LOCAL:
+                frame[node.slot] = value
+            elif depth == GLOBAL:
+                self.global_frame[node.slot] = value
+            elif frame[node.slot] is not UNSET:
+                frame[node.slot] = value
+            else:
+                self.global_frame[self.resolver.global_slots[node.name]] = value
+
+        elif isinstance(node, ExprStmt):
+            self._evaluate(node.expression, frame)
+
+        elif isinstance(node, VarDecl):
+            frame[node.slot] = self._evaluate(node.initializer, frame)
+
+        elif isinstance(node, IfStmt):
+            if self._evaluate(node.condition, frame):
+                for stmt in node.then_branch:
+                    self._execute(stmt, frame)
+            elif node.else_branch:
+                for stmt in node.else_branch:
+                    self._execute(stmt, frame)
+
+        elif isinstance(node, WhileStmt):
+            condition = node.condition
+            body = node.body
+            limits = self.limits
+            while self._evaluate(condition, frame):
+                if limits is not None:
+                    limits.step()
+                for stmt in body:
+                    self._execute(stmt, frame)
+
+        elif isinstance(node, FunctionDecl):
+            self._define_function(node)
+
+        elif isinstance(node, Program):
+            self.interpret(node)
+
+        elif node is None:
+            return
+
+        else:
+            raise ZLangRuntimeError(f"Cannot execute node type: {type(node).__name__}")
+
+    def _evaluate(self, expr, frame):
+        if isinstance(expr, Constant):
+            return expr.value
+
+        if isinstance(expr, Identifier):
+            depth = expr.depth
+            if depth == LOCAL:
+                value = frame[expr.slot]
+            elif depth == GLOBAL:
+                value = self.global_frame[expr.slot]
+            else:
+                value = frame[expr.slot]
+                if value is UNSET:
+                    slot = self.resolver.global_slots.get(expr.name)
+                    value = self.global_frame[slot] if slot is not None else UNSET
+            if value is UNSET:
+                raise ZLangRuntimeError(f"Undefined variable '{expr.name}'.")
+            return value
+
+        if isinstance(expr, BinaryExpr):
+            if type(expr) is TypedBinaryExpr:
+                fn = self.typed_operators[expr.kind]
+                return fn(self._evaluate(expr.left, frame), self._evaluate(expr.right, frame))
+            left = self._evaluate(expr.left, frame)
+            right = self._evaluate(expr.right, frame)
+            op = expr.operator
+            if self.limits is not None:
+                return self.limits.apply(op, left, right)
+
+            # Arithmetic
+            if op == "+":
+                return concat(left, right)
+            if op == "-":
+                return left - right
+            if op == "*":
+                return left * right
+            if op == "/":
+                return left / right
+
+            # Comparisons
+            if op == "==":
+                return left == right
+            if op == "!=":
+                return left != right
+            if op == ">":
+                return left > right
+            if op == ">=":
+                return left >= right
+            if op == "<":
+                return left < right
+            if op == "<=":
+                return left <= right
+
+            raise ZLangRuntimeError(f"Unknown binary operator '{op}'")
+
+        if isinstance(expr, Literal):
+            return self._convert_literal(expr.value)
+
+        if isinstance(expr, CallExpr):
+            callee = expr.callee
+            if not isinstance(callee, Identifier):
+                raise ZLangRuntimeError("Can only call named functions.")
+
+            args = [self._evaluate(a, frame) for a in expr.args]
+
+            if expr.target_epoch != self.call_epoch:
+                expr.target = self._resolve_call(callee.name)
+                expr.target_epoch = self.call_epoch
+            target = expr.target
+
+            if isinstance(target, FunctionDecl):
+                return self._run_function(target, args)
+            if target is None:
+                raise ZLangRuntimeError(f"Undefined function '{callee.name}'")
+            return target(args)
+
+        raise ZLangRuntimeError(f"Unknown expression node: {type(expr).__name__}")
+
+    def _call_function(self, name, arg_values):
+        func = self.functions.get(name)
+        if func is None:
+            return self._call_squad_builtin(name, arg_values)
+        return self._run_function(func, arg_values)
+
+    def _memo_state(self, names):
+        slots = self.resolver.global_slots
+        global_frame = self.global_frame
+        return tuple(global_frame[slots[name]] if name in slots else MISSING for name in names)
+
+    def _enter_function(self, func, arg_values):
+        if self.limits is not None:
+            self.limits.step()
+        frame = [UNSET] * func.frame_size
+        for stmt in func.body:
+            self._execute(stmt, frame)
+
+        return None
@@ -0,0 +1,274 @@
+"""
+The `squad` array type.
+
+A squad is a fixed-length, read-only array of numbers. The binary operators
+apply to squads element-wise: `xs + ys` adds two squads of the same length,
+`xs * 2` and `2 * xs` scale every element, and comparisons give a squad of
+1s and 0s. Each operation is a single call over the whole buffer, not a ZLang
+loop. A squad has no truth value; an `if` or `yap` on one is an error.
+
+Squads are array.array buffers seen through memoryviews. Elements are
+64-bit integers, or floats as soon as one element is a float; an integer
+result that does not fit in 64 bits is an error. Slices are views that share
+their squad's buffer.
+
+Builtins (interpreters install them next to say and spill):
+    squad(1, 2, 3)          a squad of the given numbers
+    range(stop)             0, 1, ..., stop - 1; also range(start, stop[, step])
+    len(xs)                 number of elements (or characters of a string)
+    sum(xs), min(xs), max(xs)
+    at(xs, i)               element i
+    slice(xs, start, stop)  elements start .. stop - 1, as a view
+"""
+
+from array import array
+from itertools import repeat
+
+from compiler.semantics.analyzer import BINARY_OPERATORS, ZLangRuntimeError
+from compiler.semantics.rope import STRING_TYPES
+
+
+COMPARISONS = ("==", "!=", "<", "<=", ">", ">=")
+
+
+class Squad:
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        # a memoryview of an array.array
+        self.data = data
+
+    @classmethod
+    def of(cls, values):
+        values = list(values)
+        for value in values:
+            if not isinstance(value, (int, float)):
+                raise ZLangRuntimeError(f"A squad holds numbers, not {value!r}.")
+        floats = any(isinstance(value, float) for value in values)
+        return cls(memoryview(_array("d" if floats else "q", values)))
+
+    @classmethod
+    def range(cls, start, stop, step):
+        return cls(memoryview(_array("q", range(start, stop, step))))
+
+    def __len__(self):
+        return len(self.data)
+
+    def tolist(self):
+        return self.data.tolist()
+
+    def __repr__(self):
+        return "squad(" + ", ".join(map(str, self.tolist())) + ")"
+
+    def __bool__(self):
+        raise ZLangRuntimeError("A squad has no truth value; compare len(), sum(), min() or max() instead.")
+
+    # a squad compares element-wise, so it cannot be a dict key
+    __hash__ = None
+
+    def _apply(self, op, other, reflected=False):
+        if isinstance(other, Squad):
+            if len(other.data) != len(self.data):
+                raise ZLangRuntimeError(
+                    f"Cannot apply '{op}' to squads of lengths {len(self.data)} and {len(other.data)}."
+                )
+            other = other.data
+        elif not isinstance(other, (int, float)):
+            return NotImplemented
+        left, right = (other, self.data) if reflected else (self.data, other)
+        return Squad(memoryview(_array_apply(op, left, right)))
+
+    def __add__(self, other):
+        return self._apply("+", other)
+
+    def __radd__(self, other):
+        return self._apply("+", other, True)
+
+    def __sub__(self, other):
+        return self._apply("-", other)
+
+    def __rsub__(self, other):
+        return self._apply("-", other, True)
+
+    def __mul__(self, other):
+        return self._apply("*", other)
+
+    def __rmul__(self, other):
+        return self._apply("*", other, True)
+
+    def __truediv__(self, other):
+        return self._apply("/", other)
+
+    def __rtruediv__(self, other):
+        return self._apply("/", other, True)
+
+    # Python tries the reflected comparison on the right operand itself
+    def __eq__(self, other):
+        return self._apply("==", other)
+
+    def __ne__(self, other):
+        return self._apply("!=", other)
+
+    def __lt__(self, other):
+        return self._apply("<", other)
+
+    def __le__(self, other):
+        return self._apply("<=", other)
+
+    def __gt__(self, other):
+        return self._apply(">", other)
+
+    def __ge__(self, other):
+        return self._apply(">=", other)
+
+
+def _array(typecode, values):
+    try:
+        return array(typecode, values)
+    except OverflowError:
+        raise ZLangRuntimeError("A squad element does not fit in 64 bits.") from None
+
+
+def _array_apply(op, left, right):
+    # map() over the buffers runs the whole operation in C
+    if op == "/":
+        typecode = "d"
+    elif op in COMPARISONS:
+        typecode = "q"
+    else:
+        typecode = "d" if _is_float(left) or _is_float(right) else "q"
+    length = len(left) if isinstance(left, memoryview) else len(right)
+    if not isinstance(left, memoryview):
+        left = repeat(left, length)
+    if not isinstance(right, memoryview):
+        right = repeat(right, length)
+    return _array(typecode, map(BINARY_OPERATORS[op], left, right))
+
+
+def _is_float(operand):
+    if isinstance(operand, memoryview):
+        return operand.format == "d"
+    return isinstance(operand, float)
+
+
+def _squad_arg(name, args):
+    if len(args) != 1:
+        raise ZLangRuntimeError(f"{name}() takes 1 argument, got {len(args)}.")
+    if not isinstance(args[0], Squad):
+        raise ZLangRuntimeError(f"{name}() expects a squad, got {args[0]!r}.")
+    return args[0].data
+
+
+def _int_args(name, args):
+    for value in args:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ZLangRuntimeError(f"{name}() expects whole numbers, got {value!r}.")
+    return args
+
+
+def _builtin_squad(args):
+    return Squad.of(args)
+
+
+def _range_bounds(args):
+    if not 1 <= len(args) <= 3:
+        raise ZLangRuntimeError(f"range() takes 1 to 3 arguments, got {len(args)}.")
+    args = _int_args("range", args)
+    if len(args) == 1:
+        return 0, args[0], 1
+    start, stop, step = (args + [1])[:3]
+    if step == 0:
+        raise ZLangRuntimeError("range() step must not be zero.")
+    return start, stop, step
+
+
+def _builtin_range(args):
+    return Squad.range(*_range_bounds(args))
+
+
+def _builtin_len(args):
+    if len(args) == 1 and isinstance(args[0], STRING_TYPES):
+        return len(args[0])
+    return len(_squad_arg("len", args))
+
+
+def _builtin_sum(args):
+    # exact, like any ZLang integer arithmetic
+    return sum(_squad_arg("sum", args))
+
+
+def _extreme(name, fn):
+    def builtin(args):
+        data = _squad_arg(name, args)
+        if not len(data):
+            raise ZLangRuntimeError(f"{name}() of an empty squad.")
+        return fn(data)
+
+    return builtin
+
+
+def _builtin_at(args):
+    if len(args) != 2:
+        raise ZLangRuntimeError(f"at() takes 2 arguments, got {len(args)}.")
+    data = _squad_arg("at", args[:1])
+    index = _int_args("at", args[1:])[0]
+    if not -len(data) <= index < len(data):
+        raise ZLangRuntimeError(f"Squad index {index} is out of range for length {len(data)}.")
+    return data[index]
+
+
+def _builtin_slice(args):
+    if len(args) != 3:
+        raise ZLangRuntimeError(f"slice() takes 3 arguments, got {len(args)}.")
+    data = _squad_arg("slice", args[:1])
+    start, stop = _int_args("slice", args[1:])
+    # slicing a memoryview makes a view, not a copy
+    return Squad(data[start:stop])
+
+
+# name -> builtin taking the list of argument values
+SQUAD_BUILTINS = {
+    "squad": _builtin_squad,
+    "range": _builtin_range,
+    "len": _builtin_len,
+    "sum": _builtin_sum,
+    "min": _extreme("min", min),
+    "max": _extreme("max", max),
+    "at": _builtin_at,
+    "slice": _builtin_slice,
+}
+
+
+def metered_builtins(limits):
+    """
+    SQUAD_BUILTINS for a run under `limits` (a RunLimits): a squad is checked
+    against the value size limit before it is built, and building or reducing
+    one costs a step per element.
+    """
+    def metered_squad(args):
+        limits.elements(len(args))
+        return _builtin_squad(args)
+
+    def metered_range(args):
+        start, stop, step = _range_bounds(args)
+        if step > 0:
+            count = (stop - start + step - 1) // step
+        else:
+            count = (start - stop - step - 1) // -step
+        limits.elements(max(count, 0))
+        return Squad.range(start, stop, step)
+
+    def metered_reduction(builtin):
+        def metered(args):
+            if len(args) == 1 and isinstance(args[0], Squad):
+                limits.elements(len(args[0]))
+            return builtin(args)
+
+        return metered
+
+    builtins = dict(SQUAD_BUILTINS)
+    builtins["squad"] = metered_squad
+    builtins["range"] = metered_range
+    for name in ("sum", "min", "max"):
+        builtins[name] = metered_reduction(SQUAD_BUILTINS[name])
+    return builtins
@@ -0,0 +1,286 @@
+from compiler.Parser.ast import (
+    Program,
+    FunctionDecl,
+    VarDecl,
+    Assign,
+    IfStmt,
+    WhileStmt,
+    ExprStmt,
+    CallExpr,
+    BinaryExpr,
+    Literal,
+    Constant,
+    Identifier,
+)
+from compiler.semantics.analyzer import (
+    BINARY_OPERATORS,
+    Environment,
+    Interpreter,
+    ZLangRuntimeError,
+)
+from compiler.semantics.rope import concat
+
+
+# --- Work items: (kind, payload) tuples on the work stack ---
+EXEC = 0          # execute the statement payload
+EVAL = 1          # evaluate the expression payload, push its value
+APPLY = 2         # pop right, pop left, push payload(left, right)
+DISCARD = 3       # pop and drop a value
+DEFINE = 4        # pop, define the variable payload in the current scope
+ASSIGN = 5        # pop, assign the variable payload
+BRANCH = 6        # pop a condition, schedule payload's then/else branch
+LOOP = 7          # pop a condition, schedule payload's body and re-test
+CALL = 8          # call payload (a CallExpr) with its evaluated arguments, push the result
+CALL_STMT = 9     # like CALL but the result is unused, which permits tail calls
+RETURN = 10       # function body finished: restore the caller's Environment (payload)
+RETURN_VALUE = 11 # as RETURN, then push the call's result (None)
+UNKNOWN_OP = 12   # pop two operands, raise for the unknown operator payload
+
+# long strings are built lazily (see compiler.semantics.rope)
+OPERATORS = dict(BINARY_OPERATORS)
+OPERATORS["+"] = concat
+
+
+class StackInterpreter(Interpreter):
+    """
+    Interpreter driven by an explicit work stack instead of Python recursion.
+
+    Statements and expressions are broken into work items on a list, with a
+    separate value stack for intermediate results, so nesting depth (deep
+    expressions, recursive ZLang functions) is bounded by memory rather than
+    the Python recursion limit.
+
+    Calls whose result is unused and after which the caller has nothing left
+    to do are tail calls: the callee takes over the caller's return item
+    instead of stacking a new one, so tail recursion runs in constant space.
+
+    Usage:
+        StackInterpreter().interpret(program_ast)
+    """
+
+    meters_limits = False
+
+    def __init__(self, input_fn=input, output_fn=print):
+        super().__init__(input_fn, output_fn)
+        # statement list -> its EXEC items, reversed and ready to extend onto the stack
+        self._blocks = {}
+        # work items between voluntary suspensions, or None never to suspend
+        self.time_slice = None
+        # the work stack of the innermost running _steps, for inspection
+        self.work = None
+
+    def interpret(self, program: Program):
+        self._drive(self._program_steps(program))
+
+    def _execute(self, node, env):
+        self._run([node], env)
+
+    def _evaluate(self, expr, env):
+        return self._run([], env, expr)
+
+    def _run_function(self, func, arg_values):
+        self._run(func.body, Environment(self.globals))
+        return None
+
+    def _run(self, stmts, env, expr=None):
+        """Execute `stmts` in `env` (or evaluate `expr`, returning its value)."""
+        return self._drive(self._steps(stmts, env, expr))
+
+    def _drive(self, steps):
+        # run a _steps generator to completion, calling builtins as they come
+        try:
+            request = next(steps)
+            while True:
+                if request is None:
+                    request = steps.send(None)
+                    continue
+                target, args = request
+                request = steps.send(target(args))
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            steps.close()
+
+    def _program_steps(self, program):
+        yield from self._steps(program.declarations, self.env)
+
+        if "main" in self.functions:
+            main = self.functions["main"]
+            yield from self._steps(main.body, Environment(self.globals))
+
+    def _block(self, stmts):
+        items = self._blocks.get(id(stmts))
+        if items is None or items[0] is not stmts:
+            items = (stmts, [(EXEC, stmt) for stmt in reversed(stmts)])
+            self._blocks[id(stmts)] = items
+        return items[1]
+
+    def _steps(self, stmts, env, expr=None):
+        """
+        Generator that executes `stmts` in `env` (or evaluates `expr`) and
+        returns the value. Each builtin call is yielded as (builtin, args) for
+        the driver to perform and send the result back; with a time slice set,
+        a bare None is yielded every `time_slice` loop iterations and calls.
+        """
+        work = [(EXEC, stmt) for stmt in reversed(stmts)]
+        values = []
+        if expr is not None:
+            work.append((EVAL, expr))
+        push = work.append
+        pop = work.pop
+        push_value = values.append
+        pop_value = values.pop
+        previous_env = self.env
+        previous_work = self.work
+        self.env = env
+        self.work = work
+        time_slice = self.time_slice
+        budget = time_slice
+
+        try:
+            while work:
+                kind, item = pop()
+
+                if kind == EVAL:
+                    if isinstance(item, Constant):
+                        push_value(item.value)
+                    elif isinstance(item, Identifier):
+                        push_value(env.get(item.name))
+                    elif isinstance(item, BinaryExpr):
+                        fn = OPERATORS.get(item.operator)
+                        left, right = item.left, item.right
+                        if fn is None:
+                            push((UNKNOWN_OP, item.operator))
+                            push((EVAL, right))
+                            push((EVAL, left))
+                        elif isinstance(right, Constant) and isinstance(left, Identifier):
+                            # the common `name <op> constant` shape needs no work items
+                            push_value(fn(env.get(left.name), right.value))
+                        else:
+                            push((APPLY, fn))
+                            push((EVAL, right))
+                            push((EVAL, left))
+                    elif isinstance(item, CallExpr):
+                        if not isinstance(item.callee, Identifier):
+                            raise ZLangRuntimeError("Can only call named functions.")
+                        push((CALL, item))
+                        for arg in reversed(item.args):
+                            push((EVAL, arg))
+                    elif isinstance(item, Literal):
+                        push_value(self._convert_literal(item.value))
+                    else:
+                        raise ZLangRuntimeError(f"Unknown expression node: {type(item).__name__}")
+
+                elif kind == APPLY:
+                    right = pop_value()
+                    values[-1] = item(values[-1], right)
+
+                elif kind == EXEC:
+                    if isinstance(item, Assign):
+                        push((ASSIGN, item.name))
+                        push((EVAL, item.value))
+                    elif isinstance(item, ExprStmt):
+                        expression = item.expression
+                        if isinstance(expression, CallExpr) and isinstance(expression.callee, Identifier):
+                            push((CALL_STMT, expression))
+                            for arg in reversed(expression.args):
+                                push((EVAL, arg))
+                        else:
+                            push((DISCARD, None))
+                            push((EVAL, expression))
+                    elif isinstance(item, IfStmt):
+                        push((BRANCH, item))
+                        push((EVAL, item.condition))
+                    elif isinstance(item, WhileStmt):
+                        push((LOOP, item))
+                        push((EVAL, item.condition))
+                    elif isinstance(item, VarDecl):
+                        push((DEFINE, item.name))
+                        push((EVAL, item.initializer))
+                    elif isinstance(item, FunctionDecl):
+                        self._define_function(item)
+                    elif isinstance(item, Program):
+                        yield from self._program_steps(item)
+                    elif item is not None:
+                        raise ZLangRuntimeError(f"Cannot execute node type: {type(item).__name__}")
+
+                elif kind == ASSIGN:
+                    env.assign(item, pop_value())
+
+                elif kind == LOOP:
+                    if self._truthy(pop_value()):
+                        if budget is not None:
+                            budget -= 1
+                            if budget <= 0:
+                                budget = time_slice
+                                yield None
+                        push((LOOP, item))
+                        push((EVAL, item.condition))
+                        work.extend(self._block(item.body))
+
+                elif kind == BRANCH:
+                    if self._truthy(pop_value()):
+                        work.extend(self._block(item.then_branch))
+                    elif item.else_branch:
+                        work.extend(self._block(item.else_branch))
+
+                elif kind == CALL or kind == CALL_STMT:
+                    argc = len(item.args)
+                    if argc:
+                        args = values[-argc:]
+                        del values[-argc:]
+                    else:
+                        args = []
+
+                    if item.target_epoch != self.call_epoch:
+                        item.target = self._resolve_call(item.callee.name)
+                        item.target_epoch = self.call_epoch
+                    target = item.target
+
+                    if target is None:
+                        raise ZLangRuntimeError(f"Undefined function '{item.callee.name}'")
+                    if not isinstance(target, FunctionDecl):
+                        result = yield target, args
+                        if kind == CALL:
+                            push_value(result)
+                        continue
+
+                    if budget is not None:
+                        budget -= 1
+                        if budget <= 0:
+                            budget = time_slice
+                            yield None
+
+                    if kind == CALL_STMT and work and work[-1][0] == RETURN:
+                        # tail call: the caller's frame is finished, so the
+                        # callee returns straight to the caller's caller
+                        pass
+                    else:
+                        push((RETURN if kind == CALL_STMT else RETURN_VALUE, env))
+                    env = Environment(self.globals)
+                    self.env = env
+                    work.extend(self._block(target.body))
+
+                elif kind == RETURN:
+                    env = item
+                    self.env = env
+
+                elif kind == RETURN_VALUE:
+                    env = item
+                    self.env = env
+                    push_value(None)
+
+                elif kind == DEFINE:
+                    env.define(item, pop_value())
+
+                elif kind == DISCARD:
+                    pop_value()
+
+                elif kind == UNKNOWN_OP:
+                    del values[-2:]
+                    raise ZLangRuntimeError(f"Unknown binary operator '{item}'")
+        finally:
+            self.env = previous_env
+            self.work = previous_work
+
+        return values[-1] if expr is not None else None
@@ -0,0 +1,213 @@
+"""
+Warm ZLang daemon.
+
+Starting `python main.py` costs interpreter startup plus importing the whole
+compiler before the first statement runs. The daemon pays that once: it stays
+running with the compiler loaded, listens on a Unix domain socket and runs
+each program a client (zlclient.py, which imports none of the compiler)
+sends it. Recently compiled programs are kept in an LRU cache keyed by a hash
+of their source, so an unchanged script is not even re-parsed.
+
+Every connection is served on its own thread, and each run unpickles a
+private copy of its cached tree: interpreters keep per-run state on AST nodes
+(call-target caches bound to their own builtins), so runs never share one.
+The message protocol is described in zlclient.py.
+
+Usage:
+    python daemon.py /tmp/zlang.sock [--cache-size 128] &
+    python zlclient.py /tmp/zlang.sock program.zl < input.txt
+    python zlclient.py /tmp/zlang.sock --stop
+"""
+
+import argparse
+import os
+import socket
+import socketserver
+import sys
+import threading
+
+from compiler import cache
+from compiler.Parser.parser import ParseError
+from compiler.semantics.output import DEFAULT_BUFFER_SIZE
+from compiler.semantics.purity import LRUCache
+from main import BACKENDS, LIMITING_BACKENDS, compile_source, run_program
+from zlclient import receive_message, send_message
+
+
+DEFAULT_CACHE_SIZE = 128
+
+# run options a client may set, with the defaults main.py uses
+RUN_OPTIONS = {
+    "optimize": True,
+    "backend": "tree",
+    "memoize": 0,
+    "typecheck": True,
+    "output_buffer": DEFAULT_BUFFER_SIZE,
+    # enable_limits() keyword arguments, for programs nobody has vetted
+    "limits": None,
+}
+
+
+class _Channel:
+    """A run's view of its client: a text stream for `say`, an input_fn for `spill`."""
+
+    def __init__(self, rfile, wfile):
+        self.rfile = rfile
+        self.wfile = wfile
+
+    def write(self, text):
+        if text:
+            send_message(self.wfile, {"op": "output", "text": text})
+
+    def flush(self):
+        pass
+
+    def read_line(self, prompt=""):
+        send_message(self.wfile, {"op": "input", "prompt": prompt})
+        reply = receive_message(self.rfile)
+        if reply is None:
+            raise ConnectionError("client went away")
+        if reply.get("line") is None:
+            raise EOFError("EOF when reading a line")
+        return reply["line"]
+
+
+class _RunHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = receive_message(self.rfile)
+        if request is None:
+            return
+        op = request.get("op")
+        if op == "run":
+            self.server.run(request, _Channel(self.rfile, self.wfile))
+        elif op == "stats":
+            send_message(self.wfile, dict(self.server.stats(), op="stats"))
+        elif op == "stop":
+            send_message(self.wfile, {"op": "stopped"})
+            # shutdown() waits for serve_forever(), which is running this handler's caller
+            threading.Thread(target=self.server.shutdown).start()
+        else:
+            send_message(self.wfile, {"op": "exit", "status": 2, "error": f"unknown op {op!r}"})
+
+
+class ProgramServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, cache_size=DEFAULT_CACHE_SIZE):
+        self.socket_path = socket_path
+        # (source hash, optimized) -> pickled Program
+        self.programs = LRUCache(cache_size)
+        self.lock = threading.Lock()
+        self.requests = 0
+        _remove_stale_socket(socket_path)
+        super().__init__(socket_path, _RunHandler)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+    def compile(self, source, optimize_ast):
+        """A private Program for `source`, compiled at most once while it stays cached; raises ParseError."""
+        key = (cache.source_hash(source), optimize_ast)
+        with self.lock:
+            found, data = self.programs.lookup(key)
+        if found:
+            return cache.loads(data)
+        program = compile_source(source, optimize_ast)
+        data = cache.dumps(program)
+        if data is not None:
+            with self.lock:
+                self.programs.store(key, data)
+        return program
+
+    def run(self, request, channel):
+        with self.lock:
+            self.requests += 1
+        options = dict(RUN_OPTIONS)
+        options.update((key, value) for key, value in request.get("options", {}).items() if key in RUN_OPTIONS)
+        error = None
+        if options["backend"] not in BACKENDS:
+            error = f"unknown backend {options['backend']!r}"
+        elif options["limits"] and options["backend"] not in LIMITING_BACKENDS:
+            # an unmetered run of an untrusted program could go on forever
+            error = f"limits are not supported by the {options['backend']} backend"
+        if error is not None:
+            send_message(channel.wfile, {"op": "exit", "status": 2, "error": error})
+            return
+        status, error = 0, None
+        try:
+            try:
+                program = self.compile(request["source"], options["optimize"])
+            except ParseError as e:
+                # reported on stdout, as main.py does
+                channel.write(f"Parse error: {e}\n")
+            else:
+                run_program(program, options["backend"], options["memoize"], options["typecheck"],
+                            output_buffer=options["output_buffer"], input_fn=channel.read_line, stream=channel,
+                            limits=options["limits"])
+        except ConnectionError:
+            return
+        except Exception as e:
+            status, error = 1, f"{type(e).__name__}: {e}"
+        try:
+            send_message(channel.wfile, {"op": "exit", "status": status, "error": error})
+        except OSError:
+            pass
+
+    def stats(self):
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "cached": len(self.programs),
+                "cache_size": self.programs.maxsize,
+                "hits": self.programs.hits,
+                "misses": self.programs.misses,
+            }
+
+
+def _remove_stale_socket(socket_path):
+    """Unlink a socket file left by a daemon that is gone; refuse to replace a live one."""
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except ConnectionRefusedError:
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+    raise OSError(f"a daemon is already listening on {socket_path}")
+
+
+def serve(socket_path, cache_size=DEFAULT_CACHE_SIZE, ready=None):
+    """Serve run requests on `socket_path` until a stop request; `ready` (an Event) is set once listening."""
+    with ProgramServer(socket_path, cache_size) as server:
+        if ready is not None:
+            ready.set()
+        server.serve_forever()
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="daemon.py", description="Serve ZLang programs over a Unix socket.")
+    parser.add_argument("socket", help="Unix domain socket to listen on")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, metavar="N",
+                        help=f"compiled programs kept in memory (default {DEFAULT_CACHE_SIZE})")
+    return parser
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if args.cache_size < 1:
+        arg_parser.error("--cache-size N must be at least 1")
+    serve(args.socket, args.cache_size)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,35 +1,360 @@
+import argparse
+import functools
+import io
+import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 
+from compiler import cache
+from compiler.codegen.closures import ClosureInterpreter
+from compiler.codegen.generator import VirtualMachine
+from compiler.codegen.transpiler import PythonInterpreter, PythonTranspiler
 from compiler.lexer.Tokenizer import Tokenizer
-from compiler.Parser.parser import Parser, ParseError
-from compiler.semantics.analyzer import Interpreter
+from compiler.Parser.parser import StreamingParser, ParseError
+from compiler.semantics.analyzer import Interpreter, TypeCheckError, ZLangRuntimeError, check_types
+from compiler.semantics.limits import LimitExceeded
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.output import DEFAULT_BUFFER_SIZE, BufferedOutput
+from compiler.semantics.resolver import ResolveError
+from compiler.semantics.slot_interpreter import SlotInterpreter
+from compiler.semantics.stack_interpreter import StackInterpreter
 
 
-def run_source(source: str):
-    tokens = Tokenizer(source).tokenize()
-    parser = Parser(tokens)
+# --backend name -> interpreter class; all share Interpreter's constructor
+BACKENDS = {
+    "tree": Interpreter,
+    "slots": SlotInterpreter,
+    "stack": StackInterpreter,
+    "closure": ClosureInterpreter,
+    "vm": VirtualMachine,
+    "python": PythonInterpreter,
+}
+
+# backends whose function calls go through Interpreter._run_function and so
+# honour enable_memoization()
+MEMOIZING_BACKENDS = ("tree", "slots")
+
+# backends that run statements through Interpreter._execute and so can be
+# profiled with enable_profiling()
+PROFILING_BACKENDS = ("tree", "slots")
+
+# backends that meter steps and value sizes set with enable_limits()
+LIMITING_BACKENDS = ("tree", "slots")
+
+
+def compile_source(source: str, optimize_ast: bool = True):
+    """Parse (and optimize) `source`; raises ParseError."""
+    # tokens are pulled lazily, so lexing and parsing are interleaved
+    program = StreamingParser(Tokenizer(source).iter_tokens()).parse()
+    if optimize_ast:
+        program = optimize(program)
+    return program
+
+
+def parse_source(source: str, optimize_ast: bool = True):
     try:
-        program = parser.parse()
+        return compile_source(source, optimize_ast)
     except ParseError as e:
         print("Parse error:", e)
-        return
-    interp = Interpreter()
-    interp.interpret(program)
+        return None
 
 
-def run_file(path: str):
+def compile_file(path: str, optimize_ast: bool = True, use_cache: bool = True):
+    """The program in `path`, from __zlcache__ when unchanged; raises ParseError."""
     with open(path, "r", encoding="utf-8") as f:
         source = f.read()
-    run_source(source)
+    if use_cache:
+        program = cache.load(path, source, optimize_ast)
+        if program is not None:
+            return program
+    program = compile_source(source, optimize_ast)
+    if use_cache:
+        cache.store(path, source, program, optimize_ast)
+    return program
+
+
+def load_program(path: str, optimize_ast: bool = True, use_cache: bool = True):
+    try:
+        return compile_file(path, optimize_ast, use_cache)
+    except ParseError as e:
+        print("Parse error:", e)
+        return None
+
+
+def run_program(program, backend: str = "tree", memoize: int = 0, typecheck: bool = True,
+                profile: bool = False, output_buffer: int = DEFAULT_BUFFER_SIZE,
+                input_fn=input, stream=None, limits: dict = None):
+    # `limits` are enable_limits() keyword arguments (max_steps, timeout, max_value_size).
+    # `say` output is written to `stream` (None: sys.stdout) in blocks of
+    # output_buffer characters (0: line by line)
+    if output_buffer:
+        output = BufferedOutput(stream, output_buffer)
+    else:
+        output = functools.partial(print, file=stream)
+    interp = BACKENDS[backend](input_fn=input_fn, output_fn=output)
+    if memoize:
+        interp.enable_memoization(memoize)
+    if profile:
+        interp.enable_profiling()
+    if limits:
+        interp.enable_limits(**limits)
+    try:
+        try:
+            if typecheck:
+                # operations that can only fail are reported before anything runs
+                check_types(program)
+            interp.interpret(program)
+        finally:
+            if isinstance(output, BufferedOutput):
+                output.flush()
+    except ResolveError as e:
+        print("Resolve error:", e, file=stream)
+    except TypeCheckError as e:
+        print("Type error:", e, file=stream)
+    return interp
+
+
+def run_source(source: str, optimize_ast: bool = True, backend: str = "tree", memoize: int = 0,
+               typecheck: bool = True, profile: bool = False, output_buffer: int = DEFAULT_BUFFER_SIZE,
+               limits: dict = None):
+    program = parse_source(source, optimize_ast)
+    if program is not None:
+        return run_program(program, backend, memoize, typecheck, profile, output_buffer, limits=limits)
+    return None
+
+
+def run_file(path: str, optimize_ast: bool = True, backend: str = "tree", use_cache: bool = True,
+             memoize: int = 0, typecheck: bool = True, profile: bool = False,
+             output_buffer: int = DEFAULT_BUFFER_SIZE, limits: dict = None):
+    program = load_program(path, optimize_ast, use_cache)
+    if program is not None:
+        return run_program(program, backend, memoize, typecheck, profile, output_buffer, limits=limits)
+    return None
+
+
+def print_memo_stats(interp, file=sys.stderr):
+    stats = interp.memo.stats() if interp is not None and interp.memo is not None else {}
+    print(f"{'function':<24} {'hits':>10} {'misses':>10} {'size':>12}", file=file)
+    for name, entry in sorted(stats.items()):
+        size = f"{entry['size']}/{entry['maxsize']}"
+        print(f"{name:<24} {entry['hits']:>10} {entry['misses']:>10} {size:>12}", file=file)
+
+
+def write_profile(interp, stacks_path=None, file=sys.stderr):
+    if interp is None or interp.profiler is None:
+        return
+    interp.profiler.report(file=file)
+    if stacks_path:
+        with open(stacks_path, "w", encoding="utf-8") as f:
+            for line in interp.profiler.collapsed_stacks():
+                f.write(line + "\n")
+
+
+def emit_python(path: str, optimize_ast: bool = True, use_cache: bool = True):
+    program = load_program(path, optimize_ast, use_cache)
+    if program is not None:
+        print(PythonTranspiler().transpile(program), end="")
+
+
+def find_programs(paths):
+    """`paths` with every directory replaced by the .zl files below it, sorted."""
+    programs = []
+    for path in paths:
+        if os.path.isdir(path):
+            found = []
+            for directory, _, files in os.walk(path):
+                found.extend(os.path.join(directory, name) for name in files if name.endswith(".zl"))
+            programs.extend(sorted(found))
+        else:
+            programs.append(path)
+    return programs
+
+
+def _no_input(prompt):
+    raise EOFError("spill() has no input in batch mode")
+
+
+def run_batch_file(path: str, output_path: str = None, optimize_ast: bool = True, backend: str = "tree",
+                   use_cache: bool = True, memoize: int = 0, typecheck: bool = True, limits: dict = None):
+    """Run one program with its output captured; returns its summary entry."""
+    start = time.perf_counter()
+    stream = io.StringIO()
+    output = BufferedOutput(stream)
+    status, error = "ok", None
+    try:
+        try:
+            program = compile_file(path, optimize_ast, use_cache)
+            interp = BACKENDS[backend](input_fn=_no_input, output_fn=output)
+            if memoize:
+                interp.enable_memoization(memoize)
+            if limits:
+                interp.enable_limits(**limits)
+            if typecheck:
+                check_types(program)
+            interp.interpret(program)
+        finally:
+            output.flush()
+    except ParseError as e:
+        status, error = "parse_error", str(e)
+    except ResolveError as e:
+        status, error = "resolve_error", str(e)
+    except TypeCheckError as e:
+        status, error = "type_error", str(e)
+    except LimitExceeded as e:
+        status, error = "limit_exceeded", str(e)
+    except ZLangRuntimeError as e:
+        status, error = "runtime_error", str(e)
+    except Exception as e:
+        status, error = "error", f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - start
+
+    text = stream.getvalue()
+    if output_path is not None:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return {
+        "path": path,
+        "status": status,
+        "seconds": round(elapsed, 6),
+        "output_bytes": len(text.encode("utf-8")),
+        "output_lines": text.count("\n"),
+        "output_path": output_path,
+        "error": error,
+    }
+
+
+def run_batch(paths, workers: int = None, output_dir: str = None, summary=None, **options):
+    """
+    Run every program in `paths` (files or directories) on a pool of `workers`
+    processes (None: one per CPU; 1: in this process). Each program's `say`
+    output is captured on its own and, with `output_dir`, written to a .out
+    file there. One JSON summary line per program is written to `summary` in
+    input order; the list of summaries is returned.
+    """
+    programs = find_programs(paths)
+    output_paths = [None] * len(programs)
+    if output_dir is not None and programs:
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in programs])
+        output_paths = [
+            os.path.join(output_dir, os.path.relpath(os.path.abspath(p), root) + ".out") for p in programs
+        ]
+
+    def emit(entry):
+        if summary is not None:
+            summary.write(json.dumps(entry) + "\n")
+            summary.flush()
+        return entry
+
+    if workers == 1:
+        return [emit(run_batch_file(p, out, **options)) for p, out in zip(programs, output_paths)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_batch_file, p, out, **options) for p, out in zip(programs, output_paths)]
+        return [emit(future.result()) for future in futures]
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="main.py", description="Run a ZLang program.")
+    parser.add_argument("source_files", nargs="+", metavar="source",
+                        help="a .zl source file; several files or directories run as a batch")
+    parser.add_argument("--no-optimize", dest="optimize", action="store_false",
+                        help="skip literal conversion, constant folding and propagation")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="tree",
+                        help="execution engine: tree-walking interpreter (default), tree-walking over "
+                             "resolved slot frames, an explicit-stack interpreter without a recursion limit, "
+                             "compiled closures, the bytecode VM or Python transpilation")
+    parser.add_argument("--emit-python", action="store_true",
+                        help="print the program transpiled to Python instead of running it")
+    parser.add_argument("--no-cache", dest="cache", action="store_false",
+                        help="always re-parse; neither read nor write __zlcache__")
+    parser.add_argument("--memoize", type=int, default=0, metavar="SIZE",
+                        help="cache results of pure functions, SIZE entries per function "
+                             f"(backends: {', '.join(MEMOIZING_BACKENDS)}; default 0 = off)")
+    parser.add_argument("--no-typecheck", dest="typecheck", action="store_false",
+                        help="run without first reporting operations whose operand types can never work")
+    parser.add_argument("--memo-stats", action="store_true",
+                        help="print per-function memoization hits and misses to stderr")
+    parser.add_argument("--output-buffer", type=int, default=DEFAULT_BUFFER_SIZE, metavar="CHARS",
+                        help="write `say` output in blocks of CHARS characters; input prompts and "
+                             f"program exit flush it (default {DEFAULT_BUFFER_SIZE}; 0 = line by line)")
+    parser.add_argument("--profile", action="store_true",
+                        help="print per-function times and per-statement execution counts to stderr "
+                             f"(backends: {', '.join(PROFILING_BACKENDS)})")
+    parser.add_argument("--profile-stacks", metavar="FILE",
+                        help="with --profile, also write collapsed stacks for flamegraph tools to FILE")
+    parser.add_argument("--max-steps", type=int, metavar="N",
+                        help="stop the program after N loop iterations and function calls "
+                             f"(backends: {', '.join(LIMITING_BACKENDS)})")
+    parser.add_argument("--timeout", type=float, metavar="SECONDS",
+                        help="stop the program once it has run for SECONDS")
+    parser.add_argument("--max-value-size", type=int, metavar="SIZE",
+                        help="stop the program before it builds a string longer than SIZE characters "
+                             "or an integer of more than SIZE bytes")
+    parser.add_argument("--workers", type=int, default=None, metavar="N",
+                        help="batch: worker processes (default one per CPU; 1 = run in this process)")
+    parser.add_argument("--output-dir", metavar="DIR",
+                        help="batch: write each program's output to DIR/<path>.out")
+    parser.add_argument("--summary", metavar="FILE",
+                        help="batch: write the JSON-lines summary to FILE instead of stdout")
+    return parser
 
 
 def main(argv=None):
     argv = argv if argv is not None else sys.argv[1:]
-    if len(argv) != 1:
-        print("Usage: python main.py <source_file.zl>")
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if args.memoize < 0:
+        arg_parser.error("--memoize SIZE must not be negative")
+    if args.output_buffer < 0:
+        arg_parser.error("--output-buffer CHARS must not be negative")
+    if args.memoize and args.backend not in MEMOIZING_BACKENDS:
+        arg_parser.error(f"--memoize is not supported by the {args.backend} backend")
+    if (args.profile or args.profile_stacks) and args.backend not in PROFILING_BACKENDS:
+        arg_parser.error(f"--profile is not supported by the {args.backend} backend")
+    limits = {
+        name: value
+        for name, value in (("max_steps", args.max_steps), ("timeout", args.timeout),
+                            ("max_value_size", args.max_value_size))
+        if value is not None
+    }
+    if any(value <= 0 for value in limits.values()):
+        arg_parser.error("--max-steps, --timeout and --max-value-size must be positive")
+    if limits and args.backend not in LIMITING_BACKENDS:
+        arg_parser.error(f"--max-steps, --timeout and --max-value-size are not supported by the {args.backend} backend")
+    batch = len(args.source_files) > 1 or any(os.path.isdir(path) for path in args.source_files)
+    if batch:
+        if args.emit_python or args.memo_stats or args.profile or args.profile_stacks:
+            arg_parser.error("--emit-python, --memo-stats and --profile take a single source file")
+        if args.workers is not None and args.workers < 1:
+            arg_parser.error("--workers N must be at least 1")
+        summary = open(args.summary, "w", encoding="utf-8") if args.summary else sys.stdout
+        try:
+            results = run_batch(args.source_files, args.workers, args.output_dir, summary,
+                                optimize_ast=args.optimize, backend=args.backend, use_cache=args.cache,
+                                memoize=args.memoize, typecheck=args.typecheck, limits=limits)
+        finally:
+            if summary is not sys.stdout:
+                summary.close()
+        return 0 if all(entry["status"] == "ok" for entry in results) else 1
+
+    source_file = args.source_files[0]
+    if args.emit_python:
+        emit_python(source_file, args.optimize, args.cache)
         return
-    run_file(argv[0])
+    profile = args.profile or bool(args.profile_stacks)
+    try:
+        interp = run_file(source_file, args.optimize, args.backend, args.cache, args.memoize,
+                          args.typecheck, profile, args.output_buffer, limits)
+    except LimitExceeded as e:
+        print("Limit exceeded:", e, file=sys.stderr)
+        return 1
+    if args.memo_stats:
+        print_memo_stats(interp)
+    if profile:
+        write_profile(interp, args.profile_stacks)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
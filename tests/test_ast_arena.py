@@ -0,0 +1,64 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import compiler.Parser.ast as ast_nodes
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.arena import ArenaBuilder, BINARY_EXPR, PROGRAM
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.arena_interpreter import ArenaInterpreter
+
+
+PROGRAMS = [
+    'lit total = 60 * 60 * 24\nvibe main() {\n lit i = 0\n yap i < 3 {\n  say("tick", i, total / 2)\n  i = i + 1\n }\n if i == 3:\n  say("done")\n helper()\n}\nvibe helper() {\n total = total - 1\n say(total >= 86399, total != 5)\n}',
+    'vibe main() {\n name = spill("Name?")\n say("Hi " + name)\n}',
+]
+
+
+def _run(interpreter_cls, program, inputs=()):
+    output = []
+    feed = iter(inputs)
+    interp = interpreter_cls(input_fn=lambda prompt: next(feed), output_fn=lambda *a: output.append(a))
+    interp.interpret(program)
+    return output
+
+
+def test_nodes_have_no_instance_dict():
+    program = Parser(Tokenizer(PROGRAMS[0]).tokenize()).parse()
+    stack = [program]
+    seen = 0
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, ast_nodes.Node):
+            continue
+        seen += 1
+        assert not hasattr(node, "__dict__"), type(node).__name__
+        stack.extend(getattr(node, slot) for slot in ast_nodes.node_fields(type(node)))
+    assert seen > 20
+
+
+def test_arena_layout():
+    arena = Parser(Tokenizer("lit x = 1 + 2").tokenize(), nodes=ArenaBuilder()).parse()
+    assert arena.kinds[arena.root] == PROGRAM
+    (decl,) = arena.items(arena.a[arena.root])
+    assert arena.kind_name(decl) == "VarDecl"
+    assert arena.payload(arena.a[decl]) == "x"
+    binary = arena.b[decl]
+    assert arena.kinds[binary] == BINARY_EXPR
+    assert arena.payload(arena.b[binary]) == "+"
+
+
+def test_arena_interpreter_matches_interpreter():
+    for source in PROGRAMS:
+        tokens = Tokenizer(source).tokenize()
+        expected = _run(Interpreter, Parser(tokens).parse(), ["Ada"])
+        arena = Parser(tokens, nodes=ArenaBuilder()).parse()
+        assert _run(ArenaInterpreter, arena, ["Ada"]) == expected
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.async_interpreter import AsyncInterpreter
+from compiler.semantics.optimizer import optimize
+
+from test_backends import PROGRAMS, run_program
+
+
+GREETER = 'vibe main() {\n name = spill("Name?")\n lit i = 0\n yap i < 3 {\n  say(name, i)\n  i = i + 1\n }\n}'
+
+
+def _parse(source):
+    return Parser(Tokenizer(source).tokenize()).parse()
+
+
+class Session:
+    """A simulated client: answers prompts from a queue and records output."""
+
+    def __init__(self):
+        self.inbox = asyncio.Queue()
+        self.lines = []
+        self.prompts = []
+
+    async def read(self, prompt):
+        self.prompts.append(prompt)
+        return await self.inbox.get()
+
+    async def write(self, *args):
+        self.lines.append(args)
+
+
+def test_programs_behave_like_interpreter():
+    for source in PROGRAMS:
+        for prepare in (lambda p: p, optimize):
+            expected = run_program(Interpreter, prepare(_parse(source)))
+            assert run_program(AsyncInterpreter, prepare(_parse(source))) == expected, source
+
+
+def test_spill_awaits_client_input():
+    async def scenario():
+        program = optimize(_parse(GREETER))
+        sessions = [Session() for _ in range(3)]
+        tasks = [
+            asyncio.create_task(AsyncInterpreter(s.read, s.write).run(program))
+            for s in sessions
+        ]
+        await asyncio.sleep(0.01)
+        # every session is waiting on its prompt, none has said anything yet
+        assert [s.prompts for s in sessions] == [["Name?"]] * 3
+        assert not any(s.lines for s in sessions)
+        for name, session in zip(("c", "b", "a"), reversed(sessions)):
+            await session.inbox.put(name)
+        await asyncio.gather(*tasks)
+        return sessions
+
+    sessions = asyncio.run(scenario())
+    assert [s.lines for s in sessions] == [[(name, i) for i in range(3)] for name in "abc"]
+
+
+def test_busy_sessions_share_the_event_loop():
+    busy = optimize(_parse('lit i = 0\nyap i < 100000 {\n i = i + 1\n}\nsay("busy done")'))
+    quick = optimize(_parse('say("quick done")'))
+    finished = []
+
+    async def run(program, label):
+        await AsyncInterpreter(output_fn=lambda *args: None, time_slice=100).run(program)
+        finished.append(label)
+
+    async def scenario():
+        await asyncio.gather(run(busy, "busy"), run(quick, "quick"))
+
+    asyncio.run(scenario())
+    assert finished == ["quick", "busy"]
+
+
+def test_many_concurrent_sessions():
+    program = optimize(_parse(GREETER))
+
+    async def client(index):
+        session = Session()
+        task = asyncio.create_task(AsyncInterpreter(session.read, session.write, time_slice=10).run(program))
+        await session.inbox.put(f"user{index}")
+        await task
+        return session.lines
+
+    async def scenario():
+        return await asyncio.gather(*(client(index) for index in range(500)))
+
+    results = asyncio.run(scenario())
+    assert results[123] == [("user123", i) for i in range(3)]
+    assert all(len(lines) == 3 for lines in results)
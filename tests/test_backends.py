@@ -0,0 +1,86 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.codegen.closures import ClosureInterpreter
+from compiler.codegen.generator import BytecodeCompiler, VirtualMachine, disassemble
+from compiler.codegen.transpiler import PythonInterpreter, PythonTranspiler
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.stack_interpreter import StackInterpreter
+
+
+# Every alternative execution engine must behave exactly like Interpreter.
+BACKENDS = [StackInterpreter, ClosureInterpreter, VirtualMachine, PythonInterpreter]
+
+PROGRAMS = [
+    'vibe main() {\n lit counter = 0\n yap counter < 3 {\n  say("Looping..")\n  say("counter")\n  counter = counter + 1\n }\n if counter == 3:\n  say("All done!")\n}',
+    'vibe main() {\n name = spill("What is your name?")\n say("My name is " + name)\n}',
+    'lit total = 0\nvibe add() {\n total = total + 10 / 4\n}\nvibe main() {\n add()\n add()\n say(total, total >= 5, total != 5, total < 2, total <= 5, total > 1)\n}',
+    'lit n = 5\nvibe countdown() {\n say(n)\n n = n - 1\n if n > 0: countdown()\n}\ncountdown()',
+    'vibe main() {\n x = 1\n yap x < 100 { x = x * 2 }\n say(x, "3" + "4", "ab" * 2)\n}',
+    'say(undefined_thing)',
+    'vibe main() {\n missing()\n}',
+    'say("a" - 1)',
+    'x = 4\nx()',
+    'vibe main() {\n lit a = 1\n helper()\n}\nvibe helper() {\n say(a)\n}',
+    'lit x = 2\nvibe main() {\n lit x = 3\n say(x)\n x = x + 1\n say(x)\n}\nsay(x)',
+    'vibe setup() {\n fresh = 7\n}\nvibe main() {\n setup()\n say(fresh)\n}',
+    'vibe main() {\n if 0: lit y = 1\n y = 2\n say(y)\n}',
+    'vibe main() {\n if 0: lit y = 1\n say(y)\n}',
+    'vibe main() {\n lit i = 0\n yap i < 3 {\n  if i == 1: say("one")\n  i = i + 1\n }\n say(i)\n}',
+    'lit a = 1 + 2 * 3 - 4 / 2\nsay(a, a == 5, "x" == "x", spill("?") + "!")',
+]
+
+
+def run_program(interpreter_cls, program, inputs=("Ada",)):
+    output = []
+    feed = iter(inputs)
+    interp = interpreter_cls(input_fn=lambda prompt: next(feed), output_fn=lambda *a: output.append(a))
+    try:
+        interp.interpret(program)
+    except Exception as e:
+        output.append((type(e).__name__, str(e)))
+    return output
+
+
+def _parse(source):
+    return Parser(Tokenizer(source).tokenize()).parse()
+
+
+def test_backends_match_interpreter():
+    for source in PROGRAMS:
+        for prepare in (lambda p: p, optimize):
+            expected = run_program(Interpreter, prepare(_parse(source)))
+            for backend in BACKENDS:
+                assert run_program(backend, prepare(_parse(source))) == expected, (backend.__name__, source)
+
+
+def test_disassemble_lists_fused_loop():
+    program = optimize(_parse(PROGRAMS[0]))
+    listing = disassemble(BytecodeCompiler().compile_program(program))
+    assert "code main:" in listing
+    assert "JUMP_IF_NAME_CONST" in listing and "counter < 3" in listing
+    assert "UPDATE_NAME_CONST" in listing and "counter + 1" in listing
+
+
+def test_transpiler_emits_python_functions_and_loops():
+    source = PythonTranspiler().transpile(optimize(_parse(PROGRAMS[0])))
+    compile(source, "<zlang>", "exec")
+    assert "def f_main():" in source
+    assert "while v_counter < 3:" in source
+    assert "v_counter = v_counter + 1" in source
+
+
+def test_transpiler_keeps_conditional_locals_dynamic():
+    source = PythonTranspiler().transpile(_parse(PROGRAMS[-2]))
+    assert "v_i = 0" in source
+    program = _parse('vibe main() {\n if 1: lit y = 2\n say(y)\n}')
+    assert "_zl_locals['y'] = 2" in PythonTranspiler().transpile(program)
+    assert run_program(PythonInterpreter, program) == run_program(Interpreter, program)
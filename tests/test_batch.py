@@ -0,0 +1,73 @@
+import io
+import json
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import main
+
+
+PROGRAMS = {
+    "loop.zl": 'lit i = 0\nyap i < 3 {\n say("line", i)\n i = i + 1\n}',
+    "nested/hello.zl": 'vibe main() {\n say("hello")\n}',
+    "nested/runtime.zl": 'say("before")\nmissing()',
+    "nested/types.zl": 'say("x" - 1)',
+    "parse.zl": 'say(1',
+    "input.zl": 'name = spill("?")',
+}
+
+
+def write_programs(tmp_path):
+    for name, source in PROGRAMS.items():
+        path = tmp_path / "src" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+    return str(tmp_path / "src")
+
+
+def test_batch_statuses_and_outputs(tmp_path):
+    src = write_programs(tmp_path)
+    out_dir = str(tmp_path / "out")
+    summary = io.StringIO()
+    results = main.run_batch([src], workers=2, output_dir=out_dir, summary=summary, use_cache=False)
+
+    lines = [json.loads(line) for line in summary.getvalue().splitlines()]
+    assert lines == results
+    by_name = {os.path.relpath(entry["path"], src).replace(os.sep, "/"): entry for entry in results}
+    assert list(by_name) == sorted(by_name)
+    assert {name: entry["status"] for name, entry in by_name.items()} == {
+        "input.zl": "error",
+        "loop.zl": "ok",
+        "nested/hello.zl": "ok",
+        "nested/runtime.zl": "runtime_error",
+        "nested/types.zl": "type_error",
+        "parse.zl": "parse_error",
+    }
+    loop = by_name["loop.zl"]
+    assert loop["output_lines"] == 3 and loop["output_bytes"] == len("line 0\nline 1\nline 2\n")
+    with open(os.path.join(out_dir, "loop.zl.out"), encoding="utf-8") as f:
+        assert f.read() == "line 0\nline 1\nline 2\n"
+    # output produced before a failure is kept
+    with open(os.path.join(out_dir, "nested", "runtime.zl.out"), encoding="utf-8") as f:
+        assert f.read() == "before\n"
+
+
+def test_in_process_batch_matches_pool(tmp_path):
+    src = write_programs(tmp_path)
+    pooled = main.run_batch([src], workers=2, use_cache=False)
+    serial = main.run_batch([src], workers=1, use_cache=False)
+    strip = lambda entries: [(e["path"], e["status"], e["output_bytes"], e["error"]) for e in entries]
+    assert strip(pooled) == strip(serial)
+
+
+def test_command_line_batch_exit_status(tmp_path, capsys):
+    src = write_programs(tmp_path)
+    ok = os.path.join(src, "loop.zl")
+    assert main.main([ok, os.path.join(src, "nested", "hello.zl"), "--no-cache", "--workers", "1"]) == 0
+    statuses = [json.loads(line)["status"] for line in capsys.readouterr().out.splitlines()]
+    assert statuses == ["ok", "ok"]
+    assert main.main([src, "--no-cache", "--workers", "1"]) == 1
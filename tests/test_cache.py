@@ -0,0 +1,82 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import pytest
+
+import main
+from compiler import cache
+from compiler.semantics.analyzer import Interpreter
+
+
+SOURCE = 'lit total = 1 + 2\nvibe main() {\n lit i = 0\n yap i < 3 { i = i + 1 }\n say(total, i)\n}\n'
+
+
+def write_source(tmp_path, source=SOURCE):
+    path = tmp_path / "prog.zl"
+    path.write_text(source, encoding="utf-8")
+    return str(path)
+
+
+def outputs(program):
+    lines = []
+    Interpreter(output_fn=lambda *a: lines.append(a)).interpret(program)
+    return lines
+
+
+def test_store_and_load_round_trip(tmp_path):
+    path = write_source(tmp_path)
+    program = main.parse_source(SOURCE)
+    assert cache.load(path, SOURCE) is None
+    assert cache.store(path, SOURCE, program)
+    cached = cache.load(path, SOURCE)
+    assert cached is not None and cached is not program
+    assert outputs(cached) == outputs(program) == [(3, 3)]
+
+
+def test_changed_source_or_flavor_misses(tmp_path):
+    path = write_source(tmp_path)
+    cache.store(path, SOURCE, main.parse_source(SOURCE))
+    assert cache.load(path, SOURCE.replace("3", "4")) is None
+    assert cache.load(path, SOURCE, optimize_ast=False) is None
+
+
+def test_corrupt_entry_is_ignored(tmp_path):
+    path = write_source(tmp_path)
+    entry = cache.cache_path(path)
+    os.makedirs(os.path.dirname(entry))
+    with open(entry, "wb") as f:
+        f.write(b"not a pickle")
+    assert cache.load(path, SOURCE) is None
+    assert main.load_program(path) is not None
+    assert cache.load(path, SOURCE) is not None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership")
+def test_entries_owned_by_someone_else_are_ignored(tmp_path, monkeypatch):
+    path = write_source(tmp_path)
+    cache.store(path, SOURCE, main.parse_source(SOURCE))
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    assert cache.load(path, SOURCE) is None
+    monkeypatch.setattr(os, "getuid", lambda: uid)
+    assert cache.load(path, SOURCE) is not None
+
+
+def test_run_file_uses_cache_unless_disabled(tmp_path, monkeypatch):
+    path = write_source(tmp_path)
+    main.main(["--no-cache", path])
+    assert not os.path.exists(tmp_path / cache.CACHE_DIRECTORY)
+
+    main.run_file(path)
+    assert os.path.exists(cache.cache_path(path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not re-parse a cached file")
+
+    monkeypatch.setattr(main, "parse_source", fail)
+    assert outputs(main.load_program(path)) == [(3, 3)]
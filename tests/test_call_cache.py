@@ -0,0 +1,79 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import pickle
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.ast import (
+    Program, FunctionDecl, VarDecl, Assign, WhileStmt, ExprStmt, CallExpr, BinaryExpr, Literal, Identifier,
+)
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.slot_interpreter import SlotInterpreter
+from compiler.semantics.stack_interpreter import StackInterpreter
+
+
+INTERPRETERS = [Interpreter, SlotInterpreter]
+
+ASSIGNED_BUILTIN = 'vibe f() {\n say(sum(squad(1, 2, 3)))\n}\nvibe main() {\n f()\n sum = 5\n f()\n say(sum)\n}'
+
+
+def say(text):
+    return ExprStmt(CallExpr(Identifier("say"), [Literal(text)]))
+
+
+def redefining_program():
+    # the same `f()` call site runs before and after a nested `vibe f` redefines it
+    call_f = ExprStmt(CallExpr(Identifier("f"), []))
+    loop = WhileStmt(
+        BinaryExpr(Identifier("i"), "<", Literal("2")),
+        [call_f, FunctionDecl("f", [], [say("new")]), Assign("i", BinaryExpr(Identifier("i"), "+", Literal("1")))],
+    )
+    return Program([
+        FunctionDecl("f", [], [say("old")]),
+        FunctionDecl("main", [], [VarDecl("i", Literal("0")), loop]),
+    ])
+
+
+def run(interpreter_cls, program):
+    output = []
+    interpreter_cls(output_fn=lambda *a: output.append(a)).interpret(program)
+    return output
+
+
+def test_redefinition_invalidates_call_sites():
+    for interpreter_cls in INTERPRETERS:
+        assert run(interpreter_cls, redefining_program()) == [("old",), ("new",)], interpreter_cls.__name__
+
+
+def test_call_sites_are_not_shared_between_interpreters():
+    program = Parser(Tokenizer('vibe main() {\n say("hi")\n}').tokenize()).parse()
+    for interpreter_cls in INTERPRETERS:
+        first = run(interpreter_cls, program)
+        second = run(interpreter_cls, program)
+        assert first == second == [("hi",)]
+
+
+def test_cached_targets_are_not_pickled():
+    program = Parser(Tokenizer('vibe helper() {\n say(1)\n}\nvibe main() {\n helper()\n}').tokenize()).parse()
+    run(Interpreter, program)
+    call = program.declarations[1].body[0].expression
+    assert call.target is program.declarations[0]
+    copy = pickle.loads(pickle.dumps(program))
+    assert copy.declarations[1].body[0].expression.target is None
+    assert run(Interpreter, copy) == [(1,)]
+
+
+def test_assigning_a_builtin_name_leaves_call_sites_alone():
+    # the cached `sum` target is what an uncached lookup finds after the
+    # assignment too, so it does not matter which of the two ran first
+    assigned_first = ASSIGNED_BUILTIN.replace(" f()\n sum = 5", " sum = 5\n f()")
+    for interpreter_cls in INTERPRETERS + [StackInterpreter]:
+        for source in (ASSIGNED_BUILTIN, assigned_first):
+            program = Parser(Tokenizer(source).tokenize()).parse()
+            assert run(interpreter_cls, program) == [(6,), (6,), (5,)], interpreter_cls.__name__
@@ -0,0 +1,97 @@
+import io
+import os
+import sys
+import tempfile
+import threading
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import pytest
+
+import daemon
+import zlclient
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to about 100 bytes, so stay out of tmp_path
+    directory = tempfile.mkdtemp(prefix="zld")
+    path = os.path.join(directory, "zl.sock")
+    ready = threading.Event()
+    thread = threading.Thread(target=daemon.serve, args=(path, 2, ready), daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield path
+    zlclient.request(path, "stop")
+    thread.join(5)
+    os.rmdir(directory)
+
+
+def _run(path, source, stdin="", **options):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = zlclient.run_remote(path, source, "t.zl", options, io.StringIO(stdin), stdout, stderr)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+def test_runs_programs_with_input_and_output(socket_path):
+    source = 'vibe main() {\n lit name = spill("Name?")\n say("hi", name)\n}'
+    assert _run(socket_path, source, "Ada\n") == (0, "Name?hi Ada\n", "")
+    assert _run(socket_path, source, "Bo\n", backend="stack", output_buffer=0) == (0, "Name?hi Bo\n", "")
+
+    status, out, err = _run(socket_path, source)
+    assert (status, out) == (1, "Name?")
+    assert "EOFError" in err
+
+
+def test_reports_errors_like_main(socket_path):
+    assert _run(socket_path, 'say(1')[:2] == (0, "Parse error: Expected ')' after call (found TokenType.EOF)\n")
+    assert _run(socket_path, 'say("x" - 1)')[1].startswith("Type error:")
+    status, out, err = _run(socket_path, 'say("first")\nmissing()')
+    assert (status, out) == (1, "first\n")
+    assert "ZLangRuntimeError" in err
+    assert _run(socket_path, 'say(1)', backend="nope")[0] == 2
+    status, _, err = _run(socket_path, 'yap 1 == 1 {\n}', limits={"max_steps": 100})
+    assert status == 1 and "LimitExceeded: Step budget of 100 exhausted." in err
+
+
+def test_limits_are_refused_on_backends_that_do_not_enforce_them(socket_path):
+    for backend in ("stack", "closure", "vm", "python"):
+        status, out, err = _run(socket_path, 'yap 1 == 1 {\n}', backend=backend, limits={"max_steps": 100})
+        assert (status, out) == (2, "")
+        assert f"limits are not supported by the {backend} backend" in err
+        with pytest.raises(NotImplementedError):
+            daemon.BACKENDS[backend]().enable_limits(max_steps=100)
+
+
+def test_compiled_programs_are_cached_with_lru_eviction(socket_path):
+    sources = [f"say({n})" for n in range(3)]
+    for source in sources[:2] + sources[:1]:
+        _run(socket_path, source)
+    stats = zlclient.request(socket_path, "stats")
+    assert (stats["hits"], stats["misses"], stats["cached"]) == (1, 2, 2)
+
+    # a third program evicts the least recently used one, say(1)
+    _run(socket_path, sources[2])
+    assert _run(socket_path, sources[0])[1] == "0\n"
+    assert _run(socket_path, sources[1])[1] == "1\n"
+    stats = zlclient.request(socket_path, "stats")
+    assert (stats["hits"], stats["misses"], stats["requests"]) == (2, 4, 6)
+
+
+def test_concurrent_runs_of_one_program_stay_separate(socket_path):
+    source = 'vibe main() {\n lit word = spill("?")\n lit i = 0\n yap i < 200 {\n  i = i + 1\n }\n say(word, i)\n}'
+    _run(socket_path, source, "warm\n")
+    results = {}
+
+    def client(word):
+        results[word] = _run(socket_path, source, word + "\n")
+
+    threads = [threading.Thread(target=client, args=(f"w{n}",)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    assert results == {f"w{n}": (0, f"?w{n} 200\n", "") for n in range(8)}
@@ -0,0 +1,75 @@
+import os
+import random
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.LineIndex import LineIndex
+from compiler.lexer.Tokenizer import Tokenizer
+
+
+def _spans(tokens):
+    return [(t.token_type, t.lexeme, t.start, t.end) for t in tokens]
+
+
+def test_both_engines_report_same_spans():
+    source = 'vibe main() {\n  lit x = 12 // note\n  say("a\nb", x >= 3)\n}'
+    assert _spans(Tokenizer(source).tokenize()) == _spans(Tokenizer(source).tokenize_by_char())
+    buffer = Tokenizer(source).tokenize_buffer()
+    assert [(t.start, t.end) for t in buffer] == [(t.start, t.end) for t in Tokenizer(source).tokenize()]
+
+
+def test_line_index_lookups():
+    source = "lit a = 1\n\nsay(a)\n"
+    index = LineIndex(source)
+    assert len(index) == 4
+    assert index.line_col(0) == (1, 1)
+    assert index.line_col(source.index("say")) == (3, 1)
+    assert index.line_col(source.index("a)")) == (3, 5)
+    assert index.offset_of(3, 5) == source.index("a)")
+
+    tokenizer = Tokenizer(source)
+    tokens = tokenizer.tokenize()
+    assert tokenizer.position(tokens[4]) == (3, 1)
+    assert tokenizer.line_num == 4
+
+
+def test_number_followed_by_newline_counts_one_line():
+    tokenizer = Tokenizer("lit a = 1\nsay(a)")
+    tokenizer.tokenize_by_char()
+    assert tokenizer.line_num == 2
+
+
+def test_relex_matches_full_rescan():
+    base = 'vibe main() {\n  lit counter = 0 // start\n  yap counter < 3 {\n    say("Looping..")\n    counter = counter + 1\n  }\n}\n'
+    pieces = ["", "x", "1", " ", "\n", '"', "//", "/", "=", "lit ", "é", "counter", "}"]
+    rng = random.Random(470)
+    for _ in range(300):
+        tokenizer = Tokenizer(base)
+        tokenizer.tokenize()
+        tokenizer.line_index
+        source = base
+        for _ in range(5):
+            start = rng.randint(0, len(source))
+            end = rng.randint(start, min(len(source), start + 4))
+            text = rng.choice(pieces)
+            source = source[:start] + text + source[end:]
+            tokens = tokenizer.relex(start, end, text)
+            assert tokenizer.source_code == source
+            assert _spans(tokens) == _spans(Tokenizer(source).tokenize())
+            assert list(tokenizer.line_index.line_starts) == list(LineIndex(source).line_starts)
+            assert tokenizer.line_num == source.count("\n") + 1
+
+
+def test_relex_rescans_only_near_the_edit():
+    source = "lit a = 1\n" * 1000
+    tokenizer = Tokenizer(source)
+    before = tokenizer.tokenize()
+    untouched_tail = before[-10]
+    edit = source.index("lit", 5000)
+    after = tokenizer.relex(edit, edit + 3, "lit b = 2\nlit")
+    assert after[-10] is untouched_tail
+    assert _spans(after) == _spans(Tokenizer(tokenizer.source_code).tokenize())
@@ -0,0 +1,120 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import pytest
+
+import main
+from compiler.semantics.analyzer import Interpreter, ZLangRuntimeError
+from compiler.semantics.limits import LimitExceeded
+from compiler.semantics.slot_interpreter import SlotInterpreter
+
+
+INTERPRETERS = (Interpreter, SlotInterpreter)
+
+FOREVER = 'lit i = 0\nyap 1 == 1 {\n i = i + 1\n}'
+
+
+def _run(interpreter_cls, source, optimize_ast=True, **limits):
+    output = []
+    interp = interpreter_cls(output_fn=lambda *args: output.append(args))
+    interp.enable_limits(**limits)
+    interp.interpret(main.compile_source(source, optimize_ast))
+    return interp, output
+
+
+@pytest.mark.parametrize("interpreter_cls", INTERPRETERS)
+def test_step_budget_counts_iterations_and_calls(interpreter_cls):
+    source = 'vibe f() {\n g()\n}\nvibe g() {\n}\nlit i = 0\nyap i < 10 {\n f()\n i = i + 1\n}'
+    interp, _ = _run(interpreter_cls, source, max_steps=30)
+    assert interp.limits.steps == 30
+
+    with pytest.raises(LimitExceeded) as caught:
+        _run(interpreter_cls, source, max_steps=29)
+    assert caught.value.limit == "steps"
+
+    with pytest.raises(LimitExceeded) as caught:
+        _run(interpreter_cls, FOREVER, max_steps=5000)
+    assert isinstance(caught.value, ZLangRuntimeError)
+    assert str(caught.value) == "Step budget of 5000 exhausted."
+
+
+@pytest.mark.parametrize("interpreter_cls", INTERPRETERS)
+def test_deadline_stops_an_endless_loop(interpreter_cls):
+    now = [0.0]
+
+    def clock():
+        now[0] += 0.001
+        return now[0]
+
+    with pytest.raises(LimitExceeded) as caught:
+        _run(interpreter_cls, FOREVER, timeout=0.5, clock=clock)
+    assert caught.value.limit == "time"
+
+
+@pytest.mark.parametrize("interpreter_cls", INTERPRETERS)
+@pytest.mark.parametrize("optimize_ast", (True, False))
+def test_value_size_cap(interpreter_cls, optimize_ast):
+    doubling = 'lit s = "ab"\nyap 1 == 1 {\n s = s + s\n}'
+    squaring = 'lit n = 3\nyap 1 == 1 {\n n = n * n\n}'
+    # the repetition is refused before it allocates anything
+    repeat = 'lit n = 10\nn = n * 100000000000\nsay("x" * n)'
+    for source in (doubling, squaring, repeat):
+        with pytest.raises(LimitExceeded) as caught:
+            _run(interpreter_cls, source, optimize_ast, max_value_size=100_000)
+        assert caught.value.limit == "size"
+
+    _, output = _run(interpreter_cls, 'say("ab" * 3, 2 + 3)', optimize_ast, max_value_size=6)
+    assert output == [("ababab", 5)]
+
+
+@pytest.mark.parametrize("interpreter_cls", INTERPRETERS)
+@pytest.mark.parametrize("optimize_ast", (True, False))
+def test_differences_are_size_checked(interpreter_cls, optimize_ast):
+    # x - (0 - x) doubles x without a `+` or `*`
+    source = 'lit x = 1\nlit y = 0\nyap 1 == 1 {\n y = 0 - x\n x = x - y\n}'
+    with pytest.raises(LimitExceeded) as caught:
+        _run(interpreter_cls, source, optimize_ast, max_value_size=16)
+    assert caught.value.limit == "size"
+    _, output = _run(interpreter_cls, 'say(3 - 5, 1 / 2 - 2)', optimize_ast, max_value_size=1)
+    assert output == [(-2, -1.5)]
+
+
+def test_command_line_limits(tmp_path, capsys):
+    path = tmp_path / "forever.zl"
+    path.write_text('say("start")\n' + FOREVER, encoding="utf-8")
+    assert main.main([str(path), "--no-cache", "--max-steps", "1000"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == "start\n"
+    assert captured.err == "Limit exceeded: Step budget of 1000 exhausted.\n"
+
+    entry = main.run_batch_file(str(path), use_cache=False, limits={"max_steps": 1000})
+    assert (entry["status"], entry["output_bytes"]) == ("limit_exceeded", len("start\n"))
+
+
+@pytest.mark.parametrize("interpreter_cls", INTERPRETERS)
+@pytest.mark.parametrize("optimize_ast", (True, False))
+def test_squads_are_size_checked_and_metered(interpreter_cls, optimize_ast):
+    # refused before the squad is allocated
+    for source in ('lit xs = range(10000000)\nlit ys = xs * xs', 'lit xs = squad(1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13)'):
+        with pytest.raises(LimitExceeded) as caught:
+            _run(interpreter_cls, source, optimize_ast, max_steps=10, max_value_size=100)
+        assert caught.value.limit == "size"
+
+    # every element built, combined or reduced costs a step
+    interp, output = _run(interpreter_cls, 'lit xs = range(5)\nsay(sum(xs * 2 - 1), min(xs > 2))', optimize_ast,
+                          max_steps=1000)
+    assert output == [(15, 0)]
+    # range, *, -, sum, > and min
+    assert interp.limits.steps == 6 * 5
+    with pytest.raises(LimitExceeded) as caught:
+        _run(interpreter_cls, 'lit xs = range(1000)\nlit ys = xs - 1', optimize_ast, max_steps=1500)
+    assert caught.value.limit == "steps"
+
+    # a user function still takes the place of a metered builtin
+    _, output = _run(interpreter_cls, 'vibe sum() {\n say("mine")\n}\nsum()', optimize_ast, max_steps=10)
+    assert output == [("mine",)]
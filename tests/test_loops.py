@@ -0,0 +1,84 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.ast import FastLoop, InvariantExpr, walk
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.loops import optimize_loops
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.slot_interpreter import SlotInterpreter
+
+from test_backends import BACKENDS, run_program
+
+
+LOOP_PROGRAMS = [
+    # counter loops, up and down, with `<=`, `!=` and float steps
+    'lit i = 0\nlit total = 0\nyap i <= 10 {\n total = total + i\n i = i + 1\n}\nsay(i, total)',
+    'vibe main() {\n lit i = 10\n yap i > 0 {\n  say(i)\n  i = i - 3\n }\n say(i)\n}',
+    'vibe main() {\n lit x = 0\n yap x != 3 {\n  x = x + 1 / 2\n }\n say(x)\n}',
+    # invariants recomputed when an outer loop changes them
+    'vibe main() {\n lit a = 0\n yap a < 3 {\n  lit b = 0\n  yap b < a * 2 {\n   say(a * 10 + b, a + 1)\n   b = b + 1\n  }\n  a = a + 1\n }\n}',
+    # a loop that never runs must not raise for its (broken) invariant
+    'vibe main() {\n lit n = 0\n lit s = "x"\n yap n > 0 {\n  say(s - 1)\n  n = n - 1\n }\n say("done")\n}',
+    # ... and one that does run raises at the original point
+    'vibe main() {\n lit n = 2\n lit s = "x"\n yap n > 0 {\n  say(n)\n  say(s - 1)\n  n = n - 1\n }\n}',
+    # calls may change any global, so nothing global is invariant
+    'lit g = 1\nvibe bump() {\n g = g + 1\n}\nvibe main() {\n lit i = 0\n yap i < 3 {\n  say(g * 2)\n  bump()\n  i = i + 1\n }\n}',
+    'lit i = 0\nvibe skip() {\n i = i + 1\n}\nyap i < 6 {\n say(i)\n skip()\n i = i + 1\n}',
+    # the counter is reassigned elsewhere in the body
+    'vibe main() {\n lit i = 0\n yap i < 10 {\n  if i == 2: i = 7\n  say(i)\n  i = i + 1\n }\n}',
+    # a non-numeric counter fails like the plain loop does
+    'vibe main() {\n lit i = "a"\n yap i != 3 {\n  i = i + 1\n }\n}',
+    # recursion through a function with its own loop
+    'lit depth = 3\nvibe down() {\n lit k = 0\n lit d = depth\n yap k < d + 1 {\n  say(d, k)\n  k = k + 1\n }\n depth = depth - 1\n if depth > 0: down()\n}\ndown()',
+    # ... and recursion from inside the loop, whose invariant differs per call
+    'lit depth = 2\nvibe f() {\n lit n = depth\n depth = depth - 1\n lit i = 0\n yap i < 2 {\n  say(n * 10 + i)\n  if n > 0: f()\n  i = i + 1\n }\n}\nf()',
+]
+
+
+def _parse(source):
+    return Parser(Tokenizer(source).tokenize()).parse()
+
+
+def test_loop_programs_behave_the_same():
+    for source in LOOP_PROGRAMS:
+        expected = run_program(Interpreter, _parse(source))
+        for interpreter_cls in [Interpreter, SlotInterpreter] + BACKENDS:
+            assert run_program(interpreter_cls, optimize(_parse(source))) == expected, (interpreter_cls.__name__, source)
+
+
+def test_counter_loop_and_invariants_are_recognized():
+    program = optimize(_parse(LOOP_PROGRAMS[3]))
+    loops = [node for node in walk(program) if isinstance(node, FastLoop)]
+    assert len(loops) == 2
+    outer, inner = loops
+    assert outer.counter == "a" and outer.step_operator == "+" and outer.step == 1
+    assert inner.counter == "b" and isinstance(inner.bound, InvariantExpr)
+    # `a * 10` and `a + 1` do not change inside the inner loop
+    hoisted = {node for node in walk(inner) if isinstance(node, InvariantExpr)}
+    assert hoisted == set(inner.invariants) and len(hoisted) == 3
+
+
+def test_loops_with_calls_or_reassigned_counters_stay_plain():
+    program = optimize_loops(_parse(LOOP_PROGRAMS[6]))
+    assert not any(isinstance(node, (FastLoop, InvariantExpr)) for node in walk(program))
+    program = optimize_loops(_parse(LOOP_PROGRAMS[8]))
+    assert not any(isinstance(node, FastLoop) for node in walk(program))
+
+
+def test_invariants_are_cached_outside_the_program_namespace():
+    output = []
+    interp = Interpreter(output_fn=lambda *args: output.append(args))
+    # separately optimized programs, run by one interpreter
+    for source in ('lit a = 2\nlit i = 0\nyap i < 2 {\n say(a * 3)\n i = i + 1\n}',
+                   'lit b = 5\nlit j = 0\nyap j < 2 {\n say(b * 7)\n j = j + 1\n}'):
+        interp.interpret(optimize(_parse(source)))
+    assert output == [(6,), (6,), (35,), (35,)]
+    assert set(interp.globals.values) >= {"a", "i", "b", "j"}
+    assert not any(name.startswith("$") for name in interp.globals.values)
@@ -0,0 +1,77 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.ast import BinaryExpr, Constant, Literal, walk
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+
+
+def _parse(source):
+    return Parser(Tokenizer(source).tokenize()).parse()
+
+
+def _run(program, inputs=()):
+    output = []
+    feed = iter(inputs)
+    interp = Interpreter(input_fn=lambda prompt: next(feed), output_fn=lambda *a: output.append(a))
+    try:
+        interp.interpret(program)
+    except Exception as e:
+        output.append((type(e).__name__, str(e)))
+    return output
+
+
+def _assert_same_behaviour(source, inputs=()):
+    assert _run(optimize(_parse(source)), inputs) == _run(_parse(source), inputs)
+
+
+def test_literals_become_constants_and_fold():
+    program = optimize(_parse("lit day = 60 * 60 * 24\nlit half = day / 2\nsay(\"a\" + \"b\")"))
+    assert not any(isinstance(n, Literal) for n in walk(program))
+    day, half, call = program.declarations
+    assert isinstance(day.initializer, Constant) and day.initializer.value == 86400
+    assert isinstance(half.initializer, Constant) and half.initializer.value == 43200.0
+    assert call.expression.args[0].value == "ab"
+
+
+def test_reassigned_and_conditional_declarations_are_not_propagated():
+    program = optimize(_parse("lit a = 1\na = 2\nif a: lit b = 3\nsay(a, b)"))
+    say_args = program.declarations[-1].expression.args
+    assert [type(arg).__name__ for arg in say_args] == ["Identifier", "Identifier"]
+
+
+def test_globals_not_propagated_into_functions_called_before_declaration():
+    source = "vibe show() {\n say(x)\n}\nshow()\nlit x = 5\nvibe main() {\n show()\n}"
+    program = optimize(_parse(source))
+    show = program.declarations[0]
+    assert type(show.body[0].expression.args[0]).__name__ == "Identifier"
+    _assert_same_behaviour(source)
+
+
+def test_failing_operations_are_left_for_runtime():
+    program = optimize(_parse('say("x" - 1, 1 / 0)'))
+    assert all(isinstance(arg, BinaryExpr) for arg in program.declarations[0].expression.args)
+    _assert_same_behaviour('say("x" - 1)')
+    _assert_same_behaviour('say(1 / 0)')
+
+
+def test_optimized_programs_print_the_same():
+    sources = [
+        'lit day = 60 * 60 * 24\nvibe main() {\n lit i = 0\n lit n = 3\n yap i < n {\n  say("tick", i, day * 2, "in" + "f")\n  i = i + 1\n }\n if i == n:\n  say("done", 3 / 2 * 2, "3" + "4")\n}',
+        'vibe main() {\n name = spill("Name?")\n say("My name is " + name)\n}',
+        'lit total = 0\nvibe add() {\n total = total + 10 / 4\n}\nvibe main() {\n add()\n add()\n say(total, total >= 5, total != 5)\n}',
+    ]
+    for source in sources:
+        _assert_same_behaviour(source, ["Ada"])
+
+
+def test_long_operator_chains_do_not_recurse():
+    program = optimize(_parse("say(" + " + ".join(["1"] * 5000) + ")"))
+    assert program.declarations[0].expression.args[0].value == 5000
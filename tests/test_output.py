@@ -0,0 +1,65 @@
+import io
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import pytest
+
+import main
+from compiler.codegen.transpiler import PythonInterpreter
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter, ZLangRuntimeError
+from compiler.semantics.output import BufferedOutput
+
+
+def _parse(source):
+    return Parser(Tokenizer(source).tokenize()).parse()
+
+
+def test_formats_like_print_and_flushes_at_threshold():
+    stream = io.StringIO()
+    output = BufferedOutput(stream, buffer_size=12)
+    output("a", 1, 2.5)
+    output()
+    assert stream.getvalue() == ""
+    output(True)
+    assert stream.getvalue() == "a 1 2.5\n\nTrue\n"
+    output("tail")
+    output.flush()
+
+    expected = io.StringIO()
+    for args in (("a", 1, 2.5), (), (True,), ("tail",)):
+        print(*args, file=expected)
+    assert stream.getvalue() == expected.getvalue()
+
+
+def test_spill_flushes_before_reading():
+    source = 'say("before")\nname = spill("Name?")\nsay("hi", name)'
+    for interpreter_cls in (Interpreter, PythonInterpreter):
+        stream = io.StringIO()
+        seen = []
+
+        def read(prompt):
+            seen.append(stream.getvalue())
+            return "Ada"
+
+        output = BufferedOutput(stream)
+        interpreter_cls(input_fn=read, output_fn=output).interpret(_parse(source))
+        assert seen == ["before\n"]
+        assert stream.getvalue() == "before\n"
+        output.flush()
+        assert stream.getvalue() == "before\nhi Ada\n"
+
+
+def test_main_flushes_at_exit_and_on_errors(capsys):
+    main.run_source('vibe main() {\n lit i = 0\n yap i < 3 {\n  say(i)\n  i = i + 1\n }\n}')
+    assert capsys.readouterr().out == "0\n1\n2\n"
+
+    with pytest.raises(ZLangRuntimeError):
+        main.run_source('say("first")\nsay(nowhere())')
+    assert capsys.readouterr().out == "first\n"
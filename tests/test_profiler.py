@@ -0,0 +1,97 @@
+import io
+import itertools
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.slot_interpreter import SlotInterpreter
+
+from test_backends import PROGRAMS, run_program
+
+
+SOURCE = (
+    'lit n = 0\n'
+    'vibe leaf() {\n n = n + 1\n}\n'
+    'vibe helper() {\n lit i = 0\n yap i < 5 {\n  leaf()\n  i = i + 1\n }\n}\n'
+    'vibe main() {\n helper()\n helper()\n say(n)\n}'
+)
+
+
+def _parse(source):
+    return Parser(Tokenizer(source).tokenize()).parse()
+
+
+def _profile(interpreter_cls, source, clock=None):
+    interp = interpreter_cls(output_fn=lambda *args: None)
+    if clock is None:
+        interp.enable_profiling()
+    else:
+        interp.enable_profiling(clock)
+    interp.interpret(_parse(source))
+    return interp.profiler
+
+
+def test_calls_and_statement_counts():
+    for interpreter_cls in (Interpreter, SlotInterpreter):
+        profiler = _profile(interpreter_cls, SOURCE)
+        calls = {name: calls for name, calls, _, _ in profiler.function_table()}
+        assert calls == {"<top level>": 1, "main": 1, "helper": 2, "leaf": 10}
+        counts = {label: count for count, label in profiler.statement_table()}
+        assert counts["leaf():0  n = n + 1"] == 10
+        assert counts["helper():1.0  leaf()"] == 10
+        assert counts["helper():1  yap i < 5 {"] == 2
+        assert counts["main():2  say(n)"] == 1
+
+
+def test_inclusive_and_exclusive_times():
+    # every clock reading advances time by one unit
+    profiler = _profile(Interpreter, SOURCE, clock=itertools.count().__next__)
+    table = {name: (inclusive, exclusive) for name, _, inclusive, exclusive in profiler.function_table()}
+    # a leaf call spans its own two readings
+    assert table["leaf"] == (10, 10)
+    main_inclusive, main_exclusive = table["main"]
+    helper_inclusive, helper_exclusive = table["helper"]
+    assert main_inclusive == main_exclusive + helper_inclusive
+    assert helper_inclusive == helper_exclusive + table["leaf"][0]
+    stacks = dict(line.rsplit(" ", 1) for line in profiler.collapsed_stacks())
+    assert stacks["<top level>;main;helper;leaf"] == str(10_000_000)
+
+
+def test_recursive_calls_count_inclusive_time_once():
+    source = 'lit k = 3\nvibe down() {\n k = k - 1\n if k > 0: down()\n}\ndown()'
+    profiler = _profile(Interpreter, source, clock=itertools.count().__next__)
+    (row,) = [row for row in profiler.function_table() if row[0] == "down"]
+    name, calls, inclusive, exclusive = row
+    assert calls == 3
+    assert inclusive == exclusive
+    assert any(line.startswith("<top level>;down;down;down ") for line in profiler.collapsed_stacks())
+
+
+def test_report_and_unprofiled_interpreters():
+    profiler = _profile(Interpreter, SOURCE)
+    out = io.StringIO()
+    profiler.report(file=out, statements=3)
+    lines = out.getvalue().splitlines()
+    assert lines[0].split() == ["function", "calls", "inclusive", "ms", "exclusive", "ms"]
+    assert len([line for line in lines if line.endswith("n = n + 1")]) == 1
+
+    # profiling is installed per instance and leaves other interpreters alone
+    plain = Interpreter()
+    assert plain.profiler is None and "_execute" not in vars(plain)
+
+
+def test_profiled_programs_behave_the_same():
+    class Profiled(Interpreter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.enable_profiling()
+
+    for source in PROGRAMS:
+        assert run_program(Profiled, _parse(source)) == run_program(Interpreter, _parse(source)), source
@@ -0,0 +1,88 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.purity import LRUCache, analyze_purity
+from compiler.semantics.slot_interpreter import SlotInterpreter
+
+from test_backends import PROGRAMS, run_program
+
+
+MEMOIZING = [Interpreter, SlotInterpreter]
+
+
+def _parse(source):
+    return Parser(Tokenizer(source).tokenize()).parse()
+
+
+def memoizing(interpreter_cls, maxsize=8):
+    class Memoizing(interpreter_cls):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.enable_memoization(maxsize)
+
+    return Memoizing
+
+
+def test_purity_classification():
+    program = _parse(
+        'lit g = 1\n'
+        'vibe reads() {\n lit x = g * 2\n}\n'
+        'vibe prints() {\n say(1)\n}\n'
+        'vibe writes() {\n g = 2\n}\n'
+        'vibe local_only() {\n lit y = 0\n y = y + 1\n}\n'
+        'vibe calls_prints() {\n prints()\n}\n'
+        'vibe calls_reads() {\n reads()\n}\n'
+        'vibe calls_missing() {\n nowhere()\n}\n'
+        'vibe maybe_local() {\n if g: lit z = 1\n z = 2\n}\n'
+    )
+    pure = analyze_purity(program)
+    assert pure == {"reads", "local_only", "calls_reads"}
+    by_name = {decl.name: decl for decl in program.declarations if hasattr(decl, "body")}
+    assert by_name["reads"].global_reads == ("g",)
+    assert by_name["calls_reads"].global_reads == ("g",)
+    assert by_name["local_only"].global_reads == ()
+
+
+def test_memoized_programs_behave_the_same():
+    for source in PROGRAMS:
+        for interpreter_cls in MEMOIZING:
+            expected = run_program(interpreter_cls, _parse(source))
+            assert run_program(memoizing(interpreter_cls), _parse(source)) == expected, source
+
+
+def test_hits_misses_and_global_state():
+    source = (
+        'lit n = 10\n'
+        'vibe spin() {\n lit k = 0\n yap k < n { k = k + 1 }\n}\n'
+        'spin()\nspin()\nn = 20\nspin()\nspin()\nn = 10\nspin()'
+    )
+    for interpreter_cls in MEMOIZING:
+        interp = memoizing(interpreter_cls)(output_fn=lambda *a: None)
+        interp.interpret(_parse(source))
+        assert interp.memo.stats() == {"spin": {"hits": 3, "misses": 2, "size": 2, "maxsize": 8}}
+
+
+def test_failed_calls_are_not_cached():
+    source = 'vibe check() {\n lit y = x + 1\n}\nlit x = "s"\ncheck()'
+    for interpreter_cls in MEMOIZING:
+        output = run_program(memoizing(interpreter_cls), _parse(source))
+        assert output == [("TypeError", 'can only concatenate str (not "int") to str')]
+
+
+def test_lru_eviction():
+    cache = LRUCache(2)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    assert cache.lookup("a") == (True, 1)
+    cache.store("c", 3)
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("a") == (True, 1) and cache.lookup("c") == (True, 3)
+    assert (cache.hits, cache.misses, len(cache)) == (3, 1, 2)
@@ -0,0 +1,75 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.ast import walk, Identifier, VarDecl, Assign
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.optimizer import optimize
+from compiler.semantics.resolver import GLOBAL, LOCAL, LOCAL_OR_GLOBAL, ResolveError, Resolver
+from compiler.semantics.slot_interpreter import SlotInterpreter
+
+from test_backends import PROGRAMS, run_program
+
+
+def _parse(source):
+    return Parser(Tokenizer(source).tokenize()).parse()
+
+
+def coordinates(program):
+    found = {}
+    for node in walk(program):
+        if isinstance(node, (Identifier, VarDecl, Assign)) and node.depth is not None:
+            found.setdefault((type(node).__name__, node.name), set()).add((node.depth, node.slot))
+    return found
+
+
+def test_slot_interpreter_matches_interpreter():
+    for source in PROGRAMS:
+        for prepare in (lambda p: p, optimize):
+            expected = run_program(Interpreter, prepare(_parse(source)))
+            actual = run_program(SlotInterpreter, prepare(_parse(source)))
+            if actual and actual[-1][0] == "ResolveError":
+                # statically reported; the tree-walker hits the same name at runtime
+                assert expected[-1] == ("ZLangRuntimeError", actual[-1][1]), source
+            else:
+                assert actual == expected, source
+
+
+def test_coordinates():
+    program = Resolver().resolve(_parse(
+        'lit total = 0\n'
+        'vibe main() {\n lit i = 0\n if i == 0: lit maybe = 1\n maybe = 2\n total = total + i\n}\n'
+    ))
+    found = coordinates(program)
+    assert found[("VarDecl", "total")] == {(LOCAL, 0)}
+    assert found[("VarDecl", "i")] == {(LOCAL, 0)}
+    assert found[("Identifier", "i")] == {(LOCAL, 0)}
+    assert found[("VarDecl", "maybe")] == {(LOCAL, 1)}
+    assert found[("Assign", "maybe")] == {(LOCAL_OR_GLOBAL, 1)}
+    assert found[("Assign", "total")] == {(GLOBAL, 0)}
+    assert found[("Identifier", "total")] == {(GLOBAL, 0)}
+    assert program.declarations[1].frame_size == 2
+
+
+def test_undefined_variables_reported_before_running():
+    output = []
+    program = _parse('say("start")\nvibe never_called() {\n say(ghost, other)\n}\nsay(ghost)')
+    try:
+        SlotInterpreter(output_fn=lambda *a: output.append(a)).interpret(program)
+    except ResolveError as e:
+        assert e.errors == ["Undefined variable 'ghost'.", "Undefined variable 'other'."]
+    else:
+        raise AssertionError("expected a ResolveError")
+    assert output == []
+
+
+def test_use_before_definition_is_still_a_runtime_error():
+    program = _parse('vibe main() {\n say(late)\n}\nmain()\nlit late = 1')
+    assert run_program(SlotInterpreter, program) == run_program(Interpreter, _parse(
+        'vibe main() {\n say(late)\n}\nmain()\nlit late = 1'))
@@ -0,0 +1,127 @@
+import asyncio
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import pytest
+
+import main
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.async_interpreter import AsyncInterpreter
+from compiler.semantics.limits import LimitExceeded
+from compiler.semantics.output import BufferedOutput
+from compiler.semantics.rope import MIN_ROPE_LENGTH, Rope, concat
+from compiler.semantics.slot_interpreter import SlotInterpreter
+from compiler.semantics.stack_interpreter import StackInterpreter
+
+
+INTERPRETERS = (Interpreter, SlotInterpreter)
+
+BUILD = 'lit s = ""\nlit i = 0\nyap i < 2000 {\n s = s + "ab"\n i = i + 1\n}\n'
+
+
+def _run(interpreter_cls, source, optimize_ast=True):
+    output = []
+    interp = interpreter_cls(output_fn=lambda *args: output.append(args))
+    interp.interpret(main.compile_source(source, optimize_ast))
+    return interp, output
+
+
+def test_long_concatenations_are_ropes():
+    short = concat("a" * 10, "b")
+    assert type(short) is str
+    left = "a" * MIN_ROPE_LENGTH
+    rope = concat(concat(left, "b"), "c")
+    assert isinstance(rope, Rope) and len(rope) == MIN_ROPE_LENGTH + 2
+    assert concat(1, 2) == 3
+
+    # joined once, then kept; the halves it was built from are unchanged
+    half = rope.left
+    assert str(rope) == left + "bc" and rope.right is None
+    assert str(half) == left + "b"
+    assert str(rope + "d") == left + "bcd" and str("<" + rope) == "<" + left + "bc"
+
+
+def test_ropes_behave_like_strings():
+    text = "x" * MIN_ROPE_LENGTH + "y"
+    rope = concat("x" * MIN_ROPE_LENGTH, "y")
+    assert rope == text and text == rope and rope != text + "z"
+    assert rope == concat("x", "x" * (MIN_ROPE_LENGTH - 1) + "y")
+    assert rope > "x" and "z" > rope
+    assert {text: 1}[rope] == 1
+    assert rope * 2 == 2 * rope == text * 2
+    assert f"{rope}" == repr(rope)[1:-1] == text
+    with pytest.raises(TypeError, match="can only concatenate str"):
+        rope + 1
+    with pytest.raises(TypeError):
+        rope < 1
+
+
+def test_deep_ropes_flatten_without_recursion():
+    rope = "a" * MIN_ROPE_LENGTH
+    for _ in range(100_000):
+        rope = concat(rope, "b")
+    front = "a" * MIN_ROPE_LENGTH
+    for _ in range(100_000):
+        front = concat("b", front)
+    assert str(rope) == "a" * MIN_ROPE_LENGTH + "b" * 100_000
+    assert str(front) == "b" * 100_000 + "a" * MIN_ROPE_LENGTH
+
+
+@pytest.mark.parametrize("interpreter_cls", INTERPRETERS)
+@pytest.mark.parametrize("optimize_ast", (True, False))
+def test_string_building_in_a_loop(interpreter_cls, optimize_ast):
+    source = BUILD + 'say(len(s), len(s + "!"), s == "ab" * 2000, s + "!" > s)\nlit t = s * 2\nsay(len(t))\nsay(s)'
+    interp, output = _run(interpreter_cls, source, optimize_ast)
+    assert output[:2] == [(4000, 4001, True, True), (8000,)]
+    assert type(output[2][0]) is str and output[2][0] == "ab" * 2000
+
+
+@pytest.mark.parametrize("backend", sorted(main.BACKENDS))
+def test_say_hands_output_fn_strings(backend):
+    output = []
+
+    def output_fn(*args):
+        assert all(type(arg) is not Rope for arg in args)
+        output.append(args)
+
+    interp = main.BACKENDS[backend](input_fn=lambda prompt: "x" * 300, output_fn=output_fn)
+    interp.interpret(main.compile_source('lit a = spill("")\nlit b = a + a\nsay(b, len(b))'))
+    assert output == [("x" * 600, 600)]
+
+
+def test_say_prints_ropes_as_text(capsys):
+    buffered = BufferedOutput(sys.stdout)
+    for output_fn in (print, buffered):
+        Interpreter(output_fn=output_fn).interpret(main.compile_source(BUILD + 'say(s, len(s))'))
+    buffered.flush()
+    assert capsys.readouterr().out == ("ab" * 2000 + " 4000\n") * 2
+
+
+@pytest.mark.parametrize("interpreter_cls", INTERPRETERS)
+def test_size_limit_covers_ropes(interpreter_cls):
+    interp = interpreter_cls(output_fn=lambda *args: None)
+    interp.enable_limits(max_value_size=3000)
+    with pytest.raises(LimitExceeded) as caught:
+        interp.interpret(main.compile_source(BUILD))
+    assert caught.value.limit == "size"
+
+
+def test_stack_interpreters_build_ropes():
+    interp, output = _run(StackInterpreter, BUILD + 'say(s, len(s))')
+    assert isinstance(interp.globals.values["s"], Rope)
+    assert output == [("ab" * 2000, 4000)]
+
+    output = []
+
+    async def write(*args):
+        output.append(args)
+
+    interp = AsyncInterpreter(output_fn=write)
+    asyncio.run(interp.run(main.compile_source(BUILD + 'say(s, len(s))')))
+    assert isinstance(interp.globals.values["s"], Rope)
+    assert output == [("ab" * 2000, 4000)]
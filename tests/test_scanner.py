@@ -0,0 +1,54 @@
+import os
+import random
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+
+
+def _stream(tokens):
+    return [(t.token_type, t.lexeme, t.start, t.end) for t in tokens]
+
+
+def _assert_same(source):
+    expected = _stream(Tokenizer(source).tokenize_by_char())
+    actual = _stream(Tokenizer(source).tokenize())
+    assert actual == expected, source
+
+
+def test_examples_match_character_loop():
+    for name in ["hello.zl", "counter.zl"]:
+        with open(os.path.join(root_path, "examples", name), "r", encoding="utf-8") as f:
+            _assert_same(f.read())
+
+
+def test_edge_cases_match_character_loop():
+    cases = [
+        "",
+        "   \n\t\r",
+        "// only a comment",
+        "a//b\nc",
+        "x == y != z >= 1 <= 2 > 3 < 4 = 5",
+        "! ? @ # $ % . [ ]",
+        "_leading under_score trailing_",
+        "LIT Say VIBE lit_x yapper",
+        "123abc 007 12.5",
+        '"unterminated',
+        '"',
+        '"multi\nline" "" "a//b"',
+        "café naïve ünïcödé ٣٤ x²y 12² ½",
+    ]
+    for source in cases:
+        _assert_same(source)
+
+
+def test_random_sources_match_character_loop():
+    alphabet = list('abcXYZ_019 \t\n"/=!<>+-*(),:;{}.#é²٣') + ["//", "lit ", "yap ", "\r\n"]
+    rng = random.Random(470)
+    for _ in range(500):
+        source = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        _assert_same(source)
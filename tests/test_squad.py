@@ -0,0 +1,139 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+import pytest
+
+import main
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.arena import ArenaBuilder
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import BUILTIN_RESULT_TYPES, TypeCheckError, ZLangRuntimeError, check_types
+from compiler.semantics.arena_interpreter import ArenaInterpreter
+from compiler.semantics.purity import PURE_BUILTINS, analyze_purity
+from compiler.semantics.resolver import ResolveError
+from compiler.semantics.squad import SQUAD_BUILTINS, Squad
+
+
+def _run(source, backend="tree", optimize_ast=True):
+    output = []
+    interp = main.BACKENDS[backend](output_fn=lambda *args: output.append(args))
+    interp.interpret(main.compile_source(source, optimize_ast))
+    return output
+
+
+def _values(value):
+    return value.tolist() if isinstance(value, Squad) else value
+
+
+def test_builtins_are_known_to_every_analysis():
+    assert set(SQUAD_BUILTINS) == set(PURE_BUILTINS)
+    assert set(SQUAD_BUILTINS) <= set(BUILTIN_RESULT_TYPES)
+
+
+@pytest.mark.parametrize("backend", sorted(main.BACKENDS))
+def test_element_wise_operators_and_builtins(backend):
+    source = (
+        'lit xs = squad(1, 2, 3, 4)\n'
+        'lit ys = xs * 2 + 1\n'
+        'say(ys, len(ys), sum(ys), min(ys), max(ys))\n'
+        'say(xs / 2, xs > 2, 10 - xs, xs + ys)\n'
+        'lit v = slice(range(10), 2, 5)\n'
+        'say(v, at(v, 0), at(v, 0 - 1), len("four"))'
+    )
+    for optimize_ast in (True, False):
+        output = [tuple(map(_values, line)) for line in _run(source, backend, optimize_ast)]
+        assert output == [
+            ([3, 5, 7, 9], 4, 24, 3, 9),
+            ([0.5, 1.0, 1.5, 2.0], [0, 0, 1, 1], [9, 8, 7, 6], [4, 7, 10, 13]),
+            ([2, 3, 4], 2, 4, 4),
+        ]
+
+
+def test_squads_print_like_their_constructor():
+    output = _run('say(squad(1, 2), squad(), range(2, 9, 3), squad(1, 2) * 1 / 2)')
+    assert [repr(value) for value in output[0]] == ["squad(1, 2)", "squad()", "squad(2, 5, 8)", "squad(0.5, 1.0)"]
+
+
+def test_sums_are_exact():
+    big = 'lit xs = squad(9223372036854775807, 9223372036854775807)\nsay(sum(xs), max(xs) + 1)'
+    assert _run(big) == [(2 * 9223372036854775807, 9223372036854775808)]
+
+
+def test_vectorized_sum_matches_scalar_loop():
+    vectorized = 'lit xs = range(100000)\nsay(sum(xs * 3 + 1))'
+    scalar = 'lit i = 0\nlit total = 0\nyap i < 100000 {\n total = total + i * 3 + 1\n i = i + 1\n}\nsay(total)'
+    assert _run(vectorized) == _run(scalar) == [(14999950000,)]
+
+
+def test_slices_are_views():
+    xs = Squad.range(0, 10, 1)
+    view = SQUAD_BUILTINS["slice"]([xs, 2, 5])
+    assert view.tolist() == [2, 3, 4]
+    assert view.data.obj is xs.data.obj
+
+
+@pytest.mark.parametrize("source, message", [
+    ('say(squad(1, 2) + squad(1, 2, 3))', "squads of lengths 2 and 3"),
+    ('if squad(1) > 0 {\n say(1)\n}', "no truth value"),
+    ('say(at(squad(1, 2), 2))', "out of range"),
+    ('say(min(squad()))', "empty squad"),
+    ('say(squad(1, "x"))', "holds numbers"),
+    ('say(sum(5))', "expects a squad"),
+    ('say(range(3) + 9223372036854775806)', "does not fit in 64 bits"),
+    ('say(squad(4611686018427387904) * 2)', "does not fit in 64 bits"),
+    ('say(squad(9223372036854775808))', "does not fit in 64 bits"),
+])
+def test_runtime_errors(source, message):
+    with pytest.raises(ZLangRuntimeError, match=message):
+        _run(source)
+
+
+def test_type_checking_knows_squads():
+    with pytest.raises(TypeCheckError, match="cannot apply '-' to squad and string"):
+        check_types(main.compile_source('lit xs = range(3)\nsay(xs - "a")'))
+    check_types(main.compile_source('lit xs = range(3)\nsay(xs - len(xs), xs == "a")'))
+
+
+def test_functions_using_squad_builtins_stay_pure():
+    program = main.compile_source('lit xs = range(5)\nvibe total() {\n lit t = sum(xs)\n}\nvibe show() {\n say(xs)\n}')
+    assert analyze_purity(program) == {"total"}
+    # an unhashable squad global just bypasses the memo
+    interp = main.BACKENDS["tree"](output_fn=lambda *args: None)
+    interp.enable_memoization()
+    interp.interpret(main.compile_source('lit xs = range(5)\nvibe total() {\n lit t = sum(xs)\n}\ntotal()\ntotal()'))
+
+
+SHADOWING_SUM = (
+    'lit x = 1\nvibe sum() {\n x = x + 1\n}\n'
+    'vibe main() {\n lit i = 0\n yap i < 3 {\n  sum()\n  say(x * 10 - 10)\n  i = i + 1\n }\n}'
+)
+
+
+@pytest.mark.parametrize("backend", sorted(main.BACKENDS))
+def test_user_functions_replace_squad_builtins(backend):
+    # a program from before squads, whose `sum` must not become the builtin
+    # (nor be taken for one that changes nothing inside the loop)
+    for optimize_ast in (True, False):
+        assert _run(SHADOWING_SUM, backend, optimize_ast) == [(10,), (20,), (30,)]
+    assert _run('vibe len() {\n say("mine")\n}\nlen()\nsay(sum(range(4)))', backend) == [("mine",), (6,)]
+
+
+@pytest.mark.parametrize("backend", sorted(main.BACKENDS))
+def test_squad_builtins_are_not_variables(backend):
+    # they can only be called: reading one is an undefined variable, and a
+    # variable of the same name leaves calls alone
+    with pytest.raises((ZLangRuntimeError, ResolveError), match="Undefined variable 'len'"):
+        _run('say(len)', backend)
+    assert _run('lit len = 3\nsay(len, len(range(len)))', backend) == [(3, 3)]
+
+
+def test_arena_user_functions_replace_squad_builtins():
+    output = []
+    arena = Parser(Tokenizer(SHADOWING_SUM).tokenize(), nodes=ArenaBuilder()).parse()
+    ArenaInterpreter(output_fn=lambda *args: output.append(args)).interpret(arena)
+    assert output == [(10,), (20,), (30,)]
@@ -0,0 +1,59 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser
+from compiler.semantics.analyzer import Interpreter
+from compiler.semantics.stack_interpreter import StackInterpreter
+
+DEPTH = 20000
+
+
+def _parse(source):
+    return Parser(Tokenizer(source).tokenize()).parse()
+
+
+def run(interpreter_cls, source):
+    output = []
+    interpreter_cls(output_fn=lambda *a: output.append(a)).interpret(_parse(source))
+    return output
+
+
+def test_deep_recursion_beyond_python_limit():
+    source = (
+        f'lit n = {DEPTH}\nlit unwound = 0\n'
+        'vibe down() {\n if n > 0 {\n  n = n - 1\n  down()\n  unwound = unwound + 1\n }\n}\n'
+        'down()\nsay(n, unwound)'
+    )
+    assert run(StackInterpreter, source) == [(0, DEPTH)]
+    try:
+        run(Interpreter, source)
+    except RecursionError:
+        pass
+    else:
+        raise AssertionError("expected the recursive Interpreter to hit the recursion limit")
+
+
+def test_deep_expression():
+    source = "lit x = 0\nx = 1\nsay(x" + " + x" * DEPTH + ")"
+    assert run(StackInterpreter, source) == [(DEPTH + 1,)]
+
+
+def test_tail_calls_do_not_grow_the_stack():
+    pending = []
+    interp = StackInterpreter(output_fn=lambda *a: None)
+
+    def probe(args):
+        pending.append(len(interp.work))
+
+    interp.globals.define("probe", probe)
+    interp.interpret(_parse(
+        f'lit n = {DEPTH}\nvibe countdown() {{\n probe()\n n = n - 1\n if n > 0: countdown()\n}}\ncountdown()'
+    ))
+    assert len(pending) == DEPTH
+    assert max(pending) == pending[1]
@@ -0,0 +1,58 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import Parser, StreamingParser, ParseError
+
+
+SOURCES = [
+    "lit x = 1 + 2 * 3\nsay(x)",
+    "vibe main() {\n lit counter = 0\n yap counter < 3 {\n counter = counter + 1\n }\n if counter == 3:\n say(\"done\")\n}",
+    "vibe main() {\n name = spill(\"Name?\")\n say(\"Hi \" + name)\n}",
+    "x",
+]
+
+
+def test_streaming_parser_builds_same_ast():
+    sources = list(SOURCES)
+    for name in ["hello.zl", "counter.zl"]:
+        with open(os.path.join(root_path, "examples", name), "r", encoding="utf-8") as f:
+            sources.append(f.read())
+    for source in sources:
+        expected = repr(Parser(Tokenizer(source).tokenize()).parse())
+        actual = repr(StreamingParser(Tokenizer(source).iter_tokens()).parse())
+        assert actual == expected
+
+
+def test_streaming_parser_holds_bounded_lookahead():
+    source = "vibe main() {\n" + "lit a = 1 + 2\n a = a * 3\n say(a)\n" * 200 + "}"
+    parser = StreamingParser(Tokenizer(source).iter_tokens())
+    largest = 0
+    original_fill = parser._fill
+
+    def tracking_fill(count):
+        nonlocal largest
+        result = original_fill(count)
+        largest = max(largest, len(parser._buffer))
+        return result
+
+    parser._fill = tracking_fill
+    parser.parse()
+    assert largest <= 2
+
+
+def test_streaming_parser_reports_same_errors():
+    source = "lit = 3"
+    for make in (lambda: Parser(Tokenizer(source).tokenize()),
+                 lambda: StreamingParser(Tokenizer(source).iter_tokens())):
+        try:
+            make().parse()
+        except ParseError as e:
+            assert "Expected variable name" in str(e)
+        else:
+            raise AssertionError("expected ParseError")
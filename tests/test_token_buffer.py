@@ -0,0 +1,53 @@
+import os
+import sys
+
+# Ensure repository root is on sys.path so `compiler` package can be imported
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from compiler.lexer.Token import Token
+from compiler.lexer.Tokenizer import Tokenizer
+from compiler.Parser.parser import BufferParser, Parser
+
+
+def _example(name):
+    with open(os.path.join(root_path, "examples", name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_buffer_views_match_tokens():
+    sources = [_example("hello.zl"), _example("counter.zl"), '"open', 'say("") café 12² x!=y']
+    for source in sources:
+        tokens = Tokenizer(source).tokenize()
+        buffer = Tokenizer(source).tokenize_buffer()
+        assert len(buffer) == len(tokens)
+        for view, token in zip(buffer, tokens):
+            assert isinstance(view, Token)
+            assert not hasattr(view, "__dict__") and not hasattr(token, "__dict__")
+            assert view.token_type == token.token_type
+            assert view.lexeme == token.lexeme
+            assert repr(view) == repr(token)
+        assert [repr(t) for t in buffer.to_tokens()] == [repr(t) for t in tokens]
+
+
+def test_buffer_offsets_point_into_source():
+    source = 'lit greeting = "hi"  // comment\nsay(greeting)'
+    buffer = Tokenizer(source).tokenize_buffer()
+    spans = [source[buffer.starts[i]:buffer.ends[i]] for i in range(len(buffer))]
+    assert spans == ["lit", "greeting", "=", '"hi"', "say", "(", "greeting", ")", ""]
+
+
+def test_identifier_lexemes_are_interned():
+    source = "lit counter = 0\ncounter = counter + 1"
+    buffer = Tokenizer(source).tokenize_buffer()
+    names = [buffer.lexeme(i) for i in range(len(buffer)) if buffer[i].lexeme == "counter"]
+    assert len(names) == 3
+    assert names[0] is names[1] is names[2]
+
+
+def test_buffer_parser_builds_same_ast():
+    for source in [_example("hello.zl"), _example("counter.zl"), "lit x = 1 + 2 * 3\nsay(x)"]:
+        expected = repr(Parser(Tokenizer(source).tokenize()).parse())
+        assert repr(BufferParser(Tokenizer(source).tokenize_buffer()).parse()) == expected
+        assert repr(Parser(Tokenizer(source).tokenize_buffer()).parse()) == expected
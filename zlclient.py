@@ -0,0 +1,144 @@
+"""
+Thin client for the warm ZLang daemon (see daemon.py).
+
+It imports nothing from the compiler: it sends a program's source to the
+daemon and relays `say` output to stdout and `spill` prompts to stdin, so
+`python zlclient.py SOCKET script.zl` behaves like `python main.py script.zl`
+without paying for the compiler's imports.
+
+Messages are JSON objects, one per line. The client opens with
+{"op": "run", "source", "path", "options"}, {"op": "stats"} or {"op": "stop"}.
+During a run the daemon sends {"op": "output", "text"} and
+{"op": "input", "prompt"}, which the client answers with
+{"op": "input", "line"} (null at end of input), and finishes with
+{"op": "exit", "status", "error"}.
+
+Usage:
+    python zlclient.py /tmp/zlang.sock program.zl [--backend slots] < input.txt
+    python zlclient.py /tmp/zlang.sock --stats
+    python zlclient.py /tmp/zlang.sock --stop
+"""
+
+import argparse
+import json
+import socket
+import sys
+
+
+def send_message(stream, message):
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def receive_message(stream):
+    """The next message on `stream`, or None once it is closed."""
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def _connect(socket_path):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(socket_path)
+    return client
+
+
+def run_remote(socket_path, source, path="<stdin>", options=None, stdin=None, stdout=None, stderr=None):
+    """Run `source` on the daemon, relaying its input and output; returns the exit status."""
+    stdin = stdin if stdin is not None else sys.stdin
+    stdout = stdout if stdout is not None else sys.stdout
+    stderr = stderr if stderr is not None else sys.stderr
+    with _connect(socket_path) as client, client.makefile("rwb") as stream:
+        send_message(stream, {"op": "run", "source": source, "path": path, "options": options or {}})
+        while True:
+            message = receive_message(stream)
+            if message is None:
+                print("daemon closed the connection", file=stderr)
+                return 1
+            op = message["op"]
+            if op == "output":
+                stdout.write(message["text"])
+            elif op == "input":
+                stdout.write(message["prompt"])
+                stdout.flush()
+                line = stdin.readline()
+                if line.endswith("\n"):
+                    line = line[:-1]
+                elif not line:
+                    line = None
+                send_message(stream, {"op": "input", "line": line})
+            elif op == "exit":
+                stdout.flush()
+                if message["error"]:
+                    print(f"{path}: {message['error']}", file=stderr)
+                return message["status"]
+
+
+def request(socket_path, op):
+    """Send a "stats" or "stop" request and return the daemon's reply."""
+    with _connect(socket_path) as client, client.makefile("rwb") as stream:
+        send_message(stream, {"op": op})
+        return receive_message(stream)
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="zlclient.py", description="Run a ZLang program on a warm daemon.")
+    parser.add_argument("socket", help="the daemon's Unix domain socket")
+    parser.add_argument("source_file", nargs="?", metavar="source", help="a .zl source file ('-' reads stdin)")
+    parser.add_argument("--stats", action="store_true", help="print the daemon's request and cache counters")
+    parser.add_argument("--stop", action="store_true", help="stop the daemon")
+    parser.add_argument("--no-optimize", dest="optimize", action="store_false",
+                        help="skip literal conversion, constant folding and propagation")
+    parser.add_argument("--backend", default="tree", help="execution engine, as for main.py (default tree)")
+    parser.add_argument("--memoize", type=int, default=0, metavar="SIZE",
+                        help="cache results of pure functions, as for main.py (default 0 = off)")
+    parser.add_argument("--no-typecheck", dest="typecheck", action="store_false",
+                        help="run without first reporting operations whose operand types can never work")
+    parser.add_argument("--output-buffer", type=int, default=None, metavar="CHARS",
+                        help="write `say` output in blocks of CHARS characters, as for main.py (0 = line by line)")
+    parser.add_argument("--max-steps", type=int, metavar="N",
+                        help="stop the program after N loop iterations and function calls")
+    parser.add_argument("--timeout", type=float, metavar="SECONDS",
+                        help="stop the program once it has run for SECONDS")
+    parser.add_argument("--max-value-size", type=int, metavar="SIZE",
+                        help="stop the program before it builds a string or integer larger than SIZE")
+    return parser
+
+
+def main(argv=None):
+    argv = argv if argv is not None else sys.argv[1:]
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if args.stats or args.stop:
+        print(json.dumps(request(args.socket, "stats" if args.stats else "stop")))
+        return 0
+    if args.source_file is None:
+        arg_parser.error("a source file is required")
+
+    if args.source_file == "-":
+        source = sys.stdin.read()
+    else:
+        with open(args.source_file, "r", encoding="utf-8") as f:
+            source = f.read()
+    options = {
+        "optimize": args.optimize,
+        "backend": args.backend,
+        "memoize": args.memoize,
+        "typecheck": args.typecheck,
+    }
+    if args.output_buffer is not None:
+        options["output_buffer"] = args.output_buffer
+    limits = {
+        name: value
+        for name, value in (("max_steps", args.max_steps), ("timeout", args.timeout),
+                            ("max_value_size", args.max_value_size))
+        if value is not None
+    }
+    if limits:
+        options["limits"] = limits
+    return run_remote(args.socket, source, args.source_file, options)
+
+
+if __name__ == "__main__":
+    sys.exit(main())